@@ -0,0 +1,61 @@
+"""Generate clients.id server-side with gen_random_uuid().
+
+DUAL MIGRATION — affects tenant schemas only (no public changes).
+Run via:
+  - alembic upgrade head (safe no-op for public schema)
+  - python -m app.tenancy.migration_runner (tenant schemas)
+
+gen_random_uuid() is built in from PostgreSQL 13, so no extension is
+needed.  The column stays String(36) so existing foreign keys are
+untouched.
+
+Revision ID: 0034
+Revises: 0033
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0034"
+down_revision = "0033"
+
+
+def _current_schema() -> str:
+    conn = op.get_bind()
+    return conn.execute(sa.text("SELECT current_schema()")).scalar()
+
+
+def _table_exists(table_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM information_schema.tables "
+            "  WHERE table_schema = :schema AND table_name = :tbl"
+            ")"
+        ),
+        {"schema": _current_schema(), "tbl": table_name},
+    )
+    return result.scalar()
+
+
+def upgrade():
+    # Skip if running against public schema (no clients table)
+    if not _table_exists("clients"):
+        return
+    op.alter_column(
+        "clients", "id",
+        existing_type=sa.String(36),
+        server_default=sa.text("gen_random_uuid()::text"),
+    )
+
+
+def downgrade():
+    if not _table_exists("clients"):
+        return
+    op.alter_column(
+        "clients", "id",
+        existing_type=sa.String(36),
+        server_default=None,
+    )
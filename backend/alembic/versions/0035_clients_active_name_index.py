@@ -0,0 +1,68 @@
+"""Add (is_active, name) index on clients for keyset-paginated listing.
+
+DUAL MIGRATION — affects tenant schemas only (no public changes).
+Run via:
+  - alembic upgrade head (safe no-op for public schema)
+  - python -m app.tenancy.migration_runner (tenant schemas)
+
+list_clients filters on is_active and pages by name (WHERE name > :after
+ORDER BY name LIMIT n), which this index serves as a range scan.
+
+Revision ID: 0035
+Revises: 0034
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0035"
+down_revision = "0034"
+
+_INDEX = "ix_clients_active_name"
+
+
+def _current_schema() -> str:
+    conn = op.get_bind()
+    return conn.execute(sa.text("SELECT current_schema()")).scalar()
+
+
+def _table_exists(table_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM information_schema.tables "
+            "  WHERE table_schema = :schema AND table_name = :tbl"
+            ")"
+        ),
+        {"schema": _current_schema(), "tbl": table_name},
+    )
+    return result.scalar()
+
+
+def _index_exists(index_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM pg_indexes "
+            "  WHERE schemaname = :schema AND indexname = :name"
+            ")"
+        ),
+        {"schema": _current_schema(), "name": index_name},
+    )
+    return result.scalar()
+
+
+def upgrade():
+    # Skip if running against public schema (no clients table)
+    if not _table_exists("clients"):
+        return
+    if not _index_exists(_INDEX):
+        op.create_index(_INDEX, "clients", ["is_active", "name"])
+
+
+def downgrade():
+    if _table_exists("clients") and _index_exists(_INDEX):
+        op.drop_index(_INDEX, "clients")
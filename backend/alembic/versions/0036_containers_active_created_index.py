@@ -0,0 +1,75 @@
+"""Add partial created_at index on live containers for listing and counting.
+
+DUAL MIGRATION — affects tenant schemas only (no public changes).
+Run via:
+  - alembic upgrade head (safe no-op for public schema)
+  - python -m app.tenancy.migration_runner (tenant schemas)
+
+list_containers filters is_deleted = false and pages by created_at DESC;
+its total is count(containers.id) over the same filter.  A partial index
+on created_at covers only live rows, so the default page is read in index
+order and the unfiltered total is an index-only scan.
+
+Revision ID: 0036
+Revises: 0035
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0036"
+down_revision = "0035"
+
+_INDEX = "ix_containers_active_created_at"
+
+
+def _current_schema() -> str:
+    conn = op.get_bind()
+    return conn.execute(sa.text("SELECT current_schema()")).scalar()
+
+
+def _table_exists(table_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM information_schema.tables "
+            "  WHERE table_schema = :schema AND table_name = :tbl"
+            ")"
+        ),
+        {"schema": _current_schema(), "tbl": table_name},
+    )
+    return result.scalar()
+
+
+def _index_exists(index_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM pg_indexes "
+            "  WHERE schemaname = :schema AND indexname = :name"
+            ")"
+        ),
+        {"schema": _current_schema(), "name": index_name},
+    )
+    return result.scalar()
+
+
+def upgrade():
+    # Skip if running against public schema (no containers table)
+    if not _table_exists("containers"):
+        return
+    if not _index_exists(_INDEX):
+        op.create_index(
+            _INDEX,
+            "containers",
+            ["created_at"],
+            postgresql_where=sa.text("is_deleted = false"),
+        )
+
+
+def downgrade():
+    if _table_exists("containers") and _index_exists(_INDEX):
+        op.drop_index(_INDEX, "containers")
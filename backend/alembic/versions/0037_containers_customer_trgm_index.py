@@ -0,0 +1,79 @@
+"""Add a pg_trgm GIN index on containers.customer_name.
+
+DUAL MIGRATION — installs pg_trgm once (public pass), then indexes each
+tenant schema.
+Run via:
+  - alembic upgrade head (installs the extension; no-op for tables)
+  - python -m app.tenancy.migration_runner (tenant schemas)
+
+list_containers filters customer_name ILIKE '%q%'.  A leading wildcard
+can't use a B-tree, but a trigram GIN index serves ILIKE directly, so the
+filter stops scanning every container.  Tenant search_path excludes
+public, so the operator class is schema-qualified.
+
+Revision ID: 0037
+Revises: 0036
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0037"
+down_revision = "0036"
+
+_INDEX = "ix_containers_customer_trgm"
+
+
+def _current_schema() -> str:
+    conn = op.get_bind()
+    return conn.execute(sa.text("SELECT current_schema()")).scalar()
+
+
+def _table_exists(table_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM information_schema.tables "
+            "  WHERE table_schema = :schema AND table_name = :tbl"
+            ")"
+        ),
+        {"schema": _current_schema(), "tbl": table_name},
+    )
+    return result.scalar()
+
+
+def _index_exists(index_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM pg_indexes "
+            "  WHERE schemaname = :schema AND indexname = :name"
+            ")"
+        ),
+        {"schema": _current_schema(), "name": index_name},
+    )
+    return result.scalar()
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public")
+    # Skip if running against public schema (no containers table)
+    if not _table_exists("containers"):
+        return
+    if not _index_exists(_INDEX):
+        op.create_index(
+            _INDEX,
+            "containers",
+            ["customer_name"],
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "public.gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    # pg_trgm stays installed — other schemas' indexes may still use it
+    if _table_exists("containers") and _index_exists(_INDEX):
+        op.drop_index(_INDEX, "containers")
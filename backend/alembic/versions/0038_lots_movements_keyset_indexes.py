@@ -0,0 +1,73 @@
+"""Add (created_at, id) / (recorded_at, id) indexes for keyset paging.
+
+DUAL MIGRATION — affects tenant schemas only (no public changes).
+Run via:
+  - alembic upgrade head (safe no-op for public schema)
+  - python -m app.tenancy.migration_runner (tenant schemas)
+
+list_lots and list_movements page newest first with a (timestamp, id)
+cursor.  A composite index in that order lets each page seek straight to
+the cursor and read `limit` rows backwards, instead of scanning and
+discarding OFFSET rows.
+
+Revision ID: 0038
+Revises: 0037
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0038"
+down_revision = "0037"
+
+_INDEXES = (
+    ("ix_lots_created_at_id", "lots", ["created_at", "id"]),
+    ("ix_packaging_movements_recorded_at_id", "packaging_movements", ["recorded_at", "id"]),
+)
+
+
+def _current_schema() -> str:
+    conn = op.get_bind()
+    return conn.execute(sa.text("SELECT current_schema()")).scalar()
+
+
+def _table_exists(table_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM information_schema.tables "
+            "  WHERE table_schema = :schema AND table_name = :tbl"
+            ")"
+        ),
+        {"schema": _current_schema(), "tbl": table_name},
+    )
+    return result.scalar()
+
+
+def _index_exists(index_name: str) -> bool:
+    conn = op.get_bind()
+    result = conn.execute(
+        sa.text(
+            "SELECT EXISTS ("
+            "  SELECT 1 FROM pg_indexes "
+            "  WHERE schemaname = :schema AND indexname = :name"
+            ")"
+        ),
+        {"schema": _current_schema(), "name": index_name},
+    )
+    return result.scalar()
+
+
+def upgrade():
+    # Skip tables that don't exist (public schema)
+    for name, table, columns in _INDEXES:
+        if _table_exists(table) and not _index_exists(name):
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _columns in _INDEXES:
+        if _table_exists(table) and _index_exists(name):
+            op.drop_index(name, table)
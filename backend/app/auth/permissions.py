@@ -17,6 +17,8 @@ Permission naming: `<resource>.<action>`
 
 from __future__ import annotations
 
+import functools
+
 
 # ── All known permissions ───────────────────────────────────
 
@@ -144,22 +146,37 @@ def resolve_permissions(
        Otherwise, start with the built-in role's defaults.
     2. Apply custom_overrides: {perm: True} adds, {perm: False} removes.
     3. Return a sorted list (for stable JWT claims).
+
+    The result depends only on the arguments and the static tables above,
+    so it is memoized on a hashable form of them; callers get a fresh list.
     """
+    return list(_resolve_permissions(
+        role,
+        frozenset(custom_role_permissions) if custom_role_permissions is not None else None,
+        frozenset(custom_overrides.items()) if custom_overrides else frozenset(),
+    ))
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_permissions(
+    role: str,
+    custom_role_permissions: frozenset[str] | None,
+    custom_overrides: frozenset[tuple[str, bool]],
+) -> tuple[str, ...]:
     if custom_role_permissions is not None:
         base = {p for p in custom_role_permissions if p in ALL_PERMISSIONS}
     else:
         base = ROLE_DEFAULTS.get(role, set()).copy()
 
-    if custom_overrides:
-        for perm, granted in custom_overrides.items():
-            if perm not in ALL_PERMISSIONS:
-                continue  # ignore unknown permissions
-            if granted:
-                base.add(perm)
-            else:
-                base.discard(perm)
+    for perm, granted in custom_overrides:
+        if perm not in ALL_PERMISSIONS:
+            continue  # ignore unknown permissions
+        if granted:
+            base.add(perm)
+        else:
+            base.discard(perm)
 
-    return sorted(base)
+    return tuple(sorted(base))
 
 
 def has_permission(user_permissions: list[str] | set[str], required: str) -> bool:
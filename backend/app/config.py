@@ -31,6 +31,8 @@ class Settings(BaseSettings):
     # Database pool (tunable per deployment — see Tier 5 plan)
     pool_size: int = 50
     max_overflow: int = 30
+    # Prepared statements kept per pooled asyncpg connection (driver default 100)
+    statement_cache_size: int = 500
 
     # S3 document storage (optional — leave empty to use local fallback)
     aws_s3_bucket: str = ""
@@ -46,6 +48,12 @@ class Settings(BaseSettings):
     # Observability (optional — leave empty to disable)
     sentry_dsn: str = ""
 
+    # Bulk import: parse uploaded CSVs with pyarrow's C++ reader (ARROW_CSV=1).
+    # Requires `pip install pyarrow`; falls back to the stdlib csv module.
+    arrow_csv: bool = False
+    # Largest accepted CSV upload (keep in line with nginx client_max_body_size)
+    bulk_import_max_bytes: int = 50 * 1024 * 1024
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
@@ -30,6 +30,9 @@ engine = create_async_engine(
     pool_size=settings.pool_size,
     max_overflow=settings.max_overflow,
     pool_pre_ping=True,
+    # Hot GETs run a small set of prebuilt statements; keep their server-side
+    # prepared forms on each connection so Postgres skips parse/plan.
+    connect_args={"prepared_statement_cache_size": settings.statement_cache_size},
 )
 
 
@@ -93,6 +96,7 @@ async def get_tenant_db() -> AsyncSession:
     tenant scope but no valid tenant was resolved from the JWT).
     """
     from app.tenancy import get_current_tenant_schema  # deferred to avoid circular
+    from app.utils.cache import discard_pending_invalidations, run_pending_invalidations
 
     schema = get_current_tenant_schema()  # raises if missing
 
@@ -105,7 +109,12 @@ async def get_tenant_db() -> AsyncSession:
             await session.commit()
         except Exception:
             await session.rollback()
+            discard_pending_invalidations(session)
             raise
+        else:
+            # Cache entries queued with invalidate_cache_on_commit are only
+            # dropped once the rows they cached are committed
+            await run_pending_invalidations(session)
         finally:
             # Reset to public so the pooled connection doesn't leak tenant scope
             await session.execute(text("SET search_path TO public"))
@@ -1,9 +1,8 @@
 """Client — a customer/buyer that containers are allocated to."""
 
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import TenantBase
@@ -11,9 +10,13 @@ from app.database import TenantBase
 
 class Client(TenantBase):
     __tablename__ = "clients"
+    __table_args__ = (
+        Index("ix_clients_active_name", "is_active", "name"),
+    )
 
+    # Generated by PostgreSQL; flush fetches it back via RETURNING
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, server_default=text("gen_random_uuid()::text")
     )
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     contact_person: Mapped[str | None] = mapped_column(String(255))
@@ -10,7 +10,8 @@ import uuid
 from datetime import date, datetime
 
 from sqlalchemy import (
-    Boolean, Date, DateTime, Float, ForeignKey, Integer, JSON, String, Text,
+    DDL, Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text,
+    event, text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +20,18 @@ from app.database import TenantBase
 
 class Container(TenantBase):
     __tablename__ = "containers"
+    __table_args__ = (
+        Index(
+            "ix_containers_active_created_at", "created_at",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Trigram GIN index so customer_name ILIKE '%q%' can use an index
+        Index(
+            "ix_containers_customer_trgm", "customer_name",
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "public.gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=lambda: str(uuid.uuid4())
@@ -107,3 +120,12 @@ class Container(TenantBase):
     shipping_line = relationship("ShippingLine", lazy="selectin")
     export = relationship("Export", back_populates="containers", lazy="selectin")
     pallets = relationship("Pallet", back_populates="container", lazy="selectin")
+
+
+# gin_trgm_ops comes from pg_trgm; install it whenever the table is created
+# (new tenant schemas, test setup) so the index above can be built.
+event.listen(
+    Container.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public"),
+)
@@ -8,23 +8,27 @@ Lots are then palletized into Pallets.
 Lifecycle:  created → palletizing → stored → allocated → exported
 """
 
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
-    Boolean, DateTime, Date, Float, ForeignKey,
+    Boolean, DateTime, Date, Float, ForeignKey, Index,
     Integer, JSON, String, Text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import TenantBase
+from app.utils.ids import uuid7
 
 
 class Lot(TenantBase):
     __tablename__ = "lots"
+    __table_args__ = (
+        # Keyset paging for list_lots: ORDER BY created_at DESC, id DESC
+        Index("ix_lots_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=uuid7  # time-ordered: see app.utils.ids
     )
     lot_code: Mapped[str] = mapped_column(
         String(50), unique=True, nullable=False, index=True
@@ -11,10 +11,11 @@ manual adjustments.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import TenantBase
+from app.utils.ids import uuid7
 
 
 class PackagingStock(TenantBase):
@@ -62,9 +63,13 @@ class PackagingStock(TenantBase):
 class PackagingMovement(TenantBase):
     """Audit ledger for packaging stock changes."""
     __tablename__ = "packaging_movements"
+    __table_args__ = (
+        # Keyset paging for list_movements: ORDER BY recorded_at DESC, id DESC
+        Index("ix_packaging_movements_recorded_at_id", "recorded_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        String(36), primary_key=True, default=uuid7  # time-ordered: see app.utils.ids
     )
 
     stock_id: Mapped[str] = mapped_column(
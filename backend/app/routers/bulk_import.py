@@ -7,13 +7,36 @@ Endpoints:
     POST /api/bulk-import/harvest-teams/upload     Upload harvest team CSV
     GET  /api/bulk-import/clients/template         Download client CSV template
     POST /api/bulk-import/clients/upload           Upload client CSV
+    GET  /api/bulk-import/shipping-schedules/template  Download shipping schedule CSV template
+    POST /api/bulk-import/shipping-schedules/upload    Upload shipping schedule CSV
+    POST /api/bulk-import/all                      Upload grower/client/harvest team CSVs together
 """
 
-from fastapi import APIRouter, Depends, File, UploadFile
-from fastapi.responses import StreamingResponse
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import (
+    JSON,
+    and_,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
 from app.auth.deps import require_onboarded, require_permission
 from app.database import get_tenant_db
@@ -24,22 +47,31 @@ from app.models.tenant.harvest_team import HarvestTeam
 from app.models.tenant.shipping_schedule import ShippingSchedule
 from app.models.tenant.supplier import Supplier
 from app.utils.activity import log_activity
-from app.utils.cache import invalidate_cache
+from app.utils.cache import (
+    GROWER_IDMAP_CACHE_KEY,
+    cache_get_or_set,
+    invalidate_cache_on_commit,
+    invalidate_grower_idmap,
+)
 from app.utils.csv_import import (
     FieldDef,
+    ParseResult,
     coerce_bool,
+    coerce_date,
     coerce_float,
     coerce_int,
     coerce_json_list,
-    generate_template_csv,
-    generate_template_csv_multi,
-    parse_csv,
+    iter_template_csv,
+    parse_csv_file,
+    parse_csv_stream,
 )
 
 router = APIRouter()
 
 
 # ── Response schema ─────────────────────────────────────────
+# Documents the upload responses; handlers build the payload as plain
+# dicts and return ORJSONResponse, skipping per-error model validation.
 
 
 class RowErrorOut(BaseModel):
@@ -159,10 +191,10 @@ SHIPPING_SCHEDULE_FIELDS = [
     FieldDef(column="voyage_number", db_field="voyage_number", required=True),
     FieldDef(column="port_of_loading", db_field="port_of_loading", required=True),
     FieldDef(column="port_of_discharge", db_field="port_of_discharge", required=True),
-    FieldDef(column="etd", db_field="etd", required=True),
-    FieldDef(column="eta", db_field="eta", required=True),
-    FieldDef(column="booking_cutoff", db_field="booking_cutoff"),
-    FieldDef(column="cargo_cutoff", db_field="cargo_cutoff"),
+    FieldDef(column="etd", db_field="etd", required=True, coerce=coerce_date),
+    FieldDef(column="eta", db_field="eta", required=True, coerce=coerce_date),
+    FieldDef(column="booking_cutoff", db_field="booking_cutoff", coerce=coerce_date),
+    FieldDef(column="cargo_cutoff", db_field="cargo_cutoff", coerce=coerce_date),
     FieldDef(column="status", db_field="status"),
     FieldDef(column="notes", db_field="notes"),
 ]
@@ -185,14 +217,227 @@ SHIPPING_SCHEDULE_SAMPLE = {
 # ── Helpers ─────────────────────────────────────────────────
 
 
-def _csv_response(csv_text: str, filename: str) -> StreamingResponse:
-    return StreamingResponse(
-        iter([csv_text]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+def _build_template(
+    field_defs: list[FieldDef], sample_rows: list[dict[str, str]],
+) -> tuple[bytes, str]:
+    """Render a CSV template once. Returns (content, etag)."""
+    content = b"".join(iter_template_csv(field_defs, sample_rows))
+    return content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+# Templates are static, so they're rendered at import rather than per GET
+_GROWER_TEMPLATE = _build_template(GROWER_FIELDS, [GROWER_SAMPLE_ROW1, GROWER_SAMPLE_ROW2])
+_HARVEST_TEAM_TEMPLATE = _build_template(HARVEST_TEAM_FIELDS, [HARVEST_TEAM_SAMPLE])
+_CLIENT_TEMPLATE = _build_template(CLIENT_FIELDS, [CLIENT_SAMPLE])
+_SHIPPING_SCHEDULE_TEMPLATE = _build_template(SHIPPING_SCHEDULE_FIELDS, [SHIPPING_SCHEDULE_SAMPLE])
+
+
+def _template_response(
+    request: Request, template: tuple[bytes, str], filename: str,
+) -> Response:
+    """Serve a prebuilt template, answering 304 when the client's copy is current."""
+    content, etag = template
+    headers = {
+        # private: the endpoints sit behind auth, so shared caches stay out
+        "Cache-Control": "private, max-age=86400",
+        "ETag": etag,
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return Response(content, media_type="text/csv; charset=utf-8", headers=headers)
+
+
+async def _import_csv(
+    db: AsyncSession,
+    file: UploadFile,
+    field_defs: list[FieldDef],
+    upsert: Callable[[AsyncSession, list[dict]], Awaitable[tuple[int, int]]],
+    resolvers: dict[str, dict[str, str]] | None = None,
+) -> dict:
+    """Stream an upload through the parser, upserting each row batch as parsed.
+
+    Keeps memory bounded by the parser batch size instead of the file size.
+    Returns a BulkImportResult-shaped dict.
+    """
+    total_rows = 0
+    created = 0
+    updated = 0
+    errors: list[dict] = []
+
+    async for batch in parse_csv_stream(file, field_defs, resolvers):
+        total_rows += batch.total_rows
+        if batch.rows:
+            batch_created, batch_updated = await upsert(db, batch.rows)
+            created += batch_created
+            updated += batch_updated
+        errors.extend({"row": e.row, "errors": e.errors} for e in batch.errors)
+
+    return {
+        "total_rows": total_rows,
+        "created": created,
+        "updated": updated,
+        "failed": len(errors),
+        "errors": errors,
+    }
+
+
+def _csv_columns_only(model_class, rows: list[dict]) -> tuple:
+    """Loader options limiting a lookup SELECT to the columns the CSV sets.
+
+    raiseload("*") also suppresses relationship loads (including
+    lazy="selectin" ones) that the upsert never reads.
+    """
+    columns = [getattr(model_class, key) for key in rows[0] if key != "id"]
+    return load_only(model_class.id, *columns), raiseload("*")
+
+
+def _diff_changes(record, row_data: dict, pending: dict | None) -> dict:
+    """Return the non-empty CSV values that differ from what ``record`` holds.
+
+    ``pending`` holds updates already queued for the record earlier in the
+    upload (bulk UPDATE doesn't refresh the ORM instance), and takes
+    precedence over the loaded attribute values.
+    """
+    pending = pending or {}
+    return {
+        k: v for k, v in row_data.items()
+        if k != "id" and v is not None and pending.get(k, getattr(record, k)) != v
+    }
+
+
+def _merge_pending_insert(pending: dict, row_data: dict) -> bool:
+    """Fold a repeated CSV row into a not-yet-inserted one, like _diff_changes.
+
+    Returns True if any column changed.
+    """
+    changes = {
+        k: v for k, v in row_data.items()
+        if k != "id" and v is not None and pending.get(k) != v
+    }
+    pending.update(changes)
+    return bool(changes)
+
+
+# Pure-insert batches at least this large are written with asyncpg's
+# binary COPY instead of an executemany INSERT
+_COPY_THRESHOLD = 500
+
+
+def _copy_records(model_class, rows: list[dict]) -> tuple[list[str], list[tuple]]:
+    """Build (columns, records) for COPY from parsed row dicts.
+
+    COPY bypasses SQLAlchemy, so Python-side column defaults (uuid ids,
+    created_at, ``default=list``) are applied here for keys the rows don't
+    carry, and JSON columns are encoded to text.
+    """
+    present = set().union(*rows)
+    columns = [
+        c for c in model_class.__table__.columns
+        if c.key in present
+        or (c.default is not None and (c.default.is_scalar or c.default.is_callable))
+    ]
+    records = []
+    for row in rows:
+        record = []
+        for c in columns:
+            if c.key in row:
+                value = row[c.key]
+            elif c.default is None:
+                value = None
+            else:
+                value = c.default.arg(None) if c.default.is_callable else c.default.arg
+            if value is not None and isinstance(c.type, JSON):
+                value = json.dumps(value)
+            record.append(value)
+        records.append(tuple(record))
+    return [c.name for c in columns], records
+
+
+async def _insert_rows(db: AsyncSession, model_class, rows: list[dict]) -> None:
+    """Insert new rows: COPY for large batches on asyncpg, else executemany."""
+    if not rows:
+        return
+    conn = await db.connection()
+    if len(rows) < _COPY_THRESHOLD or conn.dialect.driver != "asyncpg":
+        await db.execute(insert(model_class), rows)
+        return
+
+    columns, records = _copy_records(model_class, rows)
+    raw = await conn.get_raw_connection()
+    # Same connection/transaction as the session; the unqualified table
+    # name resolves through the tenant search_path.
+    await raw.driver_connection.copy_records_to_table(
+        model_class.__tablename__, records=records, columns=columns,
     )
 
 
+# Rows (or grower groups) classified and written per round of
+# SELECT + bulk INSERT + bulk UPDATE
+_UPSERT_CHUNK_SIZE = 10_000
+
+# Rows per INSERT ... ON CONFLICT statement (keeps bind params well under
+# the asyncpg 32767 limit for wide tables)
+_UPSERT_BATCH_SIZE = 1000
+
+
+async def _upsert_on_conflict(
+    db: AsyncSession,
+    model_class,
+    rows: list[dict],
+    name_field: str,
+) -> tuple[int, int]:
+    """Upsert via INSERT ... ON CONFLICT (name) DO UPDATE — no prior SELECT.
+
+    Only usable when ``name_field`` carries a unique constraint.  Empty CSV
+    cells keep the stored value (``COALESCE(excluded.col, col)``), matching
+    the ORM path.  ``xmax = 0`` in RETURNING marks freshly inserted rows.
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement, so
+    # collapse repeated names first (later non-empty values win).
+    merged: dict[str, dict] = {}
+    for row_data in rows:
+        name = row_data.get(name_field)
+        if not name:
+            continue
+        if name in merged:
+            merged[name].update(
+                {k: v for k, v in row_data.items() if k != "id" and v is not None}
+            )
+        else:
+            merged[name] = dict(row_data)
+
+    if not merged:
+        return 0, 0
+
+    table = model_class.__table__
+    values = list(merged.values())
+    update_cols = [k for k in values[0] if k not in ("id", name_field)]
+
+    created = 0
+    updated = 0
+    for start in range(0, len(values), _UPSERT_BATCH_SIZE):
+        stmt = pg_insert(model_class).values(values[start:start + _UPSERT_BATCH_SIZE])
+        set_ = {k: func.coalesce(stmt.excluded[k], table.c[k]) for k in update_cols}
+        if "updated_at" in table.c:
+            set_["updated_at"] = datetime.now(UTC).replace(tzinfo=None)
+        # Leave rows whose non-empty CSV values all match untouched — they
+        # are neither rewritten nor returned, so they don't count as updated.
+        changed = or_(*(
+            and_(stmt.excluded[k].is_not(None), table.c[k].is_distinct_from(stmt.excluded[k]))
+            for k in update_cols
+        )) if update_cols else None
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[name_field], set_=set_, where=changed,
+        ).returning(literal_column("xmax = 0"))
+        result = await db.execute(stmt)
+        inserted = result.scalars().all()
+        created += sum(1 for flag in inserted if flag)
+        updated += sum(1 for flag in inserted if not flag)
+
+    return created, updated
+
+
 async def _upsert_by_name(
     db: AsyncSession,
     model_class,
@@ -200,11 +445,52 @@ async def _upsert_by_name(
     name_field: str = "name",
 ) -> tuple[int, int]:
     """Upsert parsed rows by name. Returns (created_count, updated_count)."""
-    result = await db.execute(select(model_class))
+    if not rows:
+        return 0, 0
+    if model_class.__table__.c[name_field].unique:
+        return await _upsert_on_conflict(db, model_class, rows, name_field)
+
+    created = 0
+    updated = 0
+    for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+        chunk_created, chunk_updated = await _upsert_by_name_chunk(
+            db, model_class, rows[start:start + _UPSERT_CHUNK_SIZE], name_field,
+        )
+        created += chunk_created
+        updated += chunk_updated
+    return created, updated
+
+
+async def _upsert_by_name_chunk(
+    db: AsyncSession,
+    model_class,
+    rows: list[dict],
+    name_field: str,
+) -> tuple[int, int]:
+    """Upsert one chunk of rows by name via a SELECT of matching names.
+
+    Names repeated in a later chunk are found by that chunk's SELECT, since
+    everything runs in the request transaction.
+    """
+    # populate_existing: bulk UPDATEs from earlier batches don't refresh
+    # identity-mapped instances, and _diff_changes compares against them
+    name_col = getattr(model_class, name_field)
+    incoming_names = {row[name_field] for row in rows if row.get(name_field)}
+    result = await db.execute(
+        select(model_class)
+        .where(name_col.in_(incoming_names))
+        .options(*_csv_columns_only(model_class, rows))
+        .execution_options(populate_existing=True)
+    )
     existing = {getattr(r, name_field): r for r in result.scalars().all()}
 
     created = 0
     updated = 0
+    # id -> changed columns, applied below as one executemany UPDATE
+    # instead of dirtying each ORM instance (one UPDATE per row at flush).
+    update_mappings: dict[str, dict] = {}
+    # name -> new row, inserted below as one executemany INSERT
+    to_insert: dict[str, dict] = {}
 
     for row_data in rows:
         name = row_data.get(name_field)
@@ -213,17 +499,24 @@ async def _upsert_by_name(
 
         if name in existing:
             record = existing[name]
-            for key, value in row_data.items():
-                if key != "id" and value is not None:
-                    setattr(record, key, value)
-            updated += 1
+            changes = _diff_changes(record, row_data, update_mappings.get(record.id))
+            if changes:
+                update_mappings.setdefault(record.id, {"id": record.id}).update(changes)
+                updated += 1
+        elif name in to_insert:
+            if _merge_pending_insert(to_insert[name], row_data):
+                updated += 1
         else:
-            record = model_class(**row_data)
-            db.add(record)
-            existing[name] = record
+            to_insert[name] = row_data
             created += 1
 
-    await db.flush()
+    await _insert_rows(db, model_class, list(to_insert.values()))
+    if update_mappings:
+        await db.execute(update(model_class), list(update_mappings.values()))
+    # Release the chunk's loaded rows so the identity map doesn't grow
+    # with the upload
+    for record in existing.values():
+        db.expunge(record)
     return created, updated
 
 
@@ -231,104 +524,179 @@ async def _upsert_by_name(
 
 
 # Grower-level columns (everything except field_* columns)
-_GROWER_LEVEL_KEYS = {
+_GROWER_LEVEL_KEYS = frozenset({
     "name", "grower_code", "contact_person", "phone", "email",
     "region", "total_hectares", "estimated_volume_tons",
     "globalg_ap_certified", "globalg_ap_number", "notes",
-}
+})
+
+
+# Server-side field merge for existing growers.  Each incoming field is
+# dropped if a stored field has the same code, or is codeless with the
+# same name (the "code, else name::<name>" identity used for fields);
+# survivors are appended and total_hectares is re-summed over the result.
+# `fields` is a JSON column, so the work goes via jsonb.
+_MERGE_GROWER_FIELDS = text("""
+WITH incoming AS (
+    SELECT i.id, nf.value AS field, nf.ord
+    FROM jsonb_to_recordset(CAST(:payload AS jsonb)) AS i(id text, fields jsonb)
+    CROSS JOIN LATERAL jsonb_array_elements(i.fields) WITH ORDINALITY AS nf(value, ord)
+),
+added AS (
+    SELECT inc.id, jsonb_agg(inc.field ORDER BY inc.ord) AS fields
+    FROM incoming inc
+    JOIN growers g ON g.id = inc.id
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM jsonb_array_elements(COALESCE(g.fields::jsonb, '[]'::jsonb)) AS ef(value)
+        WHERE (inc.field->>'code' IS NOT NULL AND ef.value->>'code' = inc.field->>'code')
+           OR (COALESCE(ef.value->>'code', '') = '' AND ef.value->>'name' = inc.field->>'name')
+    )
+    GROUP BY inc.id
+)
+UPDATE growers AS g
+SET fields = (COALESCE(g.fields::jsonb, '[]'::jsonb) || a.fields)::json,
+    total_hectares = COALESCE((
+        SELECT CASE WHEN SUM((f.value->>'hectares')::numeric) > 0
+                    THEN ROUND(SUM((f.value->>'hectares')::numeric), 2)::float8 END
+        FROM jsonb_array_elements(COALESCE(g.fields::jsonb, '[]'::jsonb) || a.fields) AS f(value)
+    ), g.total_hectares)
+FROM added a
+WHERE g.id = a.id
+RETURNING g.id
+""")
+
+
+def _dedup_new_fields(new_fields: list[dict]) -> list[dict]:
+    """Drop repeats within one grower's incoming fields (code, else name)."""
+    seen: set[str] = set()
+    unique = []
+    for nf in new_fields:
+        name_key = f"name::{nf['name']}"
+        key = nf["code"] or name_key
+        if key in seen or (nf["code"] and name_key in seen):
+            continue
+        seen.add(key)
+        unique.append(nf)
+    return unique
+
+
+def _group_grower_rows(
+    rows: list[dict],
+) -> dict[tuple[str, str], tuple[dict, list[dict]]]:
+    """Group rows by grower identity and collect each group's field entries.
+
+    Pure CPU work — run via ``asyncio.to_thread`` so large uploads don't
+    block the event loop.  Returns {(name_lower, ggn_lower): (first_row, fields)}.
+    """
+    # Group rows by grower identity: (name_lower, globalg_ap_number or "").
+    # Cells arrive stripped from the CSV parser, so grouping and field
+    # extraction happen in a single pass over the rows.
+    grouped: dict[tuple[str, str], tuple[dict, list[dict]]] = {}
+    for row in rows:
+        name = row.get("name")
+        if not name:
+            continue
+        key = (name.lower(), (row.get("globalg_ap_number") or "").lower())
+        group = grouped.get(key)
+        if group is None:
+            group = grouped[key] = (row, [])
+
+        field_name = row.get("field_name")
+        field_code = row.get("field_code")
+        # Accept a field if either name or code is provided
+        if field_name or field_code:
+            group[1].append({
+                "name": field_name or field_code,  # use code as name if name is empty
+                "code": field_code or None,
+                "hectares": row.get("field_hectares"),
+                "fruit_type": row.get("field_fruit_type") or None,
+            })
+    return grouped
+
+
+async def _grower_identity_map(db: AsyncSession) -> dict[tuple[str, str], str]:
+    """{(name_lower, ggn_lower): id} for every grower, cached briefly.
+
+    Call before the upload writes anything: a cache miss is filled from
+    this transaction, which at that point only sees committed growers.
+    Uploads keep the returned dict current themselves (_upsert_growers
+    adds the ids it creates) instead of re-reading the cache, and queue
+    the invalidation for after the commit.
+    """
+    async def _load_identity_map() -> list[list[str]]:
+        result = await db.execute(
+            select(Grower.id, Grower.name, Grower.globalg_ap_number)
+        )
+        return [
+            [(name or "").lower(), (ggn or "").lower(), grower_id]
+            for grower_id, name, ggn in result.all()
+        ]
+
+    identity = await cache_get_or_set(GROWER_IDMAP_CACHE_KEY, _load_identity_map, ttl=60)
+    return {(name, ggn): grower_id for name, ggn, grower_id in identity}
 
 
 async def _upsert_growers(
     db: AsyncSession,
     rows: list[dict],
+    id_by_key: dict[tuple[str, str], str],
 ) -> tuple[int, int]:
     """Import growers with field merging and no-overwrite on existing growers.
 
     - Groups CSV rows by (name, globalg_ap_number) to identify the same grower.
     - Collects field entries from all rows in a group.
-    - Existing growers: only merges new fields (no overwrite of grower data).
+    - Existing growers: only merges new fields (no overwrite of grower data),
+      deduplicated against the stored fields in SQL (_MERGE_GROWER_FIELDS).
     - New growers: creates with all data + fields.
-    """
-    from collections import defaultdict
-
-    # Group rows by grower identity: (name_lower, globalg_ap_number or "")
-    groups: dict[tuple[str, str], list[dict]] = defaultdict(list)
-    for row in rows:
-        name = (row.get("name") or "").strip()
-        if not name:
-            continue
-        ggn = (row.get("globalg_ap_number") or "").strip()
-        groups[(name.lower(), ggn.lower())].append(row)
 
-    # Load existing growers
-    result = await db.execute(select(Grower))
-    existing: dict[tuple[str, str], Grower] = {}
-    for g in result.scalars().all():
-        key = ((g.name or "").lower(), (g.globalg_ap_number or "").lower())
-        existing[key] = g
+    Called once per parser batch with the upload's ``id_by_key`` (see
+    _grower_identity_map), which gains each created grower — so a grower
+    whose rows straddle a batch boundary is created by the first batch
+    and field-merged by the next.
+    """
+    groups = await asyncio.to_thread(_group_grower_rows, rows)
+    if not groups:
+        return 0, 0
 
+    # Chunk by grower, not by row, so a grower's field rows stay together
+    items = list(groups.items())
     created = 0
     updated = 0
+    for start in range(0, len(items), _UPSERT_CHUNK_SIZE):
+        chunk_created, chunk_updated = await _upsert_grower_groups(
+            db, items[start:start + _UPSERT_CHUNK_SIZE], id_by_key,
+        )
+        created += chunk_created
+        updated += chunk_updated
+    return created, updated
 
-    for (name_lower, ggn_lower), group_rows in groups.items():
-        # Extract field entries from all rows in this group
-        new_fields = []
-        for row in group_rows:
-            field_name = row.get("field_name")
-            field_code = row.get("field_code")
-            # Accept a field if either name or code is provided
-            if field_name or field_code:
-                new_fields.append({
-                    "name": field_name or field_code,  # use code as name if name is empty
-                    "code": field_code or None,
-                    "hectares": row.get("field_hectares"),
-                    "fruit_type": row.get("field_fruit_type") or None,
-                })
-
-        if (name_lower, ggn_lower) in existing:
-            # Existing grower — DO NOT overwrite grower data, only merge fields
-            grower = existing[(name_lower, ggn_lower)]
-            if not new_fields:
-                continue
-            current_fields = list(grower.fields or [])  # copy for mutation detection
-
-            # Build set of existing field identifiers for dedup
-            existing_ids = set()
-            for f in current_fields:
-                if f.get("code"):
-                    existing_ids.add(("code", f["code"]))
-                elif f.get("name"):
-                    existing_ids.add(("name", f["name"]))
-
-            # Append only truly new fields
-            added = False
-            for nf in new_fields:
-                if nf.get("code") and ("code", nf["code"]) in existing_ids:
-                    continue
-                if ("name", nf["name"]) in existing_ids:
-                    continue
-                current_fields.append(nf)
-                existing_ids.add(
-                    ("code", nf["code"]) if nf.get("code") else ("name", nf["name"])
-                )
-                added = True
-
-            if added:
-                # Assign new list so SQLAlchemy detects the JSON change
-                grower.fields = current_fields
-                # Auto-sum total_hectares from fields
-                field_sum = sum(f.get("hectares") or 0 for f in current_fields if isinstance(f, dict))
-                if field_sum > 0:
-                    grower.total_hectares = round(field_sum, 2)
-                updated += 1
+
+async def _upsert_grower_groups(
+    db: AsyncSession,
+    groups: list[tuple[tuple[str, str], tuple[dict, list[dict]]]],
+    id_by_key: dict[tuple[str, str], str],
+) -> tuple[int, int]:
+    """Write one chunk of grouped grower rows. Returns (created, updated)."""
+    created = 0
+    field_merges: list[dict] = []
+    new_growers: list[dict] = []
+
+    for key, (first, new_fields) in groups:
+        grower_id = id_by_key.get(key)
+        if grower_id is not None:
+            # Existing grower — DO NOT overwrite grower data, only merge
+            # fields; dedup against stored fields happens in SQL
+            if new_fields:
+                field_merges.append({"id": grower_id, "fields": _dedup_new_fields(new_fields)})
         else:
             # New grower — take grower-level data from first row
-            first = group_rows[0]
-            grower_data: dict = {"id": first.get("id")}
-            for key in _GROWER_LEVEL_KEYS:
-                val = first.get(key)
-                if val is not None:
-                    grower_data[key] = val
+            grower_data: dict = {
+                k: first[k]
+                for k in _GROWER_LEVEL_KEYS & first.keys()
+                if first[k] is not None
+            }
+            grower_data["id"] = first.get("id")
             grower_data["fields"] = new_fields if new_fields else []
             # Auto-sum total_hectares from fields if not explicitly provided
             if "total_hectares" not in grower_data or grower_data["total_hectares"] is None:
@@ -336,12 +704,22 @@ async def _upsert_growers(
                 if field_sum > 0:
                     grower_data["total_hectares"] = round(field_sum, 2)
 
-            grower = Grower(**grower_data)
-            db.add(grower)
-            existing[(name_lower, ggn_lower)] = grower
+            new_growers.append(grower_data)
+            id_by_key[key] = grower_data["id"]
             created += 1
 
-    await db.flush()
+    # New growers go in as one bulk INSERT (or COPY for large uploads)
+    # instead of a unit-of-work add() per grower.
+    await _insert_rows(db, Grower, new_growers)
+
+    updated = 0
+    if field_merges:
+        # One statement for the whole chunk; only growers that actually
+        # gained a field come back
+        result = await db.execute(
+            _MERGE_GROWER_FIELDS, {"payload": json.dumps(field_merges)}
+        )
+        updated = len(result.all())
     return created, updated
 
 
@@ -352,13 +730,11 @@ async def _upsert_growers(
 
 @router.get("/growers/template")
 async def grower_template(
+    request: Request,
     _user: User = Depends(require_permission("batch.read")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    csv_text = generate_template_csv_multi(
-        GROWER_FIELDS, [GROWER_SAMPLE_ROW1, GROWER_SAMPLE_ROW2]
-    )
-    return _csv_response(csv_text, "growers_template.csv")
+    return _template_response(request, _GROWER_TEMPLATE, "growers_template.csv")
 
 
 @router.post("/growers/upload", response_model=BulkImportResult)
@@ -368,24 +744,22 @@ async def upload_growers(
     user: User = Depends(require_permission("batch.write")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    parsed = await parse_csv(file, GROWER_FIELDS)
-    created, updated = await _upsert_growers(db, parsed.rows)
+    id_by_key = await _grower_identity_map(db)
+    result = await _import_csv(
+        db, file, GROWER_FIELDS,
+        lambda db, rows: _upsert_growers(db, rows, id_by_key),
+    )
 
     await log_activity(
         db, user,
         action="bulk_import",
         entity_type="grower",
-        summary=f"CSV import: {created} created, {updated} updated, {len(parsed.errors)} failed",
-    )
-    await invalidate_cache("growers:*")
-
-    return BulkImportResult(
-        total_rows=parsed.total_rows,
-        created=created,
-        updated=updated,
-        failed=len(parsed.errors),
-        errors=[RowErrorOut(row=e.row, errors=e.errors) for e in parsed.errors],
+        summary=f"CSV import: {result['created']} created, {result['updated']} updated, {result['failed']} failed",
     )
+    if result["created"]:
+        invalidate_grower_idmap(db)
+
+    return ORJSONResponse(result)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -393,13 +767,27 @@ async def upload_growers(
 # ══════════════════════════════════════════════════════════════
 
 
+async def _harvest_team_resolvers(db: AsyncSession) -> dict[str, dict[str, str]]:
+    """Name -> id maps for the grower_name / supplier_name columns."""
+    # One round-trip for both maps: project only (name, id), tagged with
+    # the resolver each row belongs to
+    stmt = union_all(
+        select(literal("grower_name"), Grower.name, Grower.id),
+        select(literal("supplier_name"), Supplier.name, Supplier.id),
+    )
+    resolvers: dict[str, dict[str, str]] = {"grower_name": {}, "supplier_name": {}}
+    for resolver, name, entity_id in (await db.execute(stmt)).tuples():
+        resolvers[resolver][name] = entity_id
+    return resolvers
+
+
 @router.get("/harvest-teams/template")
 async def harvest_team_template(
+    request: Request,
     _user: User = Depends(require_permission("batch.read")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    csv_text = generate_template_csv(HARVEST_TEAM_FIELDS, HARVEST_TEAM_SAMPLE)
-    return _csv_response(csv_text, "harvest_teams_template.csv")
+    return _template_response(request, _HARVEST_TEAM_TEMPLATE, "harvest_teams_template.csv")
 
 
 @router.post("/harvest-teams/upload", response_model=BulkImportResult)
@@ -409,34 +797,21 @@ async def upload_harvest_teams(
     user: User = Depends(require_permission("batch.write")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    grower_result = await db.execute(select(Grower))
-    grower_map = {g.name: g.id for g in grower_result.scalars().all()}
-
-    supplier_result = await db.execute(select(Supplier))
-    supplier_map = {s.name: s.id for s in supplier_result.scalars().all()}
-
-    resolvers = {
-        "grower_name": grower_map,
-        "supplier_name": supplier_map,
-    }
-
-    parsed = await parse_csv(file, HARVEST_TEAM_FIELDS, resolvers)
-    created, updated = await _upsert_by_name(db, HarvestTeam, parsed.rows)
+    resolvers = await _harvest_team_resolvers(db)
+    result = await _import_csv(
+        db, file, HARVEST_TEAM_FIELDS,
+        lambda db, rows: _upsert_by_name(db, HarvestTeam, rows),
+        resolvers,
+    )
 
     await log_activity(
         db, user,
         action="bulk_import",
         entity_type="harvest_team",
-        summary=f"CSV import: {created} created, {updated} updated, {len(parsed.errors)} failed",
+        summary=f"CSV import: {result['created']} created, {result['updated']} updated, {result['failed']} failed",
     )
 
-    return BulkImportResult(
-        total_rows=parsed.total_rows,
-        created=created,
-        updated=updated,
-        failed=len(parsed.errors),
-        errors=[RowErrorOut(row=e.row, errors=e.errors) for e in parsed.errors],
-    )
+    return ORJSONResponse(result)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -446,10 +821,10 @@ async def upload_harvest_teams(
 
 @router.get("/clients/template")
 async def client_template(
+    request: Request,
     _user: User = Depends(require_onboarded),
 ):
-    csv_text = generate_template_csv(CLIENT_FIELDS, CLIENT_SAMPLE)
-    return _csv_response(csv_text, "clients_template.csv")
+    return _template_response(request, _CLIENT_TEMPLATE, "clients_template.csv")
 
 
 @router.post("/clients/upload", response_model=BulkImportResult)
@@ -459,23 +834,19 @@ async def upload_clients(
     user: User = Depends(require_permission("batch.write")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    parsed = await parse_csv(file, CLIENT_FIELDS)
-    created, updated = await _upsert_by_name(db, Client, parsed.rows)
+    result = await _import_csv(
+        db, file, CLIENT_FIELDS,
+        lambda db, rows: _upsert_by_name(db, Client, rows),
+    )
 
     await log_activity(
         db, user,
         action="bulk_import",
         entity_type="client",
-        summary=f"CSV import: {created} created, {updated} updated, {len(parsed.errors)} failed",
+        summary=f"CSV import: {result['created']} created, {result['updated']} updated, {result['failed']} failed",
     )
 
-    return BulkImportResult(
-        total_rows=parsed.total_rows,
-        created=created,
-        updated=updated,
-        failed=len(parsed.errors),
-        errors=[RowErrorOut(row=e.row, errors=e.errors) for e in parsed.errors],
-    )
+    return ORJSONResponse(result)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -487,16 +858,33 @@ async def _upsert_shipping_schedules(
     db: AsyncSession,
     rows: list[dict],
 ) -> tuple[int, int]:
-    """Upsert by (vessel_name, voyage_number). Returns (created, updated)."""
-    from datetime import date as date_type
+    """Upsert by (vessel_name, voyage_number). Returns (created, updated).
+
+    Date columns arrive as ``date`` objects via ``coerce_date`` in the CSV parser.
+    """
+    if not rows:
+        return 0, 0
 
-    result = await db.execute(select(ShippingSchedule).where(ShippingSchedule.is_deleted == False))  # noqa: E712
+    incoming_vessels = {
+        row["vessel_name"].lower() for row in rows if row.get("vessel_name")
+    }
+    result = await db.execute(
+        select(ShippingSchedule)
+        .where(
+            ShippingSchedule.is_deleted == False,  # noqa: E712
+            func.lower(ShippingSchedule.vessel_name).in_(incoming_vessels),
+        )
+        .options(*_csv_columns_only(ShippingSchedule, rows))
+        .execution_options(populate_existing=True)
+    )
     existing: dict[tuple[str, str], ShippingSchedule] = {}
     for s in result.scalars().all():
         existing[(s.vessel_name.lower(), s.voyage_number.lower())] = s
 
     created = 0
     updated = 0
+    update_mappings: dict[str, dict] = {}
+    to_insert: dict[tuple[str, str], dict] = {}
 
     for row_data in rows:
         vessel = (row_data.get("vessel_name") or "").strip()
@@ -504,40 +892,35 @@ async def _upsert_shipping_schedules(
         if not vessel or not voyage:
             continue
 
-        # Parse date strings to date objects
-        for date_field in ("etd", "eta", "booking_cutoff", "cargo_cutoff"):
-            val = row_data.get(date_field)
-            if val and isinstance(val, str):
-                try:
-                    row_data[date_field] = date_type.fromisoformat(val)
-                except ValueError:
-                    row_data[date_field] = None
-
         key = (vessel.lower(), voyage.lower())
         if key in existing:
             record = existing[key]
-            for k, v in row_data.items():
-                if k != "id" and v is not None:
-                    setattr(record, k, v)
-            updated += 1
+            changes = _diff_changes(record, row_data, update_mappings.get(record.id))
+            if changes:
+                update_mappings.setdefault(record.id, {"id": record.id}).update(changes)
+                updated += 1
+        elif key in to_insert:
+            if _merge_pending_insert(to_insert[key], row_data):
+                updated += 1
         else:
             row_data["source"] = "manual"
-            record = ShippingSchedule(**row_data)
-            db.add(record)
-            existing[key] = record
+            to_insert[key] = row_data
             created += 1
 
-    await db.flush()
+    if to_insert:
+        await db.execute(insert(ShippingSchedule), list(to_insert.values()))
+    if update_mappings:
+        await db.execute(update(ShippingSchedule), list(update_mappings.values()))
     return created, updated
 
 
 @router.get("/shipping-schedules/template")
 async def shipping_schedule_template(
+    request: Request,
     _user: User = Depends(require_permission("export.read")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    csv_text = generate_template_csv(SHIPPING_SCHEDULE_FIELDS, SHIPPING_SCHEDULE_SAMPLE)
-    return _csv_response(csv_text, "shipping_schedules_template.csv")
+    return _template_response(request, _SHIPPING_SCHEDULE_TEMPLATE, "shipping_schedules_template.csv")
 
 
 @router.post("/shipping-schedules/upload", response_model=BulkImportResult)
@@ -547,21 +930,94 @@ async def upload_shipping_schedules(
     user: User = Depends(require_permission("export.write")),
     _onboarded: User = Depends(require_onboarded),
 ):
-    parsed = await parse_csv(file, SHIPPING_SCHEDULE_FIELDS)
-    created, updated = await _upsert_shipping_schedules(db, parsed.rows)
+    result = await _import_csv(
+        db, file, SHIPPING_SCHEDULE_FIELDS, _upsert_shipping_schedules,
+    )
 
     await log_activity(
         db, user,
         action="bulk_import",
         entity_type="shipping_schedule",
-        summary=f"CSV import: {created} created, {updated} updated, {len(parsed.errors)} failed",
-    )
-    await invalidate_cache("shipping_schedules:*")
-
-    return BulkImportResult(
-        total_rows=parsed.total_rows,
-        created=created,
-        updated=updated,
-        failed=len(parsed.errors),
-        errors=[RowErrorOut(row=e.row, errors=e.errors) for e in parsed.errors],
+        summary=f"CSV import: {result['created']} created, {result['updated']} updated, {result['failed']} failed",
     )
+    invalidate_cache_on_commit(db, "shipping_schedules:*")
+
+    return ORJSONResponse(result)
+
+
+# ══════════════════════════════════════════════════════════════
+# COMBINED UPLOAD
+# ══════════════════════════════════════════════════════════════
+
+
+def _result_from_parse(parsed: ParseResult, created: int, updated: int) -> dict:
+    """BulkImportResult-shaped dict for a fully parsed file."""
+    return {
+        "total_rows": parsed.total_rows,
+        "created": created,
+        "updated": updated,
+        "failed": len(parsed.errors),
+        "errors": [{"row": e.row, "errors": e.errors} for e in parsed.errors],
+    }
+
+
+@router.post("/all", response_model=dict[str, BulkImportResult])
+async def upload_all(
+    growers: UploadFile | None = File(None),
+    clients: UploadFile | None = File(None),
+    harvest_teams: UploadFile | None = File(None),
+    db: AsyncSession = Depends(get_tenant_db),
+    user: User = Depends(require_permission("batch.write")),
+    _onboarded: User = Depends(require_onboarded),
+):
+    """Import grower, client and harvest team CSVs in one request.
+
+    Grower and client files are parsed concurrently in worker threads.
+    Harvest teams are streamed in batches once growers are written, so
+    their grower_name column resolves against growers from the same upload.
+    DB writes run sequentially on the request session.
+    """
+    independent = {
+        key: (upload, fields)
+        for key, upload, fields in (
+            ("growers", growers, GROWER_FIELDS),
+            ("clients", clients, CLIENT_FIELDS),
+        )
+        if upload is not None
+    }
+    parsed_list = await asyncio.gather(*(
+        asyncio.to_thread(parse_csv_file, upload.file, fields)
+        for upload, fields in independent.values()
+    ))
+    parsed = dict(zip(independent, parsed_list))
+
+    results: dict[str, dict] = {}
+    if "growers" in parsed:
+        id_by_key = await _grower_identity_map(db)
+        created, updated = await _upsert_growers(db, parsed["growers"].rows, id_by_key)
+        results["growers"] = _result_from_parse(parsed["growers"], created, updated)
+    if "clients" in parsed:
+        created, updated = await _upsert_by_name(db, Client, parsed["clients"].rows)
+        results["clients"] = _result_from_parse(parsed["clients"], created, updated)
+    if harvest_teams is not None:
+        results["harvest_teams"] = await _import_csv(
+            db, harvest_teams, HARVEST_TEAM_FIELDS,
+            lambda db, rows: _upsert_by_name(db, HarvestTeam, rows),
+            await _harvest_team_resolvers(db),
+        )
+
+    for key, entity_type in (
+        ("growers", "grower"), ("clients", "client"), ("harvest_teams", "harvest_team"),
+    ):
+        if key in results:
+            result = results[key]
+            await log_activity(
+                db, user,
+                action="bulk_import",
+                entity_type=entity_type,
+                summary=f"CSV import: {result['created']} created, {result['updated']} updated, {result['failed']} failed",
+            )
+    if "growers" in results and results["growers"]["created"]:
+        invalidate_grower_idmap(db)
+
+    return ORJSONResponse(results)
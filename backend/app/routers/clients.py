@@ -1,16 +1,15 @@
 """Client management router.
 
 Endpoints:
-    GET   /api/clients/          List all clients
+    GET   /api/clients/          List clients (optional keyset paging)
     POST  /api/clients/          Create client
     PATCH /api/clients/{id}      Update client
     DELETE /api/clients/{id}     Soft-delete (deactivate) client
 """
 
-import uuid
-
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import exists, not_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.deps import require_onboarded, require_permission
@@ -18,23 +17,37 @@ from app.database import get_tenant_db
 from app.models.public.user import User
 from app.models.tenant.client import Client
 from app.schemas.client import ClientCreate, ClientOut, ClientUpdate
+from app.schemas.common import schema_columns
 
 router = APIRouter()
 
+_CLIENT_OUT_COLUMNS = schema_columns(Client, ClientOut)
+
 
 @router.get("/", response_model=list[ClientOut])
 async def list_clients(
     include_inactive: bool = False,
+    limit: int | None = Query(None, ge=1, le=500),
+    after_name: str | None = None,
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
-    """List all clients (active by default)."""
-    query = select(Client)
+    """List clients (active by default), ordered by name.
+
+    Without ``limit`` every matching client is returned.  For keyset
+    paging pass ``limit`` and, for the next page, ``after_name`` set to
+    the last name received.
+    """
+    query = select(*_CLIENT_OUT_COLUMNS)
     if not include_inactive:
         query = query.where(Client.is_active == True)  # noqa: E712
+    if after_name is not None:
+        query = query.where(Client.name > after_name)
     query = query.order_by(Client.name)
+    if limit is not None:
+        query = query.limit(limit)
     result = await db.execute(query)
-    return [ClientOut.model_validate(c) for c in result.scalars().all()]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("/", response_model=ClientOut, status_code=201)
@@ -44,14 +57,11 @@ async def create_client(
     _user: User = Depends(require_permission("batch.write")),
 ):
     """Create a new client."""
-    # Check name uniqueness
-    existing = await db.execute(
-        select(Client).where(Client.name == body.name)
-    )
-    if existing.scalar_one_or_none():
+    # Check name uniqueness — EXISTS returns one boolean, not the row
+    if await db.scalar(select(exists().where(Client.name == body.name))):
         raise HTTPException(status_code=400, detail=f"Client '{body.name}' already exists")
 
-    client = Client(id=str(uuid.uuid4()), **body.model_dump())
+    client = Client(**body.model_dump())
     db.add(client)
     await db.flush()
     return ClientOut.model_validate(client)
@@ -65,15 +75,20 @@ async def update_client(
     _user: User = Depends(require_permission("batch.write")),
 ):
     """Update a client."""
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    client = result.scalar_one_or_none()
+    updates = body.model_dump(exclude_unset=True)
+    if updates:
+        # Existence check, write and read-back in one UPDATE ... RETURNING
+        stmt = (
+            update(Client)
+            .where(Client.id == client_id)
+            .values(**updates)
+            .returning(Client)
+        )
+    else:
+        stmt = select(Client).where(Client.id == client_id)
+    client = (await db.execute(stmt)).scalar_one_or_none()
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-
-    updates = body.model_dump(exclude_unset=True)
-    for key, value in updates.items():
-        setattr(client, key, value)
-    await db.flush()
     return ClientOut.model_validate(client)
 
 
@@ -84,11 +99,14 @@ async def deactivate_client(
     _user: User = Depends(require_permission("batch.write")),
 ):
     """Soft-delete (deactivate) a client."""
-    result = await db.execute(select(Client).where(Client.id == client_id))
+    # Toggle in SQL and read the row back in the same statement
+    result = await db.execute(
+        update(Client)
+        .where(Client.id == client_id)
+        .values(is_active=not_(Client.is_active))
+        .returning(Client)
+    )
     client = result.scalar_one_or_none()
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
-
-    client.is_active = not client.is_active
-    await db.flush()
     return ClientOut.model_validate(client)
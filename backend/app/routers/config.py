@@ -20,22 +20,26 @@ Endpoints:
 """
 
 import uuid
-from collections import defaultdict
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.auth.deps import require_onboarded, require_permission
 from app.database import get_tenant_db
 from app.models.public.user import User
-from app.utils.cache import cached, invalidate_cache
+from app.utils.cache import cached, invalidate_cache_on_commit
+from app.utils.numbering import NUMBER_FORMATS_CACHE_KEY
 from app.models.tenant.container_type_capacity import ContainerTypeBoxCapacity
 from app.models.tenant.financial_config import FinancialConfig
 from app.models.tenant.product_config import BinType, BoxSize, PackSpec, PalletType, PalletTypeBoxCapacity, ProductConfig
 from app.models.tenant.tenant_config import TenantConfig
 from app.models.tenant.transport_config import TransportConfig
+from app.schemas.common import schema_columns
 from app.schemas.config import (
     BinTypeOut,
     BoxCapacityOut,
@@ -56,31 +60,60 @@ from app.schemas.container import (
     TransportConfigUpdate,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_BIN_TYPE_COLUMNS = schema_columns(BinType, BinTypeOut)
+_BOX_SIZE_COLUMNS = schema_columns(BoxSize, BoxSizeSpecOut)
+
+# Built once; get_pallet_type_capacities binds the id.
+_PALLET_TYPE_CAPACITIES_STMT = (
+    select(PalletType)
+    .where(PalletType.id == bindparam("pallet_type_id"))
+    .options(
+        selectinload(PalletType.box_capacities).selectinload(PalletTypeBoxCapacity.box_size)
+    )
+)
 
 
 @router.get("/bin-types", response_model=list[BinTypeOut])
-@cached(ttl=600, prefix="config")
+@cached(ttl=600, prefix="config", raw=True)
 async def list_bin_types(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
     """List all active bin types for this enterprise."""
     result = await db.execute(
-        select(BinType).where(BinType.is_active == True).order_by(BinType.name)  # noqa: E712
+        select(*_BIN_TYPE_COLUMNS).where(BinType.is_active == True).order_by(BinType.name)  # noqa: E712
     )
-    return [BinTypeOut.model_validate(bt) for bt in result.scalars().all()]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/product-configs", response_model=list[ProductConfigOut])
-@cached(ttl=600, prefix="config")
+@cached(ttl=600, prefix="config", raw=True)
 async def list_product_configs(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
     """List all product configs (fruit type + variety + grades + sizes)."""
-    result = await db.execute(select(ProductConfig).order_by(ProductConfig.fruit_type))
-    return [ProductConfigOut.model_validate(pc) for pc in result.scalars().all()]
+    result = await db.execute(
+        select(
+            ProductConfig.id,
+            ProductConfig.fruit_type,
+            ProductConfig.variety,
+            ProductConfig.grades,
+            ProductConfig.sizes,
+        ).order_by(ProductConfig.fruit_type)
+    )
+    return ORJSONResponse([
+        {
+            "id": pc_id,
+            "fruit_type": fruit_type,
+            "variety": variety,
+            "grades": grades or [],
+            "sizes": sizes or [],
+        }
+        for pc_id, fruit_type, variety, grades, sizes in result.all()
+    ])
 
 
 @router.get(
@@ -93,11 +126,7 @@ async def get_pallet_type_capacities(
     _user: User = Depends(require_onboarded),
 ):
     """Get box-size-specific capacities for a pallet type."""
-    result = await db.execute(
-        select(PalletType)
-        .where(PalletType.id == pallet_type_id)
-        .options(selectinload(PalletType.box_capacities).selectinload(PalletTypeBoxCapacity.box_size))
-    )
+    result = await db.execute(_PALLET_TYPE_CAPACITIES_STMT, {"pallet_type_id": pallet_type_id})
     pt = result.scalar_one_or_none()
     if not pt:
         raise HTTPException(status_code=404, detail="Pallet type not found")
@@ -120,8 +149,32 @@ async def get_pallet_type_capacities(
 
 # ── Fruit Types (aggregated from product_configs) ────────────
 
+# One row per fruit type with the sorted, distinct union of its varieties,
+# grades and sizes.  grades/sizes are JSON columns, so they are unnested
+# laterally (non-arrays count as empty); COLLATE "C" keeps Python's
+# codepoint sort order.
+_FRUIT_TYPES_SQL = text("""
+SELECT pc.fruit_type,
+       COALESCE(array_agg(DISTINCT pc.variety COLLATE "C" ORDER BY pc.variety COLLATE "C")
+                FILTER (WHERE pc.variety <> ''), '{}') AS varieties,
+       COALESCE(array_agg(DISTINCT g.grade COLLATE "C" ORDER BY g.grade COLLATE "C")
+                FILTER (WHERE g.grade IS NOT NULL), '{}') AS grades,
+       COALESCE(array_agg(DISTINCT s.size COLLATE "C" ORDER BY s.size COLLATE "C")
+                FILTER (WHERE s.size IS NOT NULL), '{}') AS sizes
+FROM product_configs pc
+LEFT JOIN LATERAL json_array_elements_text(
+    CASE WHEN json_typeof(pc.grades) = 'array' THEN pc.grades END
+) AS g(grade) ON true
+LEFT JOIN LATERAL json_array_elements_text(
+    CASE WHEN json_typeof(pc.sizes) = 'array' THEN pc.sizes END
+) AS s(size) ON true
+GROUP BY pc.fruit_type
+ORDER BY pc.fruit_type COLLATE "C"
+""")
+
+
 @router.get("/fruit-types", response_model=list[FruitTypeConfig])
-@cached(ttl=600, prefix="config")
+@cached(ttl=600, prefix="config", raw=True)
 async def list_fruit_types(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
@@ -131,40 +184,21 @@ async def list_fruit_types(
     Merges all product_configs by fruit_type so each fruit type shows
     the union of its varieties, grades, and sizes across all entries.
     """
-    result = await db.execute(select(ProductConfig).order_by(ProductConfig.fruit_type))
-    configs = result.scalars().all()
-
-    # Aggregate by fruit type
-    grouped: dict[str, dict] = defaultdict(lambda: {"varieties": set(), "grades": set(), "sizes": set()})
-    for pc in configs:
-        g = grouped[pc.fruit_type]
-        if pc.variety:
-            g["varieties"].add(pc.variety)
-        g["grades"].update(pc.grades or [])
-        g["sizes"].update(pc.sizes or [])
-
-    return [
-        FruitTypeConfig(
-            fruit_type=ft,
-            varieties=sorted(data["varieties"]),
-            grades=sorted(data["grades"]),
-            sizes=sorted(data["sizes"]),
-        )
-        for ft, data in sorted(grouped.items())
-    ]
+    result = await db.execute(_FRUIT_TYPES_SQL)
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 # ── Box Sizes with specs ─────────────────────────────────────
 
 @router.get("/box-sizes", response_model=list[BoxSizeSpecOut])
-@cached(ttl=600, prefix="config")
+@cached(ttl=600, prefix="config", raw=True)
 async def list_box_sizes(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
     """List all box sizes with specification fields."""
-    result = await db.execute(select(BoxSize).order_by(BoxSize.name))
-    return [BoxSizeSpecOut.model_validate(bs) for bs in result.scalars().all()]
+    result = await db.execute(select(*_BOX_SIZE_COLUMNS).order_by(BoxSize.name))
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 # ── Pack Specs ───────────────────────────────────────────────
@@ -191,7 +225,7 @@ async def create_pack_spec(
     db.add(ps)
     await db.flush()
     await db.refresh(ps)
-    await invalidate_cache("config")
+    invalidate_cache_on_commit(db, "config:*")
     return PackSpecOut.model_validate(ps)
 
 
@@ -213,7 +247,7 @@ async def update_pack_spec(
 
     await db.flush()
     await db.refresh(ps)
-    await invalidate_cache("config")
+    invalidate_cache_on_commit(db, "config:*")
     return PackSpecOut.model_validate(ps)
 
 
@@ -243,7 +277,7 @@ async def delete_pack_spec(
 
     await db.delete(ps)
     await db.flush()
-    await invalidate_cache("config")
+    invalidate_cache_on_commit(db, "config:*")
 
 
 # ── Financial Summary ────────────────────────────────────────
@@ -268,14 +302,14 @@ async def get_financial_summary(
 # ── Tenant Settings ──────────────────────────────────────────
 
 @router.get("/tenant-settings")
+@cached(ttl=60, prefix="config", raw=True)
 async def get_tenant_settings(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
     """Get all tenant configuration settings as a key-value dict."""
-    result = await db.execute(select(TenantConfig))
-    configs = result.scalars().all()
-    return {c.key: c.value for c in configs}
+    result = await db.execute(select(TenantConfig.key, TenantConfig.value))
+    return ORJSONResponse(dict(result.tuples().all()))
 
 
 @router.put("/tenant-settings")
@@ -284,23 +318,35 @@ async def update_tenant_settings(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_permission("enterprise.manage")),
 ):
-    """Upsert tenant configuration settings."""
-    for key, value in body.settings.items():
-        result = await db.execute(
-            select(TenantConfig).where(TenantConfig.key == key)
-        )
-        existing = result.scalar_one_or_none()
-        if existing:
-            existing.value = value
-        else:
-            db.add(TenantConfig(id=str(uuid.uuid4()), key=key, value=value))
+    """Upsert tenant configuration settings.
 
-    await db.flush()
+    A single statement: the upsert runs as a data-modifying CTE and the
+    outer SELECT merges its RETURNING rows with the untouched settings
+    (which it sees as of the statement snapshot).
+    """
+    if not body.settings:
+        result = await db.execute(select(TenantConfig.key, TenantConfig.value))
+        return dict(result.tuples().all())
+
+    now = datetime.now(UTC).replace(tzinfo=None)
+    stmt = pg_insert(TenantConfig).values([
+        {"id": str(uuid.uuid4()), "key": key, "value": value, "updated_at": now}
+        for key, value in body.settings.items()
+    ])
+    upserted = stmt.on_conflict_do_update(
+        index_elements=[TenantConfig.key],
+        set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+    ).returning(TenantConfig.key, TenantConfig.value).cte("upserted")
 
-    # Return updated settings
-    result = await db.execute(select(TenantConfig))
-    configs = result.scalars().all()
-    return {c.key: c.value for c in configs}
+    result = await db.execute(
+        select(TenantConfig.key, TenantConfig.value)
+        .where(TenantConfig.key.not_in(select(upserted.c.key)))
+        .union_all(select(upserted.c.key, upserted.c.value))
+    )
+    invalidate_cache_on_commit(db, "config:get_tenant_settings:*")
+    if "number_formats" in body.settings:
+        invalidate_cache_on_commit(db, NUMBER_FORMATS_CACHE_KEY)
+    return dict(result.tuples().all())
 
 
 # ── Transport Configs ─────────────────────────────────────────
@@ -393,7 +439,7 @@ async def update_transport_config(
 
     await db.flush()
     await db.refresh(tc)
-    await invalidate_cache("config")
+    invalidate_cache_on_commit(db, "config:*")
     return _transport_config_to_out(tc)
 
 
@@ -436,5 +482,5 @@ async def replace_box_capacities(
 
     await db.flush()
     await db.refresh(tc)
-    await invalidate_cache("config")
+    invalidate_cache_on_commit(db, "config:*")
     return _transport_config_to_out(tc)
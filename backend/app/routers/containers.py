@@ -18,17 +18,23 @@ Endpoints:
     DELETE /api/containers/{container_id}       Soft-delete container
 """
 
+import asyncio
+import hashlib
 import io
-import json
 import uuid
-from datetime import date, datetime
+from datetime import UTC, date, datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 
+import orjson
 import segno
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
-from sqlalchemy import func, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import bindparam, case, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload
 
 from app.auth.deps import require_onboarded, require_permission
 from app.auth.packhouse_scope import get_packhouse_scope
@@ -37,9 +43,14 @@ from app.models.public.user import User
 from app.models.tenant.client import Client
 from app.models.tenant.batch import Batch
 from app.models.tenant.container import Container
+from app.models.tenant.grower import Grower
 from app.models.tenant.lot import Lot
 from app.models.tenant.pallet import Pallet, PalletLot
-from app.schemas.common import PaginatedResponse
+from app.models.tenant.product_config import BoxSize
+from app.models.tenant.shipping_agent import ShippingAgent
+from app.models.tenant.shipping_line import ShippingLine
+from app.models.tenant.transporter import Transporter
+from app.schemas.common import PaginatedResponse, construct_from_orm
 from app.schemas.container import (
     ContainerDetail,
     ContainerFromPalletsRequest,
@@ -50,31 +61,108 @@ from app.schemas.container import (
     ExportContainerRequest,
     LoadPalletsRequest,
     SealContainerRequest,
-    TraceBatch,
-    TraceLot,
-    TracePallet,
 )
 from app.utils.activity import log_activity
 from app.utils.locks import get_container_locks
-from app.utils.numbering import generate_code
+from app.utils.numbering import generate_code, resync_code_sequence
+
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Pallet statuses that move to "loaded" when the pallet joins a container.
+_LOADABLE_STATES = frozenset({"open", "closed", "stored", "allocated"})
+
+
+# list_containers selects just the ContainerSummary columns plus the three
+# party names (outer-joined), instead of Container entities — which would
+# also selectin-load every pallet, the client, packhouse, export, etc.
+_SUMMARY_COLUMNS = [c for c in Container.__table__.c if c.key in ContainerSummary.model_fields]
+_SUMMARY_NAME_COLUMNS = [
+    Transporter.name.label("transporter_name"),
+    ShippingAgent.name.label("shipping_agent_name"),
+    ShippingLine.name.label("shipping_line_name"),
+]
+# Summary fields list_containers doesn't select (overdue flag, search-only
+# code lists); rows start from the schema's defaults for these.
+_SUMMARY_UNSELECTED = tuple(
+    ContainerSummary.model_fields.keys()
+    - {c.key for c in (*_SUMMARY_COLUMNS, *_SUMMARY_NAME_COLUMNS)}
+)
+
+# get_container loads the container without its selectin pallets; pallets,
+# lots, batches and growers come back as flat rows from one outer-joined
+# query, ordered so each pallet's rows are contiguous.
+_CONTAINER_DETAIL_STMT = (
+    select(Container)
+    .where(
+        Container.id == bindparam("container_id"),
+        Container.is_deleted == False,  # noqa: E712
+    )
+    .options(raiseload(Container.pallets))
+)
+_CONTAINER_TRACE_STMT = (
+    select(
+        Pallet.id,
+        Pallet.pallet_number,
+        Pallet.current_boxes,
+        Pallet.fruit_type,
+        Pallet.grade,
+        Pallet.size,
+        Pallet.box_size_name,
+        Pallet.status,
+        Lot.id.label("lot_id"),
+        Lot.lot_code,
+        Lot.grade.label("lot_grade"),
+        Lot.size.label("lot_size"),
+        PalletLot.box_count,
+        BoxSize.name.label("lot_box_size_name"),
+        Batch.id.label("batch_id"),
+        Batch.batch_code,
+        Batch.fruit_type.label("batch_fruit_type"),
+        Batch.intake_date,
+        Grower.name.label("grower_name"),
+        Grower.grower_code,
+    )
+    .outerjoin(PalletLot, PalletLot.pallet_id == Pallet.id)
+    .outerjoin(Lot, Lot.id == PalletLot.lot_id)
+    .outerjoin(BoxSize, BoxSize.id == Lot.box_size_id)
+    .outerjoin(Batch, Batch.id == Lot.batch_id)
+    .outerjoin(Grower, Grower.id == Batch.grower_id)
+    .where(Pallet.container_id == bindparam("container_id"))
+    .order_by(Pallet.pallet_number, Pallet.id, PalletLot.created_at, PalletLot.id)
+)
+
+
+@lru_cache(maxsize=256)
+def _render_qr_svg(qr_data: bytes) -> bytes:
+    """Render a container QR payload as SVG.
 
-router = APIRouter()
+    Encoding is pure-Python Reed-Solomon and dominates the QR endpoint;
+    the SVG depends only on the payload, which rarely changes once a
+    container is loaded, so repeat views are served from memory.
+    Pure CPU work — run via ``asyncio.to_thread`` so a render doesn't
+    stall the event loop.
+    """
+    qr = segno.make(qr_data)
+    buf = io.BytesIO()
+    qr.save(buf, kind="svg", scale=4, dark="#15803d")
+    return buf.getvalue()
+
+
+def _is_overdue(status: str, eta: date | None, today: date) -> bool:
+    """A shipped container is overdue once its ETA has passed."""
+    return status in ("dispatched", "in_transit") and eta is not None and eta < today
 
 
 def _container_summary(container: Container) -> ContainerSummary:
     """Build a ContainerSummary with denormalized relationship names + overdue flag."""
-    s = ContainerSummary.model_validate(container)
+    s = construct_from_orm(ContainerSummary, container)
     if container.transporter:
         s.transporter_name = container.transporter.name
     if container.shipping_agent:
         s.shipping_agent_name = container.shipping_agent.name
     if container.shipping_line:
         s.shipping_line_name = container.shipping_line.name
-    s.is_overdue = (
-        container.status in ("dispatched", "in_transit")
-        and container.eta is not None
-        and container.eta < date.today()
-    )
+    s.is_overdue = _is_overdue(container.status, container.eta, date.today())
     return s
 
 
@@ -100,13 +188,38 @@ async def _resolve_client(db: AsyncSession, client_id: str | None) -> tuple[str
     """Return (client_id, customer_name) from client lookup."""
     if not client_id:
         return None, None
-    result = await db.execute(select(Client).where(Client.id == client_id))
-    client = result.scalar_one_or_none()
+    result = await db.execute(select(Client.id, Client.name).where(Client.id == client_id))
+    client = result.one_or_none()
     if not client:
         raise HTTPException(status_code=400, detail="Client not found")
     return client.id, client.name
 
 
+# A taken container number is re-synced and regenerated this many times
+# before the IntegrityError is surfaced.
+_NUMBER_ATTEMPTS = 3
+
+
+async def _insert_container(db: AsyncSession, container: Container) -> None:
+    """Add and flush a new container, renumbering it if its number is taken.
+
+    generate_code's Redis counter can fall behind the table (numbers handed
+    out by its Redis-down fallback don't advance it), so a duplicate number
+    re-syncs the counter from the table and the insert is retried inside a
+    savepoint.
+    """
+    for attempt in range(_NUMBER_ATTEMPTS):
+        try:
+            async with db.begin_nested():
+                db.add(container)
+            return
+        except IntegrityError as exc:
+            if attempt == _NUMBER_ATTEMPTS - 1 or "container_number" not in str(exc.orig):
+                raise
+            await resync_code_sequence(db, "container")
+            container.container_number = await generate_code(db, "container")
+
+
 # ── POST /api/containers/ (empty) ────────────────────────────
 
 @router.post("/", response_model=ContainerSummary, status_code=201)
@@ -142,8 +255,7 @@ async def create_empty_container(
         status="open",
         notes=body.notes,
     )
-    db.add(container)
-    await db.flush()
+    await _insert_container(db, container)
 
     await log_activity(
         db, user,
@@ -178,7 +290,6 @@ async def create_container_from_pallets(
             Pallet.id.in_(body.pallet_ids),
             Pallet.is_deleted == False,  # noqa: E712
         )
-        .options(selectinload(Pallet.pallet_lots))
     )
     pallets = result.scalars().all()
 
@@ -207,13 +318,17 @@ async def create_container_from_pallets(
             detail=f"Already in a container: {', '.join(already_loaded[:3])}",
         )
 
-    # Create container
     container_number = await generate_code(db, "container")
-    total_cartons = sum(p.current_boxes for p in pallets)
-    total_weight = sum(p.gross_weight_kg or p.net_weight_kg or 0.0 for p in pallets)
+
+    # Tally from the pallets already loaded for validation; they're linked
+    # with one UPDATE once the container row exists.
+    total_cartons = 0
+    total_weight = 0.0
+    for pallet in pallets:
+        total_cartons += pallet.current_boxes
+        total_weight += pallet.gross_weight_kg or pallet.net_weight_kg or 0.0
 
     container = Container(
-        id=str(uuid.uuid4()),
         container_number=container_number,
         container_type=body.container_type,
         capacity_pallets=body.capacity_pallets,
@@ -235,17 +350,21 @@ async def create_container_from_pallets(
         status="loading",
         notes=body.notes,
     )
-    db.add(container)
-    await db.flush()
-
-    # Link pallets to container
-    for pallet in pallets:
-        pallet.container_id = container.id
-        pallet.loaded_at = datetime.utcnow()
-        if pallet.status in ("open", "closed", "stored", "allocated"):
-            pallet.status = "loaded"
-
-    await db.flush()
+    await _insert_container(db, container)
+
+    await db.execute(
+        update(Pallet)
+        .where(Pallet.id.in_(body.pallet_ids))
+        .values(
+            container_id=container.id,
+            loaded_at=datetime.now(UTC).replace(tzinfo=None),
+            status=case(
+                (Pallet.status.in_(_LOADABLE_STATES), "loaded"),
+                else_=Pallet.status,
+            ),
+        )
+        .execution_options(synchronize_session="fetch")
+    )
 
     await log_activity(
         db, user,
@@ -303,7 +422,6 @@ async def load_pallets_into_container(
             Pallet.id.in_(body.pallet_ids),
             Pallet.is_deleted == False,  # noqa: E712
         )
-        .options(selectinload(Pallet.pallet_lots))
     )
     pallets = pallet_result.scalars().all()
 
@@ -322,20 +440,21 @@ async def load_pallets_into_container(
             detail=f"Already in a container: {', '.join(already_loaded[:3])}",
         )
 
-    # Link pallets — assign sequential position based on current count
-    next_pos = container.pallet_count + 1
-    for pallet in pallets:
+    # Link pallets — assign sequential position based on current count —
+    # and tally the added cartons/weight in the same pass
+    added_cartons = 0
+    added_weight = 0.0
+    loaded_at = datetime.now(UTC).replace(tzinfo=None)
+    for pos, pallet in enumerate(pallets, start=container.pallet_count + 1):
+        added_cartons += pallet.current_boxes
+        added_weight += pallet.gross_weight_kg or pallet.net_weight_kg or 0.0
         pallet.container_id = container.id
-        pallet.loaded_at = datetime.utcnow()
-        pallet.position_in_container = str(next_pos)
-        next_pos += 1
-        if pallet.status in ("open", "closed", "stored", "allocated"):
+        pallet.loaded_at = loaded_at
+        pallet.position_in_container = str(pos)
+        if pallet.status in _LOADABLE_STATES:
             pallet.status = "loaded"
 
     # Update container tallies
-    added_cartons = sum(p.current_boxes for p in pallets)
-    added_weight = sum(p.gross_weight_kg or p.net_weight_kg or 0.0 for p in pallets)
-
     container.pallet_count += len(pallets)
     container.total_cartons += added_cartons
     container.gross_weight_kg = (container.gross_weight_kg or 0) + added_weight if added_weight else container.gross_weight_kg
@@ -407,7 +526,7 @@ async def update_container(
         if hasattr(container, field):
             setattr(container, field, value)
 
-    container.updated_at = datetime.utcnow()
+    container.updated_at = datetime.now(UTC).replace(tzinfo=None)
     await db.flush()
 
     await log_activity(
@@ -477,20 +596,41 @@ async def list_containers(
             matching_ids = matching_ids.where(Container.customer_name.ilike(f"%{customer}%"))
         base = select(Container).where(Container.id.in_(matching_ids))
 
-    count_result = await db.execute(
-        select(func.count()).select_from(base.subquery())
-    )
-    total = count_result.scalar() or 0
-
     items_result = await db.execute(
-        base.order_by(Container.created_at.desc()).limit(limit).offset(offset)
+        base.with_only_columns(
+            *_SUMMARY_COLUMNS,
+            *_SUMMARY_NAME_COLUMNS,
+            func.count().over().label("total"),
+        )
+        .outerjoin(Transporter, Transporter.id == Container.transporter_id)
+        .outerjoin(ShippingAgent, ShippingAgent.id == Container.shipping_agent_id)
+        .outerjoin(ShippingLine, ShippingLine.id == Container.shipping_line_id)
+        .order_by(Container.created_at.desc())
+        .limit(limit)
+        .offset(offset)
     )
-    items = list(items_result.scalars().all())
+    today = date.today()
+    items = []
+    total = 0
+    for row in items_result.mappings():
+        item = {
+            name: ContainerSummary.model_fields[name].get_default(call_default_factory=True)
+            for name in _SUMMARY_UNSELECTED
+        }
+        item.update(row)
+        total = item.pop("total")
+        item["is_overdue"] = _is_overdue(item["status"], item["eta"], today)
+        items.append(item)
+
+    # The window count rides along with the page; only an offset past the
+    # last row leaves nothing to read it from.
+    if not items and offset > 0:
+        total = await db.scalar(base.with_only_columns(func.count(Container.id))) or 0
 
     # Populate pallet_numbers, lot_codes, batch_codes only when searching
     # (avoids extra JOINs on every default page load)
     if items and search:
-        container_ids = [c.id for c in items]
+        container_ids = [item["id"] for item in items]
         trace_result = await db.execute(
             select(
                 Pallet.container_id,
@@ -516,22 +656,17 @@ async def list_containers(
             if bcode:
                 batch_map.setdefault(cid, set()).add(bcode)
 
-        summaries = []
-        for c in items:
-            s = _container_summary(c)
-            s.pallet_numbers = sorted(pallet_map.get(c.id, set()))
-            s.lot_codes = sorted(lot_map.get(c.id, set()))
-            s.batch_codes = sorted(batch_map.get(c.id, set()))
-            summaries.append(s)
-    else:
-        summaries = [_container_summary(c) for c in items]
-
-    return PaginatedResponse(
-        items=summaries,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+        for item in items:
+            item["pallet_numbers"] = sorted(pallet_map.get(item["id"], set()))
+            item["lot_codes"] = sorted(lot_map.get(item["id"], set()))
+            item["batch_codes"] = sorted(batch_map.get(item["id"], set()))
+
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
 
 
 # ── GET /api/containers/{container_id} ───────────────────────
@@ -544,79 +679,77 @@ async def get_container(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(
-        select(Container)
-        .where(Container.id == container_id, Container.is_deleted == False)  # noqa: E712
-        .options(
-            selectinload(Container.pallets)
-            .selectinload(Pallet.pallet_lots)
-            .selectinload(PalletLot.lot)
-            .selectinload(Lot.box_size),
-            selectinload(Container.pallets)
-            .selectinload(Pallet.pallet_lots)
-            .selectinload(PalletLot.lot)
-            .selectinload(Lot.batch)
-            .selectinload(Batch.grower),
-        )
-    )
+    result = await db.execute(_CONTAINER_DETAIL_STMT, {"container_id": container_id})
     container = result.scalar_one_or_none()
     if not container:
         raise HTTPException(status_code=404, detail="Container not found")
     if packhouse_scope is not None and container.packhouse_id and container.packhouse_id not in packhouse_scope:
         raise HTTPException(status_code=404, detail="Container not found")
 
-    detail = ContainerDetail.model_validate(container)
+    trace_result = await db.execute(_CONTAINER_TRACE_STMT, {"container_id": container.id})
+
+    # Build pallets + traceability: container → pallets → lots → batches → growers.
+    # The trace tree is plain dicts handed straight to orjson — it is pure
+    # read-only output with no validators, so no schema objects are needed.
+    pallets: list[ContainerPalletOut] = []
+    trace_pallets: list[dict] = []
+    for _, rows in groupby(trace_result.all(), key=itemgetter(0)):
+        rows = list(rows)
+        p = rows[0]
+        pallets.append(ContainerPalletOut.model_construct(
+            id=p.id,
+            pallet_number=p.pallet_number,
+            current_boxes=p.current_boxes,
+            fruit_type=p.fruit_type,
+            grade=p.grade,
+            size=p.size,
+            box_size_name=p.box_size_name,
+            status=p.status,
+        ))
+        lots: list[dict] = []
+        batches: list[dict] = []
+        seen_batches: set[str] = set()
+        for row in rows:
+            if row.lot_id is None:
+                continue
+            lots.append({
+                "lot_code": row.lot_code,
+                "grade": row.lot_grade,
+                "size": row.lot_size,
+                "box_count": row.box_count,
+                "box_size_name": row.lot_box_size_name,
+            })
+            if row.batch_id and row.batch_id not in seen_batches:
+                seen_batches.add(row.batch_id)
+                batches.append({
+                    "batch_code": row.batch_code,
+                    "grower_name": row.grower_name,
+                    "grower_code": row.grower_code,
+                    "fruit_type": row.batch_fruit_type,
+                    "intake_date": row.intake_date.isoformat() if row.intake_date else None,
+                })
+        trace_pallets.append({
+            "pallet_number": p.pallet_number,
+            "current_boxes": p.current_boxes,
+            "lots": lots,
+            "batches": batches,
+        })
+
+    detail = construct_from_orm(ContainerDetail, container, pallets=pallets)
     if container.transporter:
         detail.transporter_name = container.transporter.name
     if container.shipping_agent:
         detail.shipping_agent_name = container.shipping_agent.name
     if container.shipping_line:
         detail.shipping_line_name = container.shipping_line.name
-    detail.is_overdue = (
-        container.status in ("dispatched", "in_transit")
-        and container.eta is not None
-        and container.eta < date.today()
-    )
-
-    # Build traceability: container → pallets → lots → batches → growers
-    trace_pallets: list[TracePallet] = []
-    for p in container.pallets:
-        tp = TracePallet(
-            pallet_number=p.pallet_number,
-            current_boxes=p.current_boxes,
-        )
-        seen_batches: set[str] = set()
-        for pl in p.pallet_lots:
-            if pl.lot:
-                tp.lots.append(TraceLot(
-                    lot_code=pl.lot.lot_code,
-                    grade=pl.lot.grade,
-                    size=pl.lot.size,
-                    box_count=pl.box_count,
-                    box_size_name=(
-                        pl.lot.box_size.name if pl.lot.box_size else None
-                    ),
-                ))
-                # Walk up to batch → grower
-                batch = pl.lot.batch if hasattr(pl.lot, "batch") and pl.lot.batch else None
-                if batch and batch.id not in seen_batches:
-                    seen_batches.add(batch.id)
-                    grower = batch.grower if hasattr(batch, "grower") and batch.grower else None
-                    tp.batches.append(TraceBatch(
-                        batch_code=batch.batch_code,
-                        grower_name=grower.name if grower else None,
-                        grower_code=grower.grower_code if grower else None,
-                        fruit_type=batch.fruit_type,
-                        intake_date=batch.intake_date.isoformat() if batch.intake_date else None,
-                    ))
-        trace_pallets.append(tp)
-
-    detail.traceability = trace_pallets
+    detail.is_overdue = _is_overdue(container.status, container.eta, date.today())
 
     lock_info = await get_container_locks(db, container)
     detail.locked_fields = lock_info.locked_field_names()
 
-    return detail
+    payload = detail.model_dump(mode="json", exclude={"traceability"})
+    payload["traceability"] = trace_pallets
+    return ORJSONResponse(payload)
 
 
 # ── GET /api/containers/{container_id}/qr ────────────────────
@@ -624,36 +757,54 @@ async def get_container(
 @router.get("/{container_id}/qr")
 async def get_container_qr(
     container_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_permission("batch.read")),
     _onboarded: User = Depends(require_onboarded),
 ):
     """Return an SVG QR code encoding key container information."""
+    # Column-only selects: loading the Container entity would also pull
+    # in its selectin relationships (pallets, client, packhouse, ...).
     result = await db.execute(
-        select(Container)
+        select(
+            Container.id,
+            Container.container_number,
+            Container.container_type,
+            Container.customer_name,
+            Container.destination,
+            Container.total_cartons,
+        )
         .where(Container.id == container_id, Container.is_deleted == False)  # noqa: E712
-        .options(selectinload(Container.pallets))
     )
-    container = result.scalar_one_or_none()
+    container = result.one_or_none()
     if not container:
         raise HTTPException(status_code=404, detail="Container not found")
 
-    pallet_numbers = [p.pallet_number for p in container.pallets]
-    qr_data = json.dumps({
+    pallet_numbers = await db.scalars(
+        select(Pallet.pallet_number).where(Pallet.container_id == container_id).limit(20)
+    )
+    qr_data = orjson.dumps({
         "type": "container",
         "container_id": container.id,
         "number": container.container_number,
         "container_type": container.container_type,
         "customer": container.customer_name,
         "destination": container.destination,
-        "pallets": pallet_numbers[:20],
+        "pallets": pallet_numbers.all(),
         "total_cartons": container.total_cartons,
-    }, separators=(",", ":"))
+    })
 
-    qr = segno.make(qr_data)
-    buf = io.BytesIO()
-    qr.save(buf, kind="svg", scale=4, dark="#15803d")
-    return Response(content=buf.getvalue(), media_type="image/svg+xml")
+    # The ETag is a hash of the payload, so a client holding the current
+    # SVG revalidates with a 304 and the render is skipped entirely.
+    headers = {
+        "Cache-Control": "private, no-cache",
+        "ETag": f'"{hashlib.blake2b(qr_data, digest_size=8).hexdigest()}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
+    svg = await asyncio.to_thread(_render_qr_svg, qr_data)
+    return Response(content=svg, media_type="image/svg+xml", headers=headers)
 
 
 # ── DELETE /api/containers/{container_id} ─────────────────────
@@ -700,7 +851,7 @@ async def delete_container(
         )
 
     container.is_deleted = True
-    container.updated_at = datetime.utcnow()
+    container.updated_at = datetime.now(UTC).replace(tzinfo=None)
     await db.flush()
 
     await log_activity(
@@ -757,7 +908,7 @@ async def mark_container_loaded(
         )
 
     container.status = "loaded"
-    container.updated_at = datetime.utcnow()
+    container.updated_at = datetime.now(UTC).replace(tzinfo=None)
     await db.flush()
 
     await log_activity(
@@ -786,11 +937,12 @@ async def seal_container(
 
     container.status = "sealed"
     container.seal_number = body.seal_number
-    container.sealed_at = datetime.utcnow()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    container.sealed_at = now
     container.sealed_by = user.full_name
     if body.temp_setpoint_c is not None:
         container.temp_setpoint_c = body.temp_setpoint_c
-    container.updated_at = datetime.utcnow()
+    container.updated_at = now
     await db.flush()
 
     await log_activity(
@@ -818,8 +970,9 @@ async def dispatch_container(
         )
 
     container.status = "dispatched"
-    container.dispatched_at = datetime.utcnow()
-    container.updated_at = datetime.utcnow()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    container.dispatched_at = now
+    container.updated_at = now
     await db.flush()
 
     await log_activity(
@@ -857,7 +1010,7 @@ async def export_container(
         container.etd = body.etd
     if body.eta is not None:
         container.eta = body.eta
-    container.updated_at = datetime.utcnow()
+    container.updated_at = datetime.now(UTC).replace(tzinfo=None)
     await db.flush()
 
     await log_activity(
@@ -885,8 +1038,9 @@ async def arrive_container(
         )
 
     container.status = "arrived"
-    container.arrived_at = datetime.utcnow()
-    container.updated_at = datetime.utcnow()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    container.arrived_at = now
+    container.updated_at = now
     await db.flush()
 
     await log_activity(
@@ -913,8 +1067,9 @@ async def deliver_container(
         )
 
     container.status = "delivered"
-    container.delivered_at = datetime.utcnow()
-    container.updated_at = datetime.utcnow()
+    now = datetime.now(UTC).replace(tzinfo=None)
+    container.delivered_at = now
+    container.updated_at = now
     await db.flush()
 
     await log_activity(
@@ -960,7 +1115,7 @@ async def revert_container_status(
         container.dispatched_at = None
     elif old_status == "arrived":
         container.arrived_at = None
-    container.updated_at = datetime.utcnow()
+    container.updated_at = datetime.now(UTC).replace(tzinfo=None)
     await db.flush()
 
     await log_activity(
@@ -1,7 +1,8 @@
 """Tenant-scoped grower routes — lightweight list for dropdowns + CRUD."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.deps import require_onboarded, require_permission
@@ -10,8 +11,8 @@ from app.database import get_tenant_db
 from app.models.public.user import User
 from app.models.tenant.batch import Batch
 from app.models.tenant.grower import Grower
-from app.schemas.common import PaginatedResponse
-from app.utils.cache import invalidate_cache
+from app.schemas.common import PaginatedResponse, construct_from_orm, schema_columns
+from app.utils.cache import invalidate_grower_idmap
 
 from pydantic import BaseModel
 
@@ -56,6 +57,10 @@ class GrowerUpdate(BaseModel):
 
 router = APIRouter()
 
+_GROWER_OUT_COLUMNS = schema_columns(Grower, GrowerOut)
+_GROWER_BY_ID_STMT = select(Grower).where(Grower.id == bindparam("grower_id"))
+_GROWER_OUT_BY_ID_STMT = select(*_GROWER_OUT_COLUMNS).where(Grower.id == bindparam("grower_id"))
+
 
 @router.get("/", response_model=PaginatedResponse[GrowerOut])
 async def list_growers(
@@ -67,25 +72,31 @@ async def list_growers(
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
     """List growers scoped to user's packhouse(s)."""
-    base = select(Grower)
+    base = select(*_GROWER_OUT_COLUMNS)
     if packhouse_scope is not None:
         base = base.where(Grower.packhouse_id.in_(packhouse_scope))
 
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = await db.scalar(count_stmt) or 0
-
-    items_stmt = base.order_by(Grower.name).limit(limit).offset(offset)
+    # One round trip: the filtered total rides along as a window column.
+    items_stmt = (
+        base.add_columns(func.count().over().label("total"))
+        .order_by(Grower.name)
+        .limit(limit)
+        .offset(offset)
+    )
     result = await db.execute(items_stmt)
-    items = result.scalars().all()
+    items = [dict(row) for row in result.mappings()]
+    total = items[0]["total"] if items else 0
+    for item in items:
+        del item["total"]
+    if not items and offset > 0:
+        total = await db.scalar(base.with_only_columns(func.count(Grower.id))) or 0
 
-    items_out = [GrowerOut.model_validate(item) for item in items]
-
-    return PaginatedResponse(
-        items=items_out,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+    return ORJSONResponse({
+        "items": items,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
 
 
 @router.get("/{grower_id}", response_model=GrowerOut)
@@ -96,13 +107,13 @@ async def get_grower(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(Grower).where(Grower.id == grower_id))
-    grower = result.scalar_one_or_none()
+    result = await db.execute(_GROWER_OUT_BY_ID_STMT, {"grower_id": grower_id})
+    grower = result.mappings().one_or_none()
     if not grower:
         raise HTTPException(status_code=404, detail="Grower not found")
-    if packhouse_scope is not None and grower.packhouse_id not in packhouse_scope:
+    if packhouse_scope is not None and grower["packhouse_id"] not in packhouse_scope:
         raise HTTPException(status_code=404, detail="Grower not found")
-    return GrowerOut.model_validate(grower)
+    return ORJSONResponse(dict(grower))
 
 
 @router.patch("/{grower_id}", response_model=GrowerOut)
@@ -114,7 +125,7 @@ async def update_grower(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(Grower).where(Grower.id == grower_id))
+    result = await db.execute(_GROWER_BY_ID_STMT, {"grower_id": grower_id})
     grower = result.scalar_one_or_none()
     if not grower:
         raise HTTPException(status_code=404, detail="Grower not found")
@@ -133,8 +144,8 @@ async def update_grower(
 
     await db.flush()
     await db.refresh(grower)
-    await invalidate_cache("growers:*")
-    return GrowerOut.model_validate(grower)
+    invalidate_grower_idmap(db)
+    return construct_from_orm(GrowerOut, grower)
 
 
 @router.delete("/{grower_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -145,7 +156,7 @@ async def delete_grower(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(Grower).where(Grower.id == grower_id))
+    result = await db.execute(_GROWER_BY_ID_STMT, {"grower_id": grower_id})
     grower = result.scalar_one_or_none()
     if not grower:
         raise HTTPException(status_code=404, detail="Grower not found")
@@ -168,4 +179,4 @@ async def delete_grower(
 
     await db.delete(grower)
     await db.flush()
-    await invalidate_cache("growers:*")
+    invalidate_grower_idmap(db)
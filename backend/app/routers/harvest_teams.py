@@ -1,8 +1,9 @@
 """Tenant-scoped harvest team routes — list, get, create, update, delete."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.deps import require_onboarded, require_permission
@@ -11,7 +12,7 @@ from app.database import get_tenant_db
 from app.models.public.user import User
 from app.models.tenant.batch import Batch
 from app.models.tenant.harvest_team import HarvestTeam
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, construct_from_orm, schema_columns
 
 
 # ── Schemas ──────────────────────────────────────────────────
@@ -67,6 +68,12 @@ class HarvestTeamUpdate(BaseModel):
 
 router = APIRouter()
 
+_HARVEST_TEAM_OUT_COLUMNS = schema_columns(HarvestTeam, HarvestTeamOut)
+_HARVEST_TEAM_BY_ID_STMT = select(HarvestTeam).where(HarvestTeam.id == bindparam("team_id"))
+_HARVEST_TEAM_OUT_BY_ID_STMT = (
+    select(*_HARVEST_TEAM_OUT_COLUMNS).where(HarvestTeam.id == bindparam("team_id"))
+)
+
 
 @router.get("/", response_model=PaginatedResponse[HarvestTeamOut])
 async def list_harvest_teams(
@@ -76,18 +83,26 @@ async def list_harvest_teams(
     _user: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    base = select(HarvestTeam)
+    base = select(*_HARVEST_TEAM_OUT_COLUMNS)
     if packhouse_scope is not None:
         base = base.where(HarvestTeam.packhouse_id.in_(packhouse_scope))
 
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = await db.scalar(count_stmt) or 0
-
-    items_stmt = base.order_by(HarvestTeam.name).limit(limit).offset(offset)
+    # One round trip: the filtered total rides along as a window column.
+    items_stmt = (
+        base.add_columns(func.count().over().label("total"))
+        .order_by(HarvestTeam.name)
+        .limit(limit)
+        .offset(offset)
+    )
     result = await db.execute(items_stmt)
-    items = [HarvestTeamOut.model_validate(t) for t in result.scalars().all()]
+    items = [dict(row) for row in result.mappings()]
+    total = items[0]["total"] if items else 0
+    for item in items:
+        del item["total"]
+    if not items and offset > 0:
+        total = await db.scalar(base.with_only_columns(func.count(HarvestTeam.id))) or 0
 
-    return PaginatedResponse(items=items, total=total, limit=limit, offset=offset)
+    return ORJSONResponse({"items": items, "total": total, "limit": limit, "offset": offset})
 
 
 @router.get("/{team_id}", response_model=HarvestTeamOut)
@@ -97,13 +112,13 @@ async def get_harvest_team(
     _user: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(HarvestTeam).where(HarvestTeam.id == team_id))
-    team = result.scalar_one_or_none()
+    result = await db.execute(_HARVEST_TEAM_OUT_BY_ID_STMT, {"team_id": team_id})
+    team = result.mappings().one_or_none()
     if not team:
         raise HTTPException(status_code=404, detail="Harvest team not found")
-    if packhouse_scope is not None and team.packhouse_id not in packhouse_scope:
+    if packhouse_scope is not None and team["packhouse_id"] not in packhouse_scope:
         raise HTTPException(status_code=404, detail="Harvest team not found")
-    return HarvestTeamOut.model_validate(team)
+    return ORJSONResponse(dict(team))
 
 
 @router.post("/", response_model=HarvestTeamOut, status_code=status.HTTP_201_CREATED)
@@ -127,7 +142,7 @@ async def create_harvest_team(
     db.add(team)
     await db.flush()
     await db.refresh(team)
-    return HarvestTeamOut.model_validate(team)
+    return construct_from_orm(HarvestTeamOut, team)
 
 
 @router.patch("/{team_id}", response_model=HarvestTeamOut)
@@ -139,7 +154,7 @@ async def update_harvest_team(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(HarvestTeam).where(HarvestTeam.id == team_id))
+    result = await db.execute(_HARVEST_TEAM_BY_ID_STMT, {"team_id": team_id})
     team = result.scalar_one_or_none()
     if not team:
         raise HTTPException(status_code=404, detail="Harvest team not found")
@@ -152,7 +167,7 @@ async def update_harvest_team(
 
     await db.flush()
     await db.refresh(team)
-    return HarvestTeamOut.model_validate(team)
+    return construct_from_orm(HarvestTeamOut, team)
 
 
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -163,7 +178,7 @@ async def delete_harvest_team(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    result = await db.execute(select(HarvestTeam).where(HarvestTeam.id == team_id))
+    result = await db.execute(_HARVEST_TEAM_BY_ID_STMT, {"team_id": team_id})
     team = result.scalar_one_or_none()
     if not team:
         raise HTTPException(status_code=404, detail="Harvest team not found")
@@ -8,10 +8,12 @@ Endpoints:
     DELETE /api/lots/{lot_id}                Soft-delete a lot
 """
 
+import asyncio
 import uuid
+from collections import Counter
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import lazyload, selectinload
 
@@ -24,7 +26,11 @@ from app.models.tenant.lot import Lot
 from app.models.tenant.packaging_stock import PackagingMovement, PackagingStock
 from app.models.tenant.pallet import PalletLot
 from app.models.tenant.product_config import BoxSize
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import (
+    CursorPaginatedResponse,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from app.utils.locks import get_lot_locks, LOT_QUANTITY_FIELDS
 from app.schemas.lot import (
     LotFromBatchItem,
@@ -34,51 +40,59 @@ from app.schemas.lot import (
     LotsFromBatchRequest,
 )
 from app.utils.activity import log_activity
-from app.utils.numbering import generate_code, generate_codes
+from app.utils.ids import uuid7
+from app.utils.numbering import generate_codes
 
 router = APIRouter()
 
+# Stock rows are only adjusted here — skip their selectin relationships
+_STOCK_NO_RELATIONS = (
+    lazyload(PackagingStock.movements),
+    lazyload(PackagingStock.box_size),
+    lazyload(PackagingStock.pallet_type),
+)
+
+# Below this many lots the thread hop costs more than building inline.
+_THREADED_SERIALIZE_MIN = 32
+
 
 async def _adjust_packaging_stock(
     db: AsyncSession,
     box_size_id: str,
+    packhouse_id: str | None,
     quantity: int,
     movement_type: str,
     user_id: str,
     reference_id: str | None = None,
-    _stock_cache: dict[str, "PackagingStock"] | None = None,
 ) -> None:
     """Adjust packaging stock for a box size. Positive = add, negative = deduct.
 
-    Pass _stock_cache to reuse already-fetched stock records across calls.
+    Uses the same (box size, packhouse) row as _consume_packaging_stock,
+    creating it if missing.
     """
-    stock = _stock_cache.get(box_size_id) if _stock_cache is not None else None
-    if stock is None:
-        result = await db.execute(
-            select(PackagingStock)
-            .where(PackagingStock.box_size_id == box_size_id)
-            .options(
-                lazyload(PackagingStock.movements),
-                lazyload(PackagingStock.box_size),
-                lazyload(PackagingStock.pallet_type),
-            )
+    result = await db.execute(
+        select(PackagingStock)
+        .where(
+            PackagingStock.box_size_id == box_size_id,
+            PackagingStock.packhouse_id == packhouse_id,
         )
-        stock = result.scalar_one_or_none()
-        if not stock:
-            stock = PackagingStock(
-                id=str(uuid.uuid4()),
-                box_size_id=box_size_id,
-                current_quantity=0,
-            )
-            db.add(stock)
-            await db.flush()
-        if _stock_cache is not None:
-            _stock_cache[box_size_id] = stock
+        .options(*_STOCK_NO_RELATIONS)
+    )
+    stock = result.scalar_one_or_none()
+    if not stock:
+        stock = PackagingStock(
+            id=str(uuid.uuid4()),
+            box_size_id=box_size_id,
+            packhouse_id=packhouse_id,
+            current_quantity=0,
+        )
+        db.add(stock)
+        await db.flush()
 
     stock.current_quantity += quantity
 
     movement = PackagingMovement(
-        id=str(uuid.uuid4()),
+        id=uuid7(),
         stock_id=stock.id,
         movement_type=movement_type,
         quantity=quantity,
@@ -89,6 +103,66 @@ async def _adjust_packaging_stock(
     db.add(movement)
 
 
+async def _consume_packaging_stock(
+    db: AsyncSession, lot_rows: list[dict], packhouse_id: str, user_id: str,
+) -> None:
+    """Deduct packaging stock for newly created lots in one pass.
+
+    Stock is held per (box size, packhouse), so only the batch's packhouse
+    rows are touched.  Loads the stock rows for every box size used with a
+    single SELECT, creates any missing ones, applies one quantity change per box size and
+    inserts a consumption movement per lot in one multi-row INSERT.
+    """
+    consuming = [row for row in lot_rows if row["box_size_id"] and row["carton_count"] > 0]
+    if not consuming:
+        return
+
+    consumed: Counter[str] = Counter()
+    for row in consuming:
+        consumed[row["box_size_id"]] += row["carton_count"]
+
+    result = await db.execute(
+        select(PackagingStock)
+        .where(
+            PackagingStock.box_size_id.in_(consumed),
+            PackagingStock.packhouse_id == packhouse_id,
+        )
+        .options(*_STOCK_NO_RELATIONS)
+    )
+    stocks = {stock.box_size_id: stock for stock in result.scalars()}
+    for box_size_id in consumed.keys() - stocks.keys():
+        stock = PackagingStock(
+            id=str(uuid.uuid4()),
+            box_size_id=box_size_id,
+            packhouse_id=packhouse_id,
+            current_quantity=0,
+        )
+        db.add(stock)
+        stocks[box_size_id] = stock
+
+    for box_size_id, cartons in consumed.items():
+        stocks[box_size_id].current_quantity -= cartons
+
+    # Autoflushes the stock rows above before the movements reference them
+    await db.execute(insert(PackagingMovement), [
+        {
+            "id": uuid7(),
+            "stock_id": stocks[row["box_size_id"]].id,
+            "movement_type": "consumption",
+            "quantity": -row["carton_count"],
+            "reference_type": "lot",
+            "reference_id": row["id"],
+            "recorded_by": user_id,
+        }
+        for row in consuming
+    ])
+
+
+def _lots_out(lots) -> list[LotOut]:
+    """Pure CPU work — run via ``asyncio.to_thread`` for large lists."""
+    return [LotOut.from_orm_with_names(lot) for lot in lots]
+
+
 # ── Create lots from batch ───────────────────────────────────
 
 @router.post(
@@ -134,51 +208,43 @@ async def create_lots_from_batch(
     # Generate all lot codes in one batch (2 DB queries instead of 2N)
     lot_codes = await generate_codes(db, "lot", len(body.lots), batch_code=batch.batch_code)
 
-    created_lots = []
+    lot_rows = []
     for i, item in enumerate(body.lots):
         # Auto-calculate weight: carton_count × box weight (if box_size provided)
         weight_kg = item.weight_kg
         if item.box_size_id and item.box_size_id in box_size_map:
             weight_kg = item.carton_count * box_size_map[item.box_size_id]
 
-        lot = Lot(
-            id=str(uuid.uuid4()),
-            lot_code=lot_codes[i],
-            batch_id=batch.id,
-            grower_id=batch.grower_id,
-            packhouse_id=batch.packhouse_id,
-            fruit_type=batch.fruit_type,
-            variety=batch.variety,
-            grade=item.grade,
-            size=item.size,
-            box_size_id=item.box_size_id,
-            weight_kg=weight_kg,
-            carton_count=item.carton_count,
-            pack_date=item.pack_date,
-            waste_kg=item.waste_kg or 0.0,
-            waste_reason=item.waste_reason,
-            notes=item.notes,
-            packed_by=user.id,
-            status="created",
-        )
-        db.add(lot)
-        created_lots.append(lot)
+        lot_rows.append({
+            "id": uuid7(),
+            "lot_code": lot_codes[i],
+            "batch_id": batch.id,
+            "grower_id": batch.grower_id,
+            "packhouse_id": batch.packhouse_id,
+            "fruit_type": batch.fruit_type,
+            "variety": batch.variety,
+            "grade": item.grade,
+            "size": item.size,
+            "box_size_id": item.box_size_id,
+            "weight_kg": weight_kg,
+            "carton_count": item.carton_count,
+            "pack_date": item.pack_date,
+            "waste_kg": item.waste_kg or 0.0,
+            "waste_reason": item.waste_reason,
+            "notes": item.notes,
+            "packed_by": user.id,
+            "status": "created",
+        })
+
+    # One multi-row INSERT instead of an ORM object (and unit-of-work
+    # bookkeeping) per lot; the response re-query below loads them back.
+    await db.execute(insert(Lot), lot_rows)
 
     # Update batch status to packing
     if batch.status == "received":
         batch.status = "packing"
 
-    await db.flush()
-
-    # Deduct packaging stock — cache stock records to avoid repeated lookups
-    stock_cache: dict[str, PackagingStock] = {}
-    for lot in created_lots:
-        if lot.box_size_id and lot.carton_count > 0:
-            await _adjust_packaging_stock(
-                db, lot.box_size_id, -lot.carton_count,
-                "consumption", user.id, lot.id,
-                _stock_cache=stock_cache,
-            )
+    await _consume_packaging_stock(db, lot_rows, batch.packhouse_id, user.id)
     await db.flush()
 
     # Auto-recalculate batch waste
@@ -198,7 +264,7 @@ async def create_lots_from_batch(
         await db.flush()
 
     # Re-query with relationships for response
-    lot_ids = [lot.id for lot in created_lots]
+    lot_ids = [row["id"] for row in lot_rows]
     result = await db.execute(
         select(Lot)
         .where(Lot.id.in_(lot_ids))
@@ -210,34 +276,46 @@ async def create_lots_from_batch(
     )
     lots = result.scalars().all()
 
-    lot_codes = [lot.lot_code for lot in created_lots]
     await log_activity(
         db, user,
         action="created",
         entity_type="lot",
-        entity_id=created_lots[0].id if len(created_lots) == 1 else None,
+        entity_id=lot_ids[0] if len(lot_ids) == 1 else None,
         entity_code=lot_codes[0] if len(lot_codes) == 1 else f"{lot_codes[0]}…+{len(lot_codes)-1}",
-        summary=f"Created {len(created_lots)} lot(s) from batch {batch.batch_code}",
+        summary=f"Created {len(lot_ids)} lot(s) from batch {batch.batch_code}",
         details={"lot_codes": lot_codes, "batch_code": batch.batch_code},
     )
 
-    return [LotOut.from_orm_with_names(lot) for lot in lots]
+    # Large splits are built in a worker thread so the event loop keeps
+    # serving other requests; every attribute read here is already loaded.
+    if len(lots) > _THREADED_SERIALIZE_MIN:
+        return await asyncio.to_thread(_lots_out, lots)
+    return _lots_out(lots)
 
 
 # ── List lots ────────────────────────────────────────────────
 
-@router.get("/", response_model=PaginatedResponse[LotSummary])
+@router.get("/", response_model=CursorPaginatedResponse[LotSummary])
 async def list_lots(
     batch_id: str | None = Query(None),
     lot_status: str | None = Query(None, alias="status"),
     grade: str | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_permission("batch.read")),
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
+    """List lots newest first.
+
+    Pass the previous page's ``next_cursor`` as ``cursor`` to seek on
+    (created_at, id) instead of scanning past ``offset`` rows; ``offset``
+    is ignored when a cursor is given.  ``include_total=false`` skips the
+    COUNT over the filtered set.
+    """
     base_stmt = select(Lot).where(Lot.is_deleted == False)  # noqa: E712
 
     if packhouse_scope is not None:
@@ -250,17 +328,25 @@ async def list_lots(
     if grade:
         base_stmt = base_stmt.where(Lot.grade == grade)
 
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total = await db.scalar(count_stmt) or 0
-
-    items_stmt = (
-        base_stmt
-        .order_by(Lot.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
-    result = await db.execute(items_stmt)
-    items = result.scalars().all()
+    total = None
+    if include_total:
+        total = await db.scalar(base_stmt.with_only_columns(func.count(Lot.id))) or 0
+
+    items_stmt = base_stmt.order_by(Lot.created_at.desc(), Lot.id.desc())
+    if cursor:
+        try:
+            cursor_ts, cursor_id = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        items_stmt = items_stmt.where(tuple_(Lot.created_at, Lot.id) < tuple_(cursor_ts, cursor_id))
+    elif offset:
+        items_stmt = items_stmt.offset(offset)
+
+    # Fetch limit+1 to detect has_more without another query
+    result = await db.execute(items_stmt.limit(limit + 1))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > limit
+    items = rows[:limit]
 
     # Compute palletized box counts per lot
     lot_ids = [lot.id for lot in items]
@@ -279,11 +365,16 @@ async def list_lots(
         if s.palletized_boxes > 0:
             s.locked_fields = LOT_QUANTITY_FIELDS
 
-    return PaginatedResponse(
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_keyset_cursor(items[-1].created_at, items[-1].id)
+
+    return CursorPaginatedResponse(
         items=summaries,
         total=total,
         limit=limit,
-        offset=offset,
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
 
 
@@ -364,29 +455,28 @@ async def update_lot(
 
     # Auto-recalculate weight if carton_count or box_size_id changed
     recalc = "carton_count" in updates or "box_size_id" in updates
-    if recalc:
-        # Resolve the box size (may have just been changed)
-        effective_box_size_id = lot.box_size_id
-        if effective_box_size_id:
-            bs_result = await db.execute(
-                select(BoxSize).where(BoxSize.id == effective_box_size_id)
-            )
-            bs = bs_result.scalar_one_or_none()
-            if bs:
-                lot.weight_kg = lot.carton_count * bs.weight_kg
+    if recalc and lot.box_size_id:
+        # Unchanged box size: reuse the one loaded with the lot.  A new one
+        # goes through the identity map before falling back to a SELECT.
+        if lot.box_size_id == old_box_size_id:
+            bs = lot.box_size
+        else:
+            bs = await db.get(BoxSize, lot.box_size_id)
+        if bs:
+            lot.weight_kg = lot.carton_count * bs.weight_kg
 
     # Adjust packaging stock if carton_count or box_size_id changed
     if "carton_count" in updates or "box_size_id" in updates:
         # Reverse old consumption (if there was one)
         if old_box_size_id and old_carton_count > 0:
             await _adjust_packaging_stock(
-                db, old_box_size_id, old_carton_count,
+                db, old_box_size_id, lot.packhouse_id, old_carton_count,
                 "reversal", user.id, lot.id,
             )
         # Record new consumption
         if lot.box_size_id and lot.carton_count > 0:
             await _adjust_packaging_stock(
-                db, lot.box_size_id, -lot.carton_count,
+                db, lot.box_size_id, lot.packhouse_id, -lot.carton_count,
                 "consumption", user.id, lot.id,
             )
 
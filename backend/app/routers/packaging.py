@@ -9,18 +9,38 @@ Endpoints:
 """
 
 import uuid
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload, raiseload, selectinload
 
 from app.auth.deps import require_onboarded, require_permission
 from app.auth.packhouse_scope import get_packhouse_scope
+from app.config import settings
 from app.database import get_tenant_db
 from app.models.public.user import User
 from app.models.tenant.packaging_stock import PackagingMovement, PackagingStock
 from app.models.tenant.product_config import BoxSize, PalletType
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import (
+    CursorPaginatedResponse,
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+)
 from app.schemas.packaging import (
     PackagingAdjustmentRequest,
     PackagingMovementOut,
@@ -29,9 +49,24 @@ from app.schemas.packaging import (
     PackagingWriteOffRequest,
     UpdateMinStockRequest,
 )
+from app.utils.ids import uuid7
 
 router = APIRouter()
 
+# Every stock load goes through _enrich_stock, which reads box_size and
+# pallet_type but never the movements ledger — so skip that selectin.
+# In debug, any other relationship access raises instead of emitting IO.
+_STOCK_LOAD = (
+    selectinload(PackagingStock.box_size),
+    selectinload(PackagingStock.pallet_type),
+    raiseload("*") if settings.debug else lazyload(PackagingStock.movements),
+)
+
+_SEED_STOCK_COLUMNS = [
+    "id", "box_size_id", "pallet_type_id", "packhouse_id",
+    "current_quantity", "min_stock_level", "created_at", "updated_at",
+]
+
 
 # ── Helpers ──────────────────────────────────────────────────
 
@@ -49,41 +84,151 @@ def _enrich_stock(stock: PackagingStock) -> PackagingStockOut:
     return out
 
 
+def _seed_missing_stock_stmt(packhouse_id: str | None):
+    """INSERT a zero-quantity stock row for each box size / pallet type
+    without one, in a single statement.
+
+    With a packhouse, "without one" means in that packhouse; without
+    (admin), it means in any packhouse — matching the global records the
+    admin view has always created.  ON CONFLICT covers concurrent requests
+    racing to seed the same packhouse.  It does not cover the admin path:
+    its rows have a NULL packhouse_id, which the (box size / pallet type,
+    packhouse) unique constraints treat as distinct, so two admin requests
+    seeding at once can each insert a global row.
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+
+    def missing(ref_table, ref_id, stock_col):
+        on = stock_col == ref_id
+        if packhouse_id is not None:
+            on = and_(on, PackagingStock.packhouse_id == packhouse_id)
+        ids = {"box_size_id": null(), "pallet_type_id": null(), stock_col.key: ref_id}
+        return (
+            select(
+                cast(func.gen_random_uuid(), String),
+                ids["box_size_id"],
+                ids["pallet_type_id"],
+                literal(packhouse_id, String),
+                literal(0),
+                literal(0),
+                literal(now, DateTime),
+                literal(now, DateTime),
+            )
+            .select_from(ref_table)
+            .outerjoin(PackagingStock, on)
+            .where(PackagingStock.id.is_(None))
+        )
+
+    rows = union_all(
+        missing(BoxSize, BoxSize.id, PackagingStock.box_size_id),
+        missing(PalletType, PalletType.id, PackagingStock.pallet_type_id),
+    )
+    return (
+        pg_insert(PackagingStock)
+        .from_select(_SEED_STOCK_COLUMNS, rows)
+        .on_conflict_do_nothing()
+    )
+
+
 async def _get_or_create_stock(
     db: AsyncSession,
     box_size_id: str | None,
     pallet_type_id: str | None,
+    packhouse_id: str | None,
 ) -> PackagingStock:
-    """Find existing stock record or create one."""
+    """Find existing stock record or create one.
+
+    Stock is held per (box size / pallet type, packhouse), the same row
+    lots consume from; ``packhouse_id=None`` is the admin-level record.
+    One query checks that the box size / pallet type exists (404 if not)
+    and outer-joins its stock row.  A new record is linked to the loaded
+    box size / pallet type, so _enrich_stock needs no reload.
+    """
     if box_size_id:
-        result = await db.execute(
-            select(PackagingStock).where(PackagingStock.box_size_id == box_size_id)
-        )
+        ref_model, ref_id, stock_col = BoxSize, box_size_id, PackagingStock.box_size_id
+        not_found = "Box size not found"
     elif pallet_type_id:
-        result = await db.execute(
-            select(PackagingStock).where(PackagingStock.pallet_type_id == pallet_type_id)
-        )
+        ref_model, ref_id, stock_col = PalletType, pallet_type_id, PackagingStock.pallet_type_id
+        not_found = "Pallet type not found"
     else:
         raise HTTPException(status_code=400, detail="Provide box_size_id or pallet_type_id")
 
-    stock = result.scalar_one_or_none()
+    result = await db.execute(
+        select(ref_model, PackagingStock)
+        .outerjoin(
+            PackagingStock,
+            and_(stock_col == ref_model.id, PackagingStock.packhouse_id == packhouse_id),
+        )
+        .where(ref_model.id == ref_id)
+        .options(*_STOCK_LOAD)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail=not_found)
+
+    ref, stock = row
     if not stock:
         stock = PackagingStock(
-            id=str(uuid.uuid4()),
-            box_size_id=box_size_id,
-            pallet_type_id=pallet_type_id,
-            current_quantity=0,
+            id=str(uuid.uuid4()), packhouse_id=packhouse_id, current_quantity=0,
         )
+        if box_size_id:
+            stock.box_size = ref
+        else:
+            stock.pallet_type = ref
         db.add(stock)
         await db.flush()
-        # Reload with relationships
-        result = await db.execute(
-            select(PackagingStock).where(PackagingStock.id == stock.id)
-        )
-        stock = result.scalar_one()
     return stock
 
 
+def _stock_update_stmt(stock_id: str, packhouse_scope: list[str] | None):
+    """UPDATE ... RETURNING for one in-scope stock row; caller adds .values()."""
+    stmt = (
+        update(PackagingStock)
+        .where(PackagingStock.id == stock_id)
+        .returning(PackagingStock)
+        .options(*_STOCK_LOAD)
+        .execution_options(populate_existing=True)
+    )
+    if packhouse_scope is not None:
+        stmt = stmt.where(PackagingStock.packhouse_id.in_(packhouse_scope))
+    return stmt
+
+
+async def _apply_stock_delta(
+    db: AsyncSession,
+    stock_id: str,
+    delta: int,
+    packhouse_scope: list[str] | None,
+    action: str,
+) -> PackagingStock:
+    """Add ``delta`` to a stock row's quantity in one UPDATE ... RETURNING.
+
+    The no-negative-stock rule sits in the WHERE clause, so two concurrent
+    movements can't both pass a stale check.  Only when no row comes back
+    is the row read again, to tell a 404 from a 400.
+    """
+    new_qty = PackagingStock.current_quantity + delta
+    stmt = (
+        _stock_update_stmt(stock_id, packhouse_scope)
+        .where(new_qty >= 0)
+        .values(current_quantity=new_qty)
+    )
+    stock = (await db.execute(stmt)).scalar_one_or_none()
+    if stock:
+        return stock
+
+    current = select(PackagingStock.current_quantity).where(PackagingStock.id == stock_id)
+    if packhouse_scope is not None:
+        current = current.where(PackagingStock.packhouse_id.in_(packhouse_scope))
+    quantity = await db.scalar(current)
+    if quantity is None:
+        raise HTTPException(status_code=404, detail="Stock record not found")
+    raise HTTPException(
+        status_code=400,
+        detail=f"{action} would result in negative stock ({quantity + delta})",
+    )
+
+
 # ── GET /api/packaging/stock ────────────────────────────────
 
 @router.get("/stock", response_model=list[PackagingStockOut])
@@ -97,64 +242,13 @@ async def get_stock_levels(
     Automatically creates stock records for any box sizes or pallet types
     that don't have one yet (only when scoped to a single packhouse).
     """
-    # Auto-create stock records only when scoped to exactly one packhouse
-    if packhouse_scope is not None and len(packhouse_scope) == 1:
-        ph_id = packhouse_scope[0]
-        box_sizes = (await db.execute(select(BoxSize))).scalars().all()
-        pallet_types = (await db.execute(select(PalletType))).scalars().all()
-
-        existing_stmt = select(PackagingStock).where(
-            PackagingStock.packhouse_id == ph_id
-        )
-        existing = (await db.execute(existing_stmt)).scalars().all()
-        existing_box_ids = {s.box_size_id for s in existing if s.box_size_id}
-        existing_pallet_ids = {s.pallet_type_id for s in existing if s.pallet_type_id}
-
-        for bs in box_sizes:
-            if bs.id not in existing_box_ids:
-                db.add(PackagingStock(
-                    id=str(uuid.uuid4()),
-                    box_size_id=bs.id,
-                    packhouse_id=ph_id,
-                    current_quantity=0,
-                ))
-        for pt in pallet_types:
-            if pt.id not in existing_pallet_ids:
-                db.add(PackagingStock(
-                    id=str(uuid.uuid4()),
-                    pallet_type_id=pt.id,
-                    packhouse_id=ph_id,
-                    current_quantity=0,
-                ))
-        await db.flush()
-    elif packhouse_scope is None:
-        # Admin: auto-create without packhouse_id (global stock records)
-        box_sizes = (await db.execute(select(BoxSize))).scalars().all()
-        pallet_types = (await db.execute(select(PalletType))).scalars().all()
-
-        existing = (await db.execute(select(PackagingStock))).scalars().all()
-        existing_box_ids = {s.box_size_id for s in existing if s.box_size_id}
-        existing_pallet_ids = {s.pallet_type_id for s in existing if s.pallet_type_id}
-
-        for bs in box_sizes:
-            if bs.id not in existing_box_ids:
-                db.add(PackagingStock(
-                    id=str(uuid.uuid4()),
-                    box_size_id=bs.id,
-                    current_quantity=0,
-                ))
-        for pt in pallet_types:
-            if pt.id not in existing_pallet_ids:
-                db.add(PackagingStock(
-                    id=str(uuid.uuid4()),
-                    pallet_type_id=pt.id,
-                    current_quantity=0,
-                ))
-        await db.flush()
-    # else: multiple packhouses in scope — skip auto-creation
+    # Auto-create stock records only when scoped to exactly one packhouse;
+    # admins (no scope) get global records; multi-packhouse scope skips it.
+    if packhouse_scope is None or len(packhouse_scope) == 1:
+        ph_id = packhouse_scope[0] if packhouse_scope else None
+        await db.execute(_seed_missing_stock_stmt(ph_id))
 
-    # Re-query with relationships
-    stmt = select(PackagingStock)
+    stmt = select(PackagingStock).options(*_STOCK_LOAD)
     if packhouse_scope is not None:
         stmt = stmt.where(PackagingStock.packhouse_id.in_(packhouse_scope))
     result = await db.execute(stmt)
@@ -173,20 +267,13 @@ async def receive_packaging(
     _onboarded: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    """Import / receive packaging stock (opening balance or new delivery)."""
-    # Validate that the referenced box_size or pallet_type exists
-    if body.box_size_id:
-        bs = await db.execute(select(BoxSize).where(BoxSize.id == body.box_size_id))
-        if not bs.scalar_one_or_none():
-            raise HTTPException(status_code=404, detail="Box size not found")
-    elif body.pallet_type_id:
-        pt = await db.execute(select(PalletType).where(PalletType.id == body.pallet_type_id))
-        if not pt.scalar_one_or_none():
-            raise HTTPException(status_code=404, detail="Pallet type not found")
-    else:
-        raise HTTPException(status_code=400, detail="Provide box_size_id or pallet_type_id")
+    """Import / receive packaging stock (opening balance or new delivery).
 
-    stock = await _get_or_create_stock(db, body.box_size_id, body.pallet_type_id)
+    Lands in the packhouse's stock when scoped to exactly one packhouse,
+    otherwise in the admin-level record.
+    """
+    ph_id = packhouse_scope[0] if packhouse_scope and len(packhouse_scope) == 1 else None
+    stock = await _get_or_create_stock(db, body.box_size_id, body.pallet_type_id, ph_id)
 
     # Packhouse scope check
     if packhouse_scope is not None and stock.packhouse_id not in packhouse_scope:
@@ -196,7 +283,7 @@ async def receive_packaging(
 
     # Record movement
     movement = PackagingMovement(
-        id=str(uuid.uuid4()),
+        id=uuid7(),
         stock_id=stock.id,
         movement_type="receipt",
         quantity=body.quantity,
@@ -206,12 +293,6 @@ async def receive_packaging(
     )
     db.add(movement)
     await db.flush()
-
-    # Reload with relationships
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == stock.id)
-    )
-    stock = result.scalar_one()
     return _enrich_stock(stock)
 
 
@@ -227,18 +308,12 @@ async def update_min_stock(
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
     """Update the minimum stock level (low-stock alert threshold)."""
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == stock_id)
+    stmt = _stock_update_stmt(stock_id, packhouse_scope).values(
+        min_stock_level=body.min_stock_level
     )
-    stock = result.scalar_one_or_none()
+    stock = (await db.execute(stmt)).scalar_one_or_none()
     if not stock:
         raise HTTPException(status_code=404, detail="Stock record not found")
-
-    if packhouse_scope is not None and stock.packhouse_id not in packhouse_scope:
-        raise HTTPException(status_code=404, detail="Not found")
-
-    stock.min_stock_level = body.min_stock_level
-    await db.flush()
     return _enrich_stock(stock)
 
 
@@ -253,27 +328,12 @@ async def adjust_stock(
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
     """Manual stock correction (positive to add, negative to subtract)."""
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == body.stock_id)
+    stock = await _apply_stock_delta(
+        db, body.stock_id, body.quantity, packhouse_scope, "Adjustment",
     )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail="Stock record not found")
-
-    if packhouse_scope is not None and stock.packhouse_id not in packhouse_scope:
-        raise HTTPException(status_code=404, detail="Not found")
-
-    new_qty = stock.current_quantity + body.quantity
-    if new_qty < 0:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Adjustment would result in negative stock ({new_qty})",
-        )
-
-    stock.current_quantity = new_qty
 
     movement = PackagingMovement(
-        id=str(uuid.uuid4()),
+        id=uuid7(),
         stock_id=stock.id,
         movement_type="adjustment",
         quantity=body.quantity,
@@ -282,12 +342,6 @@ async def adjust_stock(
     )
     db.add(movement)
     await db.flush()
-
-    # Reload with relationships
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == stock.id)
-    )
-    stock = result.scalar_one()
     return _enrich_stock(stock)
 
 
@@ -302,24 +356,9 @@ async def write_off_stock(
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
     """Write off stock as lost, damaged, expired, etc."""
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == body.stock_id)
+    stock = await _apply_stock_delta(
+        db, body.stock_id, -body.quantity, packhouse_scope, "Write-off",
     )
-    stock = result.scalar_one_or_none()
-    if not stock:
-        raise HTTPException(status_code=404, detail="Stock record not found")
-
-    if packhouse_scope is not None and stock.packhouse_id not in packhouse_scope:
-        raise HTTPException(status_code=404, detail="Not found")
-
-    new_qty = stock.current_quantity - body.quantity
-    if new_qty < 0:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Write-off would result in negative stock ({new_qty})",
-        )
-
-    stock.current_quantity = new_qty
 
     # Build notes: "damaged: water damage on delivery" or just "damaged"
     note_text = body.reason
@@ -327,7 +366,7 @@ async def write_off_stock(
         note_text = f"{body.reason}: {body.notes}"
 
     movement = PackagingMovement(
-        id=str(uuid.uuid4()),
+        id=uuid7(),
         stock_id=stock.id,
         movement_type="write_off",
         quantity=-body.quantity,
@@ -336,30 +375,29 @@ async def write_off_stock(
     )
     db.add(movement)
     await db.flush()
-
-    # Reload with relationships
-    result = await db.execute(
-        select(PackagingStock).where(PackagingStock.id == stock.id)
-    )
-    stock = result.scalar_one()
     return _enrich_stock(stock)
 
 
 # ── GET /api/packaging/movements ────────────────────────────
 
-@router.get("/movements", response_model=PaginatedResponse[PackagingMovementOut])
+@router.get("/movements", response_model=CursorPaginatedResponse[PackagingMovementOut])
 async def list_movements(
     stock_id: str | None = Query(None),
     movement_type: str | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
     packhouse_scope: list[str] | None = Depends(get_packhouse_scope),
 ):
-    """List packaging movement history with optional filters."""
-    from sqlalchemy import func
+    """List packaging movement history with optional filters.
 
+    Newest first.  Pass ``next_cursor`` back as ``cursor`` to seek on
+    (recorded_at, id) instead of ``offset``; ``include_total=false`` skips
+    the COUNT.
+    """
     base = select(PackagingMovement)
     if packhouse_scope is not None:
         base = base.join(
@@ -370,21 +408,36 @@ async def list_movements(
     if movement_type:
         base = base.where(PackagingMovement.movement_type == movement_type)
 
-    count_result = await db.execute(
-        select(func.count()).select_from(base.subquery())
-    )
-    total = count_result.scalar() or 0
+    total = None
+    if include_total:
+        total = await db.scalar(base.with_only_columns(func.count(PackagingMovement.id))) or 0
+
+    items_stmt = base.order_by(PackagingMovement.recorded_at.desc(), PackagingMovement.id.desc())
+    if cursor:
+        try:
+            cursor_ts, cursor_id = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        items_stmt = items_stmt.where(
+            tuple_(PackagingMovement.recorded_at, PackagingMovement.id)
+            < tuple_(cursor_ts, cursor_id)
+        )
+    elif offset:
+        items_stmt = items_stmt.offset(offset)
 
-    items_result = await db.execute(
-        base.order_by(PackagingMovement.recorded_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
-    items = items_result.scalars().all()
+    items_result = await db.execute(items_stmt.limit(limit + 1))
+    rows = list(items_result.scalars().all())
+    has_more = len(rows) > limit
+    items = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_keyset_cursor(items[-1].recorded_at, items[-1].id)
 
-    return PaginatedResponse(
+    return CursorPaginatedResponse(
         items=[PackagingMovementOut.model_validate(m) for m in items],
         total=total,
         limit=limit,
-        offset=offset,
+        next_cursor=next_cursor,
+        has_more=has_more,
     )
@@ -50,6 +50,7 @@ from app.schemas.pallet import (
 )
 from app.utils.activity import log_activity
 from app.utils.cache import cached
+from app.utils.ids import uuid7
 from app.utils.locks import get_pallet_locks
 from app.utils.numbering import generate_code, generate_codes
 
@@ -140,7 +141,7 @@ async def _adjust_pallet_stock(
     stock.current_quantity += quantity
 
     movement = PackagingMovement(
-        id=str(uuid.uuid4()),
+        id=uuid7(),
         stock_id=stock.id,
         movement_type=movement_type,
         quantity=quantity,
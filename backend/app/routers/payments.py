@@ -17,6 +17,7 @@ Endpoints:
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,7 +33,7 @@ from app.models.tenant.lot import Lot
 from app.models.tenant.grower_payment import GrowerPayment
 from app.models.tenant.harvest_team import HarvestTeam
 from app.models.tenant.harvest_team_payment import HarvestTeamPayment
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import PaginatedResponse, schema_columns
 from app.schemas.payment import (
     GrowerPaymentCreate,
     GrowerPaymentOut,
@@ -498,14 +499,19 @@ class HarvestTeamItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+_HARVEST_TEAM_ITEM_COLUMNS = schema_columns(HarvestTeam, HarvestTeamItem)
+
+
 @router.get("/harvest-teams", response_model=list[HarvestTeamItem])
 async def list_harvest_teams(
     db: AsyncSession = Depends(get_tenant_db),
     _user: User = Depends(require_onboarded),
 ):
     """List all harvest teams (for payment form dropdowns)."""
-    result = await db.execute(select(HarvestTeam).order_by(HarvestTeam.name))
-    return [HarvestTeamItem.model_validate(t) for t in result.scalars().all()]
+    result = await db.execute(
+        select(*_HARVEST_TEAM_ITEM_COLUMNS).order_by(HarvestTeam.name)
+    )
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 # ══════════════════════════════════════════════════════════════
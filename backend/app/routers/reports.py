@@ -10,6 +10,7 @@ Endpoints:
 
 import csv
 import io
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -34,20 +35,35 @@ router = APIRouter()
 
 # ── Helpers ──────────────────────────────────────────────────
 
-def _csv_response(csv_text: str, filename: str) -> StreamingResponse:
+def _csv_response(chunks: Iterable[bytes], filename: str) -> StreamingResponse:
     return StreamingResponse(
-        iter([csv_text]),
+        chunks,
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
-def _rows_to_csv(headers: list[str], rows: list[list]) -> str:
+# Rows encoded per chunk when streaming a CSV report
+_CSV_CHUNK_ROWS = 1000
+
+
+def _iter_csv(headers: list[str], rows: Iterable[list]) -> Iterator[bytes]:
+    """Yield a CSV as UTF-8 byte chunks of up to _CSV_CHUNK_ROWS rows.
+
+    The report never exists as one string, so large exports aren't held
+    in memory twice (text + encoded body).
+    """
     buf = io.StringIO()
     writer = csv.writer(buf)
     writer.writerow(headers)
-    writer.writerows(rows)
-    return buf.getvalue()
+    for i, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if i % _CSV_CHUNK_ROWS == 0:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
 
 
 def _default_dates(
@@ -237,12 +253,12 @@ async def production_report(
             "Class 2 Lots", "Class 2 Cartons", "Returned Lots", "Returned (kg)",
             "Status", "Date",
         ]
-        csv_rows = [[r.batch_code, r.grower_name, r.grower_code or "", r.fruit_type,
+        csv_rows = ([r.batch_code, r.grower_name, r.grower_code or "", r.fruit_type,
                       r.variety or "", r.net_weight_kg or "", r.lot_count, r.carton_count,
                       r.waste_kg, r.class2_lots, r.class2_cartons, r.returned_lots,
-                      r.returned_kg, r.status, r.created_at] for r in rows]
+                      r.returned_kg, r.status, r.created_at] for r in rows)
         return _csv_response(
-            _rows_to_csv(headers, csv_rows),
+            _iter_csv(headers, csv_rows),
             f"production_report_{d_from}_{d_to}.csv",
         )
 
@@ -331,12 +347,12 @@ async def grower_summary_report(
             "Grower", "Code", "Deliveries", "Gross (kg)", "Net (kg)",
             "Waste (kg)", "Waste %", "Class 2 Cartons", "Class 2 (kg)", "Returned (kg)",
         ]
-        csv_rows = [[r.grower_name, r.grower_code or "", r.delivery_count,
+        csv_rows = ([r.grower_name, r.grower_code or "", r.delivery_count,
                       r.total_gross_kg, r.total_net_kg, r.total_waste_kg,
                       f"{r.waste_pct}%", r.class2_cartons, r.class2_kg,
-                      r.returned_kg] for r in rows]
+                      r.returned_kg] for r in rows)
         return _csv_response(
-            _rows_to_csv(headers, csv_rows),
+            _iter_csv(headers, csv_rows),
             f"grower_summary_{d_from}_{d_to}.csv",
         )
 
@@ -476,10 +492,10 @@ async def performance_report(
 
     if format == "csv":
         headers = ["Date", "Batches", "Lots", "Pallets", "Waste (kg)", "Cartons"]
-        csv_rows = [[r.date, r.batches_received, r.lots_packed, r.pallets_built,
-                      r.total_waste_kg, r.total_cartons] for r in rows]
+        csv_rows = ([r.date, r.batches_received, r.lots_packed, r.pallets_built,
+                      r.total_waste_kg, r.total_cartons] for r in rows)
         return _csv_response(
-            _rows_to_csv(headers, csv_rows),
+            _iter_csv(headers, csv_rows),
             f"performance_{d_from}_{d_to}.csv",
         )
 
@@ -648,7 +664,7 @@ async def packing_list(
                         lot.harvest_date or "", lot.carton_count, lot.weight_kg or "",
                     ])
         return _csv_response(
-            _rows_to_csv(headers, csv_rows),
+            _iter_csv(headers, csv_rows),
             f"packing_list_{container.container_number}.csv",
         )
 
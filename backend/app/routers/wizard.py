@@ -53,7 +53,7 @@ from app.schemas.wizard import (
     Step8Data,
     WizardProgress,
 )
-from app.utils.cache import invalidate_cache
+from app.utils.cache import invalidate_cache, invalidate_grower_idmap
 
 router = APIRouter()
 
@@ -349,6 +349,7 @@ async def save_step_4(
                 if not ref.scalar_one_or_none():
                     await db.delete(grower)
         await db.flush()
+        invalidate_grower_idmap(db)
 
     return await _finish_step(db, state, 4, body.model_dump(exclude_unset=True), complete, next_step=5)
 
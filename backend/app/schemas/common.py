@@ -1,9 +1,55 @@
 """Common schemas used across the application."""
 
-from typing import Generic, TypeVar
+import base64
+import binascii
+import functools
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
 from pydantic import BaseModel
+from sqlalchemy import inspect as sa_inspect
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+@functools.cache
+def _orm_fields(model_cls: type[BaseModel], orm_cls: type) -> tuple[str, ...]:
+    """Schema fields that map to a column attribute on ``orm_cls``."""
+    columns = sa_inspect(orm_cls).column_attrs.keys()
+    return tuple(name for name in model_cls.model_fields if name in columns)
+
+
+def construct_from_orm(model_cls: type[M], obj: Any, **overrides: Any) -> M:
+    """Build ``model_cls`` from an ORM row without re-validating it.
+
+    Column values come straight from the database and already have the
+    schema's types, so ``model_construct`` skips the validator pipeline.
+    Only column attributes are read (never relationships, so no lazy
+    loads); anything else — denormalized names, nested lists — is passed
+    as ``overrides``.  Fields left unset take their schema defaults.
+
+    Usage:
+        construct_from_orm(ContainerSummary, container, is_overdue=True)
+    """
+    values = {name: getattr(obj, name) for name in _orm_fields(model_cls, type(obj))}
+    values.update(overrides)
+    return model_cls.model_construct(**values)
+
+
+def schema_columns(orm_cls: type, model_cls: type[BaseModel]) -> list[Any]:
+    """Table columns backing every field of ``model_cls``, in field order.
+
+    Hot read endpoints select just these columns and return the row
+    mappings as an ORJSONResponse, skipping ORM hydration and response
+    validation; the route keeps ``response_model`` for the OpenAPI docs.
+    Raises KeyError if a field has no column, so the schema and the
+    query can't drift apart silently.
+
+    Usage:
+        _GROWER_OUT_COLUMNS = schema_columns(Grower, GrowerOut)
+    """
+    return [orm_cls.__table__.c[name] for name in model_cls.model_fields]
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -31,9 +77,32 @@ class CursorPaginatedResponse(BaseModel, Generic[T]):
 
     Uses `created_at` of the last item as the cursor for the next page.
     Constant-time performance regardless of page depth (no OFFSET scan).
+    `total` is None when the caller opted out of counting.
     """
     items: list[T]
-    total: int
+    total: int | None = None
     limit: int
     next_cursor: str | None = None
     has_more: bool
+
+
+def encode_keyset_cursor(created_at: datetime, row_id: str) -> str:
+    """Opaque cursor for the row after which the next page starts.
+
+    Pairs the sort timestamp with the primary key so rows sharing a
+    timestamp are neither skipped nor repeated across pages.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    """Inverse of ``encode_keyset_cursor``; raises ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    created_at, sep, row_id = raw.partition("|")
+    if not sep or not row_id:
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(created_at), row_id
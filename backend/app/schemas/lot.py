@@ -4,6 +4,7 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.schemas.common import construct_from_orm
 from app.schemas.validators import validate_flat_json_dict
 
 
@@ -124,7 +125,8 @@ class LotOut(BaseModel):
 
     @classmethod
     def from_orm_with_names(cls, lot) -> "LotOut":
-        data = cls.model_validate(lot)
+        # Column values are already typed by the ORM — skip re-validation
+        data = construct_from_orm(cls, lot)
         if hasattr(lot, "batch") and lot.batch:
             data.batch_code = lot.batch.batch_code
         if hasattr(lot, "grower") and lot.grower:
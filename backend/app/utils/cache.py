@@ -8,10 +8,13 @@ import functools
 import hashlib
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import date, datetime
-from typing import Any, Callable, Optional
+from typing import Any, Optional
 
 import redis.asyncio as redis
+from fastapi.responses import Response
+
 from app.config import settings
 from app.tenancy import _tenant_ctx
 
@@ -77,6 +80,7 @@ def cached(
     ttl: int = 300,
     prefix: str = "cache",
     key_builder: Optional[Callable] = None,
+    raw: bool = False,
 ):
     """Decorator to cache function results in Redis.
 
@@ -84,6 +88,9 @@ def cached(
         ttl: Time-to-live in seconds (default: 300 = 5 minutes)
         prefix: Cache key prefix for namespacing
         key_builder: Custom function to build cache key from args/kwargs
+        raw: The handler returns a JSON ``Response`` (e.g. ORJSONResponse);
+            cache its rendered body and serve hits as-is, without
+            re-parsing or re-serializing.
 
     Example:
         @cached(ttl=300, prefix="growers")
@@ -135,6 +142,8 @@ def cached(
                                     _cache_hits, _cache_misses,
                                     _cache_hits / total * 100)
                     logger.debug(f"Cache HIT: {key}")
+                    if raw:
+                        return Response(content=cached_value, media_type="application/json")
                     return json.loads(cached_value)
 
                 _cache_misses += 1
@@ -143,6 +152,10 @@ def cached(
                 # Execute function and cache result
                 result = await func(*args, **kwargs)
 
+                if raw:
+                    await redis_client.setex(key, ttl, result.body)
+                    return result
+
                 # Serialize result (handle Pydantic models)
                 if hasattr(result, "model_dump"):
                     # Single Pydantic model
@@ -181,12 +194,100 @@ def cached(
     return decorator
 
 
+async def cache_get_or_set(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int = 300,
+) -> Any:
+    """Return the JSON value cached under ``key``, calling ``loader`` on a miss.
+
+    Like ``cached`` but for ad-hoc values inside a function body.  The key
+    is scoped to the current tenant, and Redis failures fall back to
+    calling ``loader`` directly.
+
+    Example:
+        idmap = await cache_get_or_set("growers:idmap", load_idmap, ttl=60)
+    """
+    global _cache_hits, _cache_misses
+    tenant = _tenant_ctx.get()
+    scoped_key = f"t:{tenant}:{key}" if tenant else key
+
+    try:
+        redis_client = await get_redis()
+        cached_value = await redis_client.get(scoped_key)
+        if cached_value:
+            _cache_hits += 1
+            logger.debug(f"Cache HIT: {scoped_key}")
+            return json.loads(cached_value)
+
+        _cache_misses += 1
+        logger.debug(f"Cache MISS: {scoped_key}")
+        value = await loader()
+        await redis_client.setex(scoped_key, ttl, json.dumps(value))
+        return value
+    except redis.RedisError as e:
+        logger.warning(f"Redis error (falling back to uncached): {e}")
+        return await loader()
+
+
+# INCR only an existing counter; returns nil (None) when it is missing.
+# Checking and incrementing in one script means the key can't expire in
+# between and be recreated by INCR at 1 with no TTL.
+_INCR_EXISTING = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCR', KEYS[1])
+end
+return false
+"""
+
+# Seed a missing counter (SET NX EX) and increment it in one step.
+_SEED_AND_INCR = """
+redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2])
+return redis.call('INCR', KEYS[1])
+"""
+
+
+async def cache_incr(
+    key: str,
+    seed: Callable[[], Awaitable[int]],
+    ttl: int = 300,
+) -> int:
+    """Atomically increment the counter under ``key`` and return the new value.
+
+    A missing counter is seeded from ``seed()`` and incremented in a single
+    Lua script, so concurrent callers agree on one starting value and each
+    get a distinct number.  The key is scoped to the current tenant.
+
+    Redis failures fall back to ``seed() + 1``, which advances nothing:
+    concurrent fallbacks can return the same value, so callers must re-sync
+    (drop the key) and retry when the number turns out to be taken.
+
+    Example:
+        seq = await cache_incr("seq:CONT-20260219-", max_existing, ttl=172800)
+    """
+    tenant = _tenant_ctx.get()
+    scoped_key = f"t:{tenant}:{key}" if tenant else key
+
+    try:
+        redis_client = await get_redis()
+        value = await redis_client.eval(_INCR_EXISTING, 1, scoped_key)
+        if value is None:
+            value = await redis_client.eval(
+                _SEED_AND_INCR, 1, scoped_key, await seed(), ttl
+            )
+        return int(value)
+    except redis.RedisError as e:
+        logger.warning(f"Redis error (falling back to uncached): {e}")
+        return await seed() + 1
+
+
 async def invalidate_cache(pattern: str):
     """Invalidate cache keys matching a pattern, scoped to the current tenant.
 
     Automatically prepends the tenant prefix so callers don't need to know
     about the key structure.  If no tenant context is active, the pattern
-    is used as-is (for public-scope invalidation).
+    is used as-is (for public-scope invalidation).  A pattern without glob
+    characters names one key and is deleted directly, skipping the SCAN.
 
     Args:
         pattern: Redis key pattern (e.g., "growers:*")
@@ -199,6 +300,11 @@ async def invalidate_cache(pattern: str):
         scoped_pattern = f"t:{tenant}:{pattern}" if tenant else pattern
 
         redis_client = await get_redis()
+        if not any(c in pattern for c in "*?["):
+            if await redis_client.delete(scoped_pattern):
+                logger.info(f"Invalidated cache key {scoped_pattern}")
+            return
+
         keys = []
         async for key in redis_client.scan_iter(match=scoped_pattern):
             keys.append(key)
@@ -210,6 +316,50 @@ async def invalidate_cache(pattern: str):
         logger.warning(f"Failed to invalidate cache: {e}")
 
 
+# Session.info key for invalidations deferred until the session commits
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+
+def invalidate_cache_on_commit(session, pattern: str) -> None:
+    """Queue ``invalidate_cache(pattern)`` to run once ``session`` commits.
+
+    Invalidating before the commit leaves a window in which a concurrent
+    reader can re-cache the pre-commit rows.  get_tenant_db runs the queue
+    right after its commit and drops it on rollback.  The tenant is
+    captured now, so the invalidation is scoped the same way wherever the
+    queue is run.
+    """
+    pending = session.info.setdefault(_PENDING_INVALIDATIONS, set())
+    pending.add((_tenant_ctx.get(), pattern))
+
+
+async def run_pending_invalidations(session) -> None:
+    """Run (and clear) the invalidations queued on ``session``."""
+    for tenant, pattern in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        token = _tenant_ctx.set(tenant)
+        try:
+            await invalidate_cache(pattern)
+        finally:
+            _tenant_ctx.reset(token)
+
+
+def discard_pending_invalidations(session) -> None:
+    """Drop queued invalidations after a rollback — nothing was written."""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+# Cached (name_lower, ggn_lower, id) triples used to match imported growers.
+GROWER_IDMAP_CACHE_KEY = "growers:idmap"
+
+
+def invalidate_grower_idmap(session) -> None:
+    """Clear the grower identity map once ``session`` has committed.
+
+    Call from anything that creates, renames or deletes growers.
+    """
+    invalidate_cache_on_commit(session, GROWER_IDMAP_CACHE_KEY)
+
+
 async def clear_all_cache():
     """Clear ALL cache keys (use with caution)."""
     try:
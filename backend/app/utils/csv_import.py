@@ -1,12 +1,32 @@
 """Generic CSV parsing + validation for bulk import."""
 
+import asyncio
 import csv
 import io
+import re
 import uuid
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from datetime import date
+from typing import IO, Any
 
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
+
+from app.config import settings
+
+try:  # optional fast path — see Settings.arrow_csv
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow is not a hard dependency
+    pa = None
+    pc = None
+    pacsv = None
+
+# Rows handed to the caller per batch when streaming an upload
+ROW_BATCH_SIZE = 10_000
+
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 @dataclass
@@ -44,8 +64,23 @@ def coerce_float(val: str) -> float | None:
     return float(val)
 
 
+_TRUE_VALUES = ("true", "yes", "1", "y")
+
+
 def coerce_bool(val: str) -> bool:
-    return val.strip().lower() in ("true", "yes", "1", "y")
+    return val.strip().lower() in _TRUE_VALUES
+
+
+def coerce_date(val: str) -> date | None:
+    """Parse ISO date string: '2026-04-15' -> date(2026, 4, 15)"""
+    val = val.strip()
+    if not val:
+        return None
+    # Cheap shape check first; also stops fromisoformat (3.11+) accepting
+    # forms like '20260415' or '2026-W16-3'
+    if not _ISO_DATE_RE.match(val):
+        raise ValueError(f"expected YYYY-MM-DD, got {val!r}")
+    return date.fromisoformat(val)
 
 
 def coerce_json_list(val: str) -> list[str] | None:
@@ -55,86 +90,278 @@ def coerce_json_list(val: str) -> list[str] | None:
     return [item.strip() for item in val.split("|") if item.strip()]
 
 
-async def parse_csv(
-    file: UploadFile,
-    field_defs: list[FieldDef],
-    resolvers: dict[str, dict[str, str]] | None = None,
-) -> ParseResult:
-    """Parse uploaded CSV, validate, coerce types, resolve FK names."""
-    resolvers = resolvers or {}
-    content = await file.read()
-    text = content.decode("utf-8-sig")  # handle BOM from Excel
-    reader = csv.DictReader(io.StringIO(text))
+# Column-wise casts used by the Arrow path for the matching coerce_* helper
+_ARROW_CASTS = (
+    {coerce_int: pa.int64(), coerce_float: pa.float64(), coerce_date: pa.date32()}
+    if pa is not None else {}
+)
 
-    result = ParseResult()
 
-    for row_num, raw_row in enumerate(reader, start=2):  # row 1 = header
-        result.total_rows += 1
-        row_errors: list[str] = []
-        parsed: dict[str, Any] = {"id": str(uuid.uuid4())}
+# FieldDef flattened for the per-row loop: (position in the file's header
+# or None if the column is absent, column, db_field, required, coerce,
+# resolver map or None)
+_CompiledField = tuple[int | None, str, str, bool, Callable[[str], Any] | None, dict[str, str] | None]
 
-        for fd in field_defs:
-            raw_val = raw_row.get(fd.column, "").strip()
 
-            if fd.required and not raw_val:
-                row_errors.append(f"'{fd.column}' is required")
+def _compile_fields(
+    field_defs: list[FieldDef],
+    header: Sequence[str],
+    resolvers: dict[str, dict[str, str]],
+) -> tuple[_CompiledField, ...]:
+    """Resolve each FieldDef against the header once per upload."""
+    # Last occurrence wins for duplicate headers, as with csv.DictReader
+    position = {name: i for i, name in enumerate(header)}
+    return tuple(
+        (
+            position.get(fd.column),
+            fd.column,
+            fd.db_field,
+            fd.required,
+            fd.coerce,
+            resolvers.get(fd.resolver, {}) if fd.resolver else None,
+        )
+        for fd in field_defs
+    )
+
+
+def _parse_row(
+    values: Sequence[Any],
+    fields: tuple[_CompiledField, ...],
+) -> tuple[dict[str, Any], list[str]]:
+    """Validate and coerce one positional CSV row. Returns (parsed, errors)."""
+    row_errors: list[str] = []
+    parsed: dict[str, Any] = {"id": str(uuid.uuid4())}
+    width = len(values)
+
+    for idx, column, db_field, required, coerce, resolver_map in fields:
+        # Short rows leave trailing columns missing, like DictReader's restval
+        raw = values[idx] if idx is not None and idx < width else None
+        if raw is not None and not isinstance(raw, str):
+            # Already coerced column-wise by the Arrow path
+            if isinstance(raw, list):
+                raw = [item for item in raw if item] or None
+            if required and raw is None:
+                row_errors.append(f"'{column}' is required")
                 continue
+            parsed[db_field] = raw
+            continue
+
+        raw_val = (raw or "").strip()
 
-            if not raw_val:
-                parsed[fd.db_field] = None
+        if required and not raw_val:
+            row_errors.append(f"'{column}' is required")
+            continue
+
+        if not raw_val:
+            parsed[db_field] = None
+            continue
+
+        # Resolve FK by name
+        if resolver_map is not None:
+            resolved_id = resolver_map.get(raw_val)
+            if not resolved_id:
+                row_errors.append(f"'{column}': '{raw_val}' not found")
                 continue
+            parsed[db_field] = resolved_id
+            continue
 
-            # Resolve FK by name
-            if fd.resolver:
-                resolver_map = resolvers.get(fd.resolver, {})
-                resolved_id = resolver_map.get(raw_val)
-                if not resolved_id:
-                    row_errors.append(f"'{fd.column}': '{raw_val}' not found")
-                    continue
-                parsed[fd.db_field] = resolved_id
+        # Type coercion
+        if coerce:
+            try:
+                parsed[db_field] = coerce(raw_val)
+            except (ValueError, TypeError):
+                row_errors.append(f"'{column}': invalid value '{raw_val}'")
                 continue
+        else:
+            parsed[db_field] = raw_val
+
+    return parsed, row_errors
+
+
+def _iter_reader_rows(fileobj: IO[bytes]) -> Iterator[Sequence[str]]:
+    """Yield the header, then each data row, as lists via the stdlib csv module."""
+    # utf-8-sig handles BOM from Excel; newline="" lets csv handle quoted newlines
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        for row in csv.reader(text):
+            if row:  # blank lines are skipped, as DictReader does
+                yield row
+    finally:
+        # Don't let the wrapper close the upload's underlying file
+        text.detach()
+
+
+def _coerce_columns(record_batch: "pa.RecordBatch", field_defs: list[FieldDef]) -> "pa.RecordBatch":
+    """Vectorised coerce_* for a batch of string columns, run in C++.
+
+    Empty cells become nulls, as in _parse_row.  A cast that fails on any
+    cell leaves that column as strings so _parse_row coerces it row by row
+    and reports the offending rows exactly as the stdlib path does.
+    """
+    arrays = dict(zip(record_batch.schema.names, record_batch.columns))
+    done: set[str] = set()
+    for fd in field_defs:
+        if fd.coerce is None or fd.resolver or fd.column in done:
+            continue
+        done.add(fd.column)
+        column = arrays[fd.column]
+
+        if fd.coerce is coerce_json_list:
+            parts = pc.split_pattern(column, pattern="|")
+            trimmed = pc.utf8_trim_whitespace(parts.flatten())
+            arrays[fd.column] = pa.ListArray.from_arrays(parts.offsets, trimmed)
+            continue
 
-            # Type coercion
-            if fd.coerce:
-                try:
-                    parsed[fd.db_field] = fd.coerce(raw_val)
-                except (ValueError, TypeError):
-                    row_errors.append(f"'{fd.column}': invalid value '{raw_val}'")
-                    continue
-            else:
-                parsed[fd.db_field] = raw_val
+        trimmed = pc.utf8_trim_whitespace(column)
+        is_empty = pc.equal(trimmed, "")
+        if fd.coerce is coerce_bool:
+            truthy = pc.is_in(pc.utf8_lower(trimmed), value_set=pa.array(_TRUE_VALUES))
+            arrays[fd.column] = pc.if_else(is_empty, pa.scalar(None, pa.bool_()), truthy)
+        elif fd.coerce in _ARROW_CASTS:
+            values = pc.if_else(is_empty, pa.scalar(None, pa.string()), trimmed)
+            try:
+                arrays[fd.column] = pc.cast(values, _ARROW_CASTS[fd.coerce])
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                pass
+    return pa.RecordBatch.from_arrays(list(arrays.values()), names=list(arrays))
 
+
+def _iter_arrow_rows(
+    fileobj: IO[bytes],
+    field_defs: list[FieldDef],
+) -> Iterator[Sequence[Any]]:
+    """Yield the header, then data rows as tuples, via pyarrow's streaming reader.
+
+    Every known column is read as a string, then coerced a whole batch at
+    a time by _coerce_columns; anything it can't coerce is left to
+    _parse_row, so results and errors match the stdlib path.
+    """
+    columns = list(dict.fromkeys(fd.column for fd in field_defs))
+    try:
+        reader = pacsv.open_csv(
+            fileobj,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in columns},
+                include_columns=columns,
+                include_missing_columns=True,
+                strings_can_be_null=False,
+            ),
+        )
+        yield columns
+        for record_batch in reader:
+            record_batch = _coerce_columns(record_batch, field_defs)
+            yield from zip(*(column.to_pylist() for column in record_batch.columns))
+    except pa.ArrowInvalid as e:
+        raise HTTPException(status_code=400, detail=f"Malformed CSV: {e}") from e
+
+
+def _check_upload_size(fileobj: IO[bytes], size: int | None = None) -> None:
+    """Reject uploads larger than settings.bulk_import_max_bytes with a 413.
+
+    Uses the size Starlette recorded while spooling when available, else
+    seeks to the end of the file (no data is read).
+    """
+    if size is None:
+        size = fileobj.seek(0, io.SEEK_END)
+    if size > settings.bulk_import_max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"CSV file too large (max {settings.bulk_import_max_bytes // (1024 * 1024)} MB)",
+        )
+
+
+def iter_csv_batches(
+    fileobj: IO[bytes],
+    field_defs: list[FieldDef],
+    resolvers: dict[str, dict[str, str]] | None = None,
+    batch_size: int = ROW_BATCH_SIZE,
+) -> Iterator[ParseResult]:
+    """Parse a binary CSV file object, yielding a ParseResult per row batch.
+
+    Synchronous core shared by parse_csv_stream and parse_csv_file; reads
+    from the current position of ``fileobj``.
+    """
+    if settings.arrow_csv and pacsv is not None:
+        raw_rows = _iter_arrow_rows(fileobj, field_defs)
+    else:
+        raw_rows = _iter_reader_rows(fileobj)
+
+    header = next(raw_rows, None)
+    if header is None:
+        return
+    fields = _compile_fields(field_defs, header, resolvers or {})
+
+    batch = ParseResult()
+    for row_num, raw_row in enumerate(raw_rows, start=2):  # row 1 = header
+        batch.total_rows += 1
+        parsed, row_errors = _parse_row(raw_row, fields)
         if row_errors:
-            result.errors.append(RowError(row=row_num, errors=row_errors))
+            batch.errors.append(RowError(row=row_num, errors=row_errors))
         else:
-            result.rows.append(parsed)
+            batch.rows.append(parsed)
+
+        if batch.total_rows >= batch_size:
+            yield batch
+            batch = ParseResult()
 
+    if batch.total_rows:
+        yield batch
+
+
+def parse_csv_file(
+    fileobj: IO[bytes],
+    field_defs: list[FieldDef],
+    resolvers: dict[str, dict[str, str]] | None = None,
+) -> ParseResult:
+    """Parse a whole binary CSV file object in one go.
+
+    Blocking — intended to run in a worker thread via ``asyncio.to_thread``.
+    """
+    _check_upload_size(fileobj)
+    fileobj.seek(0)
+    result = ParseResult()
+    for batch in iter_csv_batches(fileobj, field_defs, resolvers):
+        result.total_rows += batch.total_rows
+        result.rows.extend(batch.rows)
+        result.errors.extend(batch.errors)
     return result
 
 
-def generate_template_csv(
+async def parse_csv_stream(
+    file: UploadFile,
     field_defs: list[FieldDef],
-    sample_row: dict[str, str] | None = None,
-) -> str:
-    """Generate CSV template string with headers and optional sample row."""
-    output = io.StringIO()
-    headers = [fd.column for fd in field_defs]
-    writer = csv.writer(output)
-    writer.writerow(headers)
-    if sample_row:
-        writer.writerow([sample_row.get(h, "") for h in headers])
-    return output.getvalue()
+    resolvers: dict[str, dict[str, str]] | None = None,
+    batch_size: int = ROW_BATCH_SIZE,
+) -> AsyncIterator[ParseResult]:
+    """Parse uploaded CSV incrementally, yielding a ParseResult per row batch.
 
+    The upload is decoded straight off its spooled temp file instead of
+    being read into memory first, so peak memory is bounded by
+    ``batch_size`` rows rather than the file size.  Each batch is parsed
+    in a worker thread so concurrent requests aren't blocked meanwhile.
+    """
+    _check_upload_size(file.file, file.size)
+    await file.seek(0)
+    batches = iter_csv_batches(file.file, field_defs, resolvers, batch_size)
+    while (batch := await asyncio.to_thread(next, batches, None)) is not None:
+        yield batch
 
-def generate_template_csv_multi(
+
+def iter_template_csv(
     field_defs: list[FieldDef],
-    sample_rows: list[dict[str, str]],
-) -> str:
-    """Generate CSV template with multiple sample rows."""
-    output = io.StringIO()
+    sample_rows: list[dict[str, str]] | None = None,
+) -> Iterator[bytes]:
+    """Yield a CSV template line by line: headers, then one line per sample row."""
     headers = [fd.column for fd in field_defs]
-    writer = csv.writer(output)
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+
     writer.writerow(headers)
-    for row in sample_rows:
+    yield buf.getvalue().encode("utf-8")
+    for row in sample_rows or []:
+        buf.seek(0)
+        buf.truncate()
         writer.writerow([row.get(h, "") for h in headers])
-    return output.getvalue()
+        yield buf.getvalue().encode("utf-8")
+
@@ -0,0 +1,24 @@
+"""Time-ordered primary keys for append-heavy tables.
+
+UUIDv7 (RFC 9562) puts a millisecond Unix timestamp in the leading 48
+bits, so ids issued later sort after earlier ones.  New rows then land
+at the right edge of the primary-key B-tree instead of on random pages.
+The canonical hex string keeps that ordering, so the existing String(36)
+id columns get the benefit without a type change.
+"""
+
+import os
+import time
+import uuid
+
+_VERSION_MASK = 0xF << 76
+_VARIANT_MASK = 0x3 << 62
+
+
+def uuid7() -> str:
+    """Return a new UUIDv7 as a 36-character string."""
+    ms = time.time_ns() // 1_000_000
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~_VERSION_MASK) | 0x7 << 76
+    value = (value & ~_VARIANT_MASK) | 0x2 << 62
+    return str(uuid.UUID(int=value))
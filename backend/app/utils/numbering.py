@@ -21,6 +21,7 @@ from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tenant.tenant_config import TenantConfig
+from app.utils.cache import cache_get_or_set, cache_incr, invalidate_cache
 
 DEFAULT_FORMATS = {
     "batch": "GRN-{date}-{seq:3}",
@@ -29,6 +30,19 @@ DEFAULT_FORMATS = {
     "container": "CONT-{date}-{seq:3}",
 }
 
+NUMBER_FORMATS_CACHE_KEY = "config:number_formats"
+
+# Entities whose next sequence number comes from a Redis counter rather
+# than a COUNT over the table.  The counter is atomic, so concurrent
+# creates can't share a number; a rolled-back create leaves a gap.  It is
+# seeded from the highest existing number (not a COUNT, which a gap would
+# put behind the table), and callers re-sync it with
+# resync_code_sequence() if a number still turns out to be taken.
+# Pallets and lots stay on COUNT because generate_codes() reserves
+# estimated counts that aren't always used.
+REDIS_SEQUENCED = frozenset({"container"})
+SEQUENCE_TTL = 48 * 3600
+
 # Map entity types to their table and code column for counting
 ENTITY_TABLE_MAP = {
     "batch": ("batches", "batch_code"),
@@ -39,13 +53,21 @@ ENTITY_TABLE_MAP = {
 
 
 async def _get_format(db: AsyncSession, entity: str) -> str:
-    """Get the format template for an entity type from tenant_config."""
-    result = await db.execute(
-        select(TenantConfig).where(TenantConfig.key == "number_formats")
-    )
-    config = result.scalar_one_or_none()
-    if config and config.value and entity in config.value:
-        return config.value[entity]
+    """Get the format template for an entity type from tenant_config.
+
+    The number_formats row is cached per tenant and cleared when the
+    tenant-settings PUT writes it, so code generation costs a single
+    COUNT query in the steady state.
+    """
+    async def load_formats() -> dict:
+        result = await db.execute(
+            select(TenantConfig.value).where(TenantConfig.key == "number_formats")
+        )
+        return result.scalar_one_or_none() or {}
+
+    formats = await cache_get_or_set(NUMBER_FORMATS_CACHE_KEY, load_formats, ttl=600)
+    if entity in formats:
+        return formats[entity]
     return DEFAULT_FORMATS[entity]
 
 
@@ -74,6 +96,19 @@ async def _count_existing(db: AsyncSession, entity: str, prefix: str) -> int:
     return result.scalar() or 0
 
 
+async def _max_existing(db: AsyncSession, entity: str, prefix: str) -> int:
+    """Highest sequence number among existing codes with the given prefix."""
+    table_name, column_name = ENTITY_TABLE_MAP[entity]
+    result = await db.execute(
+        text(
+            f"SELECT MAX(CAST(SUBSTRING({column_name} FROM :pattern) AS INTEGER)) "
+            f"FROM {table_name} WHERE {column_name} LIKE :prefix"
+        ),
+        {"pattern": f"^{re.escape(prefix)}([0-9]+)", "prefix": f"{prefix}%"},
+    )
+    return result.scalar() or 0
+
+
 async def generate_code(
     db: AsyncSession,
     entity: str,
@@ -95,9 +130,15 @@ async def generate_code(
     # Build the prefix (everything before {seq:N})
     prefix = _build_prefix(fmt, today_str, batch_code)
 
-    # Count existing codes with this prefix
-    count = await _count_existing(db, entity, prefix)
-    seq_num = count + 1
+    if entity in REDIS_SEQUENCED:
+        seq_num = await cache_incr(
+            f"seq:{prefix}",
+            lambda: _max_existing(db, entity, prefix),
+            ttl=SEQUENCE_TTL,
+        )
+    else:
+        # Count existing codes with this prefix
+        seq_num = await _count_existing(db, entity, prefix) + 1
 
     # Extract sequence digit width from format
     seq_match = re.search(r"\{seq:(\d+)\}", fmt)
@@ -112,6 +153,22 @@ async def generate_code(
     return code
 
 
+async def resync_code_sequence(
+    db: AsyncSession,
+    entity: str,
+    batch_code: str | None = None,
+) -> None:
+    """Drop today's Redis counter for ``entity`` after a duplicate code.
+
+    The next generate_code() re-seeds it from the highest number in the
+    table — e.g. once numbers issued by the Redis-down fallback have put
+    the counter behind.
+    """
+    fmt = await _get_format(db, entity)
+    prefix = _build_prefix(fmt, date.today().strftime("%Y%m%d"), batch_code)
+    await invalidate_cache(f"seq:{prefix}")
+
+
 async def generate_codes(
     db: AsyncSession,
     entity: str,
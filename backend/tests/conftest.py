@@ -146,7 +146,11 @@ async def tenant_client(
         yield db_session
 
     async def override_get_tenant_db():
+        from app.utils.cache import run_pending_invalidations
+
         yield tenant_db_session
+        # The test session is never committed; run what get_tenant_db would
+        await run_pending_invalidations(tenant_db_session)
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_tenant_db] = override_get_tenant_db
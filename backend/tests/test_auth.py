@@ -139,3 +139,23 @@ class TestJWTTokens:
 
         payload = decode_token("invalid.token.here")
         assert payload == {}
+
+
+@pytest.mark.unit
+class TestResolvePermissions:
+    """Test effective permission resolution."""
+
+    def test_overrides_apply_and_results_are_independent(self):
+        """Overrides add/remove known permissions; callers get their own list."""
+        from app.auth.permissions import resolve_permissions
+
+        overrides = {"grower.write": True, "storage.read": False, "bogus.perm": True}
+        first = resolve_permissions("operator", None, overrides)
+        first.append("mutated")
+        second = resolve_permissions("operator", None, overrides)
+
+        assert "grower.write" in second
+        assert "storage.read" not in second
+        assert "bogus.perm" not in second
+        assert "mutated" not in second
+        assert second == sorted(second)
@@ -303,6 +303,138 @@ class TestBatchWorkflow:
         assert lots_body["total"] == 2
         assert len(lots_body["items"]) == 2
 
+    async def test_create_lots_consumes_packaging_stock(
+        self,
+        tenant_client: AsyncClient,
+        auth_headers: dict,
+        tenant_db_session,
+        seed_grower,
+        seed_packhouse,
+        seed_harvest_team,
+    ):
+        """Lots sharing a box size deduct their packhouse's stock row and log a movement each."""
+        from sqlalchemy import select
+
+        from app.models.tenant.packaging_stock import PackagingMovement, PackagingStock
+        from app.models.tenant.product_config import BoxSize
+
+        box = BoxSize(name="Stock test 12.5kg", weight_kg=12.5)
+        tenant_db_session.add(box)
+        await tenant_db_session.flush()
+        # Admin-level stock for the same box size must be left alone
+        unscoped = PackagingStock(box_size_id=box.id, packhouse_id=None, current_quantity=100)
+        tenant_db_session.add(unscoped)
+        await tenant_db_session.flush()
+
+        _, lots = await _create_batch_with_lots(
+            tenant_client, auth_headers,
+            lots=[
+                {"grade": "A", "size": "Medium", "carton_count": 30, "box_size_id": box.id},
+                {"grade": "B", "size": "Large", "carton_count": 20, "box_size_id": box.id},
+            ],
+        )
+
+        stock = (await tenant_db_session.execute(
+            select(PackagingStock).where(
+                PackagingStock.box_size_id == box.id,
+                PackagingStock.packhouse_id == "packhouse-test-001",
+            )
+        )).scalar_one()
+        assert stock.current_quantity == -50
+        await tenant_db_session.refresh(unscoped)
+        assert unscoped.current_quantity == 100
+
+        movements = (await tenant_db_session.execute(
+            select(PackagingMovement.reference_id, PackagingMovement.quantity)
+            .where(PackagingMovement.stock_id == stock.id)
+        )).all()
+        assert sorted(movements) == sorted(
+            (lot["id"], -lot["carton_count"]) for lot in lots
+        )
+
+    async def test_update_lot_adjusts_same_stock_row(
+        self,
+        tenant_client: AsyncClient,
+        auth_headers: dict,
+        tenant_db_session,
+        seed_grower,
+        seed_packhouse,
+        seed_harvest_team,
+    ):
+        """Editing a lot's cartons reverses and re-consumes its packhouse's stock row."""
+        from sqlalchemy import select
+
+        from app.models.tenant.packaging_stock import PackagingStock
+        from app.models.tenant.product_config import BoxSize
+
+        box = BoxSize(name="Stock edit 10kg", weight_kg=10.0)
+        tenant_db_session.add(box)
+        await tenant_db_session.flush()
+        unscoped = PackagingStock(box_size_id=box.id, packhouse_id=None, current_quantity=100)
+        tenant_db_session.add(unscoped)
+        await tenant_db_session.flush()
+
+        _, lots = await _create_batch_with_lots(
+            tenant_client, auth_headers,
+            lots=[{"grade": "A", "size": "Medium", "carton_count": 30, "box_size_id": box.id}],
+        )
+
+        resp = await tenant_client.patch(
+            f"/api/lots/{lots[0]['id']}",
+            headers=auth_headers,
+            json={"carton_count": 40},
+        )
+        assert resp.status_code == 200
+
+        stock = (await tenant_db_session.execute(
+            select(PackagingStock).where(
+                PackagingStock.box_size_id == box.id,
+                PackagingStock.packhouse_id == "packhouse-test-001",
+            )
+        )).scalar_one()
+        await tenant_db_session.refresh(stock)
+        assert stock.current_quantity == -40
+        await tenant_db_session.refresh(unscoped)
+        assert unscoped.current_quantity == 100
+
+    async def test_list_lots_keyset_cursor(
+        self,
+        tenant_client: AsyncClient,
+        auth_headers: dict,
+        seed_grower,
+        seed_packhouse,
+        seed_harvest_team,
+    ):
+        """GET /api/lots/ walks every lot once by following next_cursor."""
+        _, lots = await _create_batch_with_lots(
+            tenant_client, auth_headers,
+            lots=[
+                {"grade": "A", "size": "Medium", "carton_count": 30},
+                {"grade": "B", "size": "Large", "carton_count": 20},
+                {"grade": "C", "size": "Small", "carton_count": 10},
+            ],
+        )
+        batch_id = lots[0]["batch_id"]
+
+        seen: list[str] = []
+        params = {"batch_id": batch_id, "limit": "2", "include_total": "false"}
+        while True:
+            resp = await tenant_client.get("/api/lots/", headers=auth_headers, params=params)
+            assert resp.status_code == 200
+            body = resp.json()
+            assert body["total"] is None
+            seen.extend(item["id"] for item in body["items"])
+            if not body["has_more"]:
+                break
+            params["cursor"] = body["next_cursor"]
+
+        assert sorted(seen) == sorted(lot["id"] for lot in lots)
+
+        bad = await tenant_client.get(
+            "/api/lots/", headers=auth_headers, params={"cursor": "not-a-cursor"},
+        )
+        assert bad.status_code == 400
+
     # ── Pallet creation ──────────────────────────────────────
 
     async def test_create_pallet_from_lots(
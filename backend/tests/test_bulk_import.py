@@ -0,0 +1,82 @@
+"""Tests for the bulk-import upsert helpers (app.routers.bulk_import).
+
+Pure classification tests — no database or Redis required.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.routers.bulk_import import (
+    _dedup_new_fields,
+    _diff_changes,
+    _group_grower_rows,
+    _merge_pending_insert,
+)
+
+
+@pytest.mark.unit
+class TestDiffChanges:
+    """Re-imports of unchanged rows must not queue UPDATEs."""
+
+    def test_unchanged_row_yields_no_changes(self):
+        record = SimpleNamespace(id="1", name="Team A", team_size=12)
+        row = {"id": "new-uuid", "name": "Team A", "team_size": 12}
+        assert _diff_changes(record, row, None) == {}
+
+    def test_empty_cells_never_overwrite(self):
+        record = SimpleNamespace(id="1", name="Team A", team_size=12)
+        row = {"id": "new-uuid", "name": "Team A", "team_size": None}
+        assert _diff_changes(record, row, None) == {}
+
+    def test_only_changed_columns_returned(self):
+        record = SimpleNamespace(id="1", name="Team A", team_size=12, notes="x")
+        row = {"id": "new-uuid", "name": "Team A", "team_size": 15, "notes": "x"}
+        assert _diff_changes(record, row, None) == {"team_size": 15}
+
+    def test_pending_update_takes_precedence(self):
+        """A value already queued earlier in the upload isn't re-queued."""
+        record = SimpleNamespace(id="1", name="Team A", team_size=12)
+        row = {"id": "new-uuid", "name": "Team A", "team_size": 15}
+        assert _diff_changes(record, row, {"id": "1", "team_size": 15}) == {}
+
+    def test_merge_pending_insert(self):
+        pending = {"id": "a", "name": "Team A", "team_size": None}
+        assert not _merge_pending_insert(pending, {"id": "b", "name": "Team A", "team_size": None})
+        assert _merge_pending_insert(pending, {"id": "c", "name": "Team A", "team_size": 4})
+        assert pending == {"id": "a", "name": "Team A", "team_size": 4}
+
+
+@pytest.mark.unit
+class TestGroupGrowerRows:
+    """Test grouping of grower CSV rows by (name, GGN)."""
+
+    def test_rows_grouped_case_insensitively_with_fields(self):
+        rows = [
+            {"name": "Example Farm", "field_name": "Block A", "field_hectares": 50.5},
+            {"name": "example farm", "field_code": "F002"},
+            {"name": "Example Farm", "globalg_ap_number": "GGN-1"},
+            {"name": None, "field_name": "Orphan"},
+        ]
+        grouped = _group_grower_rows(rows)
+
+        assert list(grouped) == [("example farm", ""), ("example farm", "ggn-1")]
+        first, fields = grouped[("example farm", "")]
+        assert first is rows[0]
+        assert fields == [
+            {"name": "Block A", "code": None, "hectares": 50.5, "fruit_type": None},
+            {"name": "F002", "code": "F002", "hectares": None, "fruit_type": None},
+        ]
+        assert grouped[("example farm", "ggn-1")][1] == []
+
+    def test_dedup_new_fields_by_code_then_name(self):
+        fields = [
+            {"name": "Block A", "code": None},
+            {"name": "Block A", "code": "F001"},  # name matches a codeless field
+            {"name": "Block B", "code": "F001"},
+            {"name": "Block C", "code": "F001"},  # code already seen
+        ]
+        assert _dedup_new_fields(fields) == [
+            {"name": "Block A", "code": None},
+            {"name": "Block B", "code": "F001"},
+        ]
@@ -3,7 +3,7 @@
 import pytest
 import redis.asyncio as redis
 
-from app.utils.cache import cached, get_redis, invalidate_cache, cache_key
+from app.utils.cache import cached, cache_incr, get_redis, invalidate_cache, cache_key
 
 
 @pytest.mark.cache
@@ -83,6 +83,48 @@ class TestCacheUtility:
         value = await redis_client.get("other:func:xyz789")
         assert value == "value3"
 
+    async def test_cache_invalidation_exact_key(self, redis_client):
+        """A pattern without wildcards deletes just that key."""
+        await redis_client.set("test_exact:idmap", "value1")
+        await redis_client.set("test_exact:idmap2", "value2")
+
+        await invalidate_cache("test_exact:idmap")
+
+        assert await redis_client.get("test_exact:idmap") is None
+        assert await redis_client.get("test_exact:idmap2") == "value2"
+
+    async def test_invalidation_deferred_until_commit(self, redis_client):
+        """Queued invalidations run only when flushed, under the queuing tenant."""
+        from types import SimpleNamespace
+
+        from app.tenancy import _tenant_ctx
+        from app.utils.cache import (
+            discard_pending_invalidations,
+            invalidate_cache_on_commit,
+            run_pending_invalidations,
+        )
+
+        await redis_client.set("t:tenant_a:test_commit:idmap", "value1")
+        session = SimpleNamespace(info={})
+
+        token = _tenant_ctx.set("tenant_a")
+        try:
+            invalidate_cache_on_commit(session, "test_commit:idmap")
+        finally:
+            _tenant_ctx.reset(token)
+        assert await redis_client.get("t:tenant_a:test_commit:idmap") == "value1"
+
+        await run_pending_invalidations(session)
+        assert await redis_client.get("t:tenant_a:test_commit:idmap") is None
+        assert session.info == {}
+
+        # A rolled-back session drops its queue without touching Redis
+        await redis_client.set("test_commit:kept", "value2")
+        invalidate_cache_on_commit(session, "test_commit:kept")
+        discard_pending_invalidations(session)
+        await run_pending_invalidations(session)
+        assert await redis_client.get("test_commit:kept") == "value2"
+
     async def test_cache_ttl(self, redis_client):
         """Test cache expiration (TTL)."""
         @cached(ttl=1, prefix="test_ttl")
@@ -127,6 +169,54 @@ class TestCacheUtility:
         assert result2["id"] == "123"
         assert result2["name"] == "Test"
 
+    async def test_cache_raw_response_body(self, redis_client):
+        """raw=True caches the rendered body and serves hits without re-encoding."""
+        from fastapi.responses import ORJSONResponse
+
+        call_count = 0
+
+        @cached(ttl=10, prefix="test_raw", raw=True)
+        async def get_rows():
+            nonlocal call_count
+            call_count += 1
+            return ORJSONResponse([{"id": "1", "name": "Bin"}])
+
+        result1 = await get_rows()
+        result2 = await get_rows()
+
+        assert call_count == 1
+        assert result2.media_type == "application/json"
+        assert result2.body == result1.body == b'[{"id":"1","name":"Bin"}]'
+
+    async def test_cache_incr_seeds_then_increments(self, redis_client):
+        """cache_incr seeds a missing counter once, then counts up from it."""
+        seed_calls = 0
+
+        async def seed():
+            nonlocal seed_calls
+            seed_calls += 1
+            return 7
+
+        await redis_client.delete("test_seq:CONT-")
+        first = await cache_incr("test_seq:CONT-", seed, ttl=10)
+        second = await cache_incr("test_seq:CONT-", seed, ttl=10)
+
+        assert (first, second) == (8, 9)
+        assert seed_calls == 1
+        assert 0 < await redis_client.ttl("test_seq:CONT-") <= 10
+
+    async def test_cache_incr_reseeds_expired_counter_with_ttl(self, redis_client):
+        """A counter that expired is re-seeded rather than restarted at 1."""
+        async def seed():
+            return 7
+
+        await redis_client.delete("test_seq:CONT-")
+        await cache_incr("test_seq:CONT-", seed, ttl=10)
+        await redis_client.delete("test_seq:CONT-")  # as if the TTL ran out
+
+        assert await cache_incr("test_seq:CONT-", seed, ttl=10) == 8
+        assert 0 < await redis_client.ttl("test_seq:CONT-") <= 10
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
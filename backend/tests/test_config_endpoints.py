@@ -53,6 +53,35 @@ class TestConfigEndpoints:
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
+    async def test_fruit_types_aggregation(self, tenant_db_session):
+        """Varieties, grades and sizes are unioned, deduplicated and sorted."""
+        import json
+
+        from app.models.tenant.product_config import ProductConfig
+        from app.routers.config import list_fruit_types
+
+        tenant_db_session.add_all([
+            ProductConfig(fruit_type="Apple", variety="Gala", grades=["2", "1"], sizes=["72"]),
+            ProductConfig(fruit_type="Apple", variety="Fuji", grades=["1"], sizes=None),
+            ProductConfig(fruit_type="Apple", variety="", grades=[], sizes=["64", "72"]),
+            ProductConfig(fruit_type="Pear", variety=None, grades=None, sizes=None),
+        ])
+        await tenant_db_session.flush()
+
+        # Call past the cache decorator so earlier tests can't mask the query.
+        resp = await list_fruit_types.__wrapped__(db=tenant_db_session, _user=None)
+
+        by_type = {ft["fruit_type"]: ft for ft in json.loads(resp.body)}
+        assert by_type["Apple"] == {
+            "fruit_type": "Apple",
+            "varieties": ["Fuji", "Gala"],
+            "grades": ["1", "2"],
+            "sizes": ["64", "72"],
+        }
+        assert by_type["Pear"] == {
+            "fruit_type": "Pear", "varieties": [], "grades": [], "sizes": [],
+        }
+
     async def test_list_box_sizes(
         self, tenant_client: AsyncClient, auth_headers: dict
     ):
@@ -109,6 +138,22 @@ class TestConfigEndpoints:
         assert isinstance(data, dict)
         assert data.get("test_key") == "test_value"
 
+    async def test_update_tenant_settings_invalidates_cached_get(
+        self, tenant_client: AsyncClient, auth_headers: dict
+    ):
+        """A cached GET /tenant-settings reflects a PUT immediately."""
+        await tenant_client.get("/api/config/tenant-settings", headers=auth_headers)
+        await tenant_client.put(
+            "/api/config/tenant-settings",
+            headers=auth_headers,
+            json={"settings": {"cache_key": "fresh"}},
+        )
+        resp = await tenant_client.get(
+            "/api/config/tenant-settings", headers=auth_headers
+        )
+        assert resp.status_code == 200
+        assert resp.json().get("cache_key") == "fresh"
+
     async def test_config_requires_auth(self, tenant_client: AsyncClient):
         """Config endpoints reject unauthenticated requests."""
         resp = await tenant_client.get("/api/config/bin-types")
@@ -133,6 +133,24 @@ class TestContainerLifecycle:
         ids = [c["id"] for c in body["items"]]
         assert created["id"] in ids
 
+    async def test_list_containers_total_across_pages(self, tenant_client, auth_headers):
+        """total is the same whether it comes from the window column or a COUNT."""
+        for _ in range(3):
+            await _create_container(tenant_client, auth_headers)
+
+        full = (await tenant_client.get("/api/containers/?limit=1", headers=auth_headers)).json()
+        total = full["total"]
+        assert total >= 3
+
+        last = (await tenant_client.get(
+            f"/api/containers/?limit=2&offset={total - 1}", headers=auth_headers,
+        )).json()
+        beyond = (await tenant_client.get(
+            f"/api/containers/?limit=2&offset={total + 5}", headers=auth_headers,
+        )).json()
+        assert len(last["items"]) == 1
+        assert last["total"] == beyond["total"] == total
+
     async def test_list_containers_filter_by_status(self, tenant_client, auth_headers):
         """GET /api/containers/?status=open filters by status."""
         await _create_container(tenant_client, auth_headers)
@@ -164,6 +182,33 @@ class TestContainerLifecycle:
         assert "traceability" in detail
         assert "pallets" in detail
 
+    async def test_container_detail_traceability_rows(
+        self, tenant_client, auth_headers,
+        seed_grower, seed_packhouse, seed_harvest_team,
+    ):
+        """Loaded pallets appear with their lots, batch and grower."""
+        pallet_id = await _create_pallet(
+            tenant_client, auth_headers,
+            seed_grower.id, seed_packhouse.id, seed_harvest_team.id,
+        )
+        resp = await tenant_client.post("/api/containers/from-pallets", headers=auth_headers, json={
+            "container_type": "Reefer 40ft",
+            "capacity_pallets": 20,
+            "pallet_ids": [pallet_id],
+        })
+        assert resp.status_code == 201, resp.text
+
+        detail = (await tenant_client.get(
+            f"/api/containers/{resp.json()['id']}", headers=auth_headers,
+        )).json()
+
+        assert [(p["id"], p["status"]) for p in detail["pallets"]] == [(pallet_id, "loaded")]
+        [trace] = detail["traceability"]
+        assert [(lot["grade"], lot["box_count"]) for lot in trace["lots"]] == [("A", 60)]
+        [batch] = trace["batches"]
+        assert batch["fruit_type"] == "apple"
+        assert batch["grower_name"] == seed_grower.name
+
     async def test_container_detail_not_found(self, tenant_client, auth_headers):
         """GET /api/containers/{id} returns 404 for a nonexistent ID."""
         resp = await tenant_client.get(
@@ -171,6 +216,20 @@ class TestContainerLifecycle:
         )
         assert resp.status_code == 404
 
+    async def test_container_qr_revalidates_with_etag(self, tenant_client, auth_headers):
+        """GET /api/containers/{id}/qr answers 304 when the client's ETag matches."""
+        created = await _create_container(tenant_client, auth_headers)
+        url = f"/api/containers/{created['id']}/qr"
+
+        resp = await tenant_client.get(url, headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/svg+xml"
+        etag = resp.headers["etag"]
+
+        again = await tenant_client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
     # ── Load pallets ──────────────────────────────────────────
 
     async def test_load_pallets_into_container(
@@ -514,3 +573,44 @@ class TestContainerLifecycle:
             json={"destination": "nowhere"},
         )
         assert resp.status_code == 401
+
+
+@pytest.mark.unit
+class TestConstructFromOrm:
+    """construct_from_orm copies column values without validation."""
+
+    def test_summary_matches_model_validate(self):
+        from datetime import date, datetime
+
+        from app.models.tenant.container import Container
+        from app.schemas.common import construct_from_orm
+        from app.schemas.container import ContainerSummary
+
+        container = Container(
+            id="c1", container_number="CN-0001", container_type="Reefer 40ft",
+            capacity_pallets=20, pallet_count=2, total_cartons=160,
+            gross_weight_kg=None, customer_name="Acme", destination=None,
+            status="open", eta=date(2026, 5, 1), created_at=datetime(2026, 4, 1, 8, 30),
+        )
+
+        built = construct_from_orm(ContainerSummary, container, transporter_name="Haulco")
+
+        expected = ContainerSummary.model_validate(container)
+        expected.transporter_name = "Haulco"
+        assert built.model_dump(mode="json") == expected.model_dump(mode="json")
+        assert built.lot_codes == [] and built.lot_codes is not expected.lot_codes
+
+
+@pytest.mark.unit
+class TestContainerQr:
+    """QR SVGs are rendered once per payload."""
+
+    def test_qr_svg_rendered_once_per_payload(self):
+        from app.routers.containers import _render_qr_svg
+
+        _render_qr_svg.cache_clear()
+        first = _render_qr_svg(b'{"type":"container","number":"CN-0001"}')
+        again = _render_qr_svg(b'{"type":"container","number":"CN-0001"}')
+
+        assert first.startswith(b"<?xml") and again is first
+        assert _render_qr_svg.cache_info().hits == 1
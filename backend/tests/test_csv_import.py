@@ -0,0 +1,176 @@
+"""Tests for the bulk-import CSV parser (app.utils.csv_import).
+
+Pure parsing tests — no database or Redis required.
+"""
+
+import tempfile
+from contextlib import ExitStack
+from datetime import date
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.utils.csv_import import (
+    FieldDef,
+    coerce_bool,
+    coerce_date,
+    coerce_float,
+    coerce_int,
+    coerce_json_list,
+    iter_template_csv,
+    parse_csv_file,
+    parse_csv_stream,
+)
+
+FIELDS = [
+    FieldDef(column="name", db_field="name", required=True),
+    FieldDef(column="qty", db_field="qty", coerce=coerce_int),
+    FieldDef(column="etd", db_field="etd", coerce=coerce_date),
+]
+
+
+@pytest.fixture
+def make_upload():
+    """Wrap CSV text in an UploadFile backed by a spooled temp file.
+
+    The temp files are closed when the test finishes.
+    """
+    with ExitStack() as stack:
+        def make(text: str) -> UploadFile:
+            spooled = stack.enter_context(tempfile.SpooledTemporaryFile())
+            spooled.write(text.encode("utf-8-sig"))
+            spooled.seek(0)
+            return UploadFile(file=spooled, filename="upload.csv")
+
+        yield make
+
+
+@pytest.mark.unit
+class TestCoercion:
+    """Test FieldDef coercion helpers."""
+
+    def test_coerce_date(self):
+        assert coerce_date("2026-04-15") == date(2026, 4, 15)
+        assert coerce_date("  ") is None
+        for bad in ("15/04/2026", "20260415", "2026-02-30"):
+            with pytest.raises(ValueError):
+                coerce_date(bad)
+
+    def test_coerce_json_list(self):
+        assert coerce_json_list("citrus| grapes |") == ["citrus", "grapes"]
+        assert coerce_json_list("") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestParseCsv:
+    """Test CSV parsing, validation and batching."""
+
+    async def test_parse_valid_and_invalid_rows(self, make_upload):
+        """Valid rows are coerced; invalid rows report their CSV line number."""
+        upload = make_upload(
+            "name,qty,etd\n"
+            "Farm A,3,2026-04-15\n"
+            ",4,\n"
+            "Farm B,x,2026-13-01\n"
+        )
+        result = parse_csv_file(upload.file, FIELDS)
+
+        assert result.total_rows == 3
+        assert len(result.rows) == 1
+        assert result.rows[0]["name"] == "Farm A"
+        assert result.rows[0]["qty"] == 3
+        assert result.rows[0]["etd"] == date(2026, 4, 15)
+        assert [e.row for e in result.errors] == [3, 4]
+        assert result.errors[0].errors == ["'name' is required"]
+        assert len(result.errors[1].errors) == 2
+
+    async def test_stream_yields_batches(self, make_upload):
+        """parse_csv_stream splits rows into batch_size chunks."""
+        upload = make_upload("name,qty,etd\n" + "".join(f"G{i},{i},\n" for i in range(5)))
+        batches = [b async for b in parse_csv_stream(upload, FIELDS, batch_size=2)]
+
+        assert [b.total_rows for b in batches] == [2, 2, 1]
+        assert [r["name"] for b in batches for r in b.rows] == [f"G{i}" for i in range(5)]
+
+    async def test_quoted_newlines_and_missing_columns(self, make_upload):
+        """Quoted multi-line cells survive; missing trailing cells are empty."""
+        upload = make_upload('name,qty\n"Block\nA",1\nFarm B\n')
+        result = parse_csv_file(upload.file, FIELDS)
+
+        assert [r["name"] for r in result.rows] == ["Block\nA", "Farm B"]
+        assert result.rows[1]["qty"] is None
+        assert result.rows[1]["etd"] is None
+
+    async def test_arrow_path_matches_stdlib(self, monkeypatch, make_upload):
+        """ARROW_CSV=1 yields the same rows and errors as the csv module."""
+        pytest.importorskip("pyarrow")
+        from app.config import settings
+
+        fields = FIELDS + [FieldDef(column="tags", db_field="tags", coerce=coerce_json_list)]
+        text = 'name,qty,etd,tags\n"Block\nA",1,, a | b |\nFarm B,x,,\n,2,,c\n'
+
+        monkeypatch.setattr(settings, "arrow_csv", False)
+        expected = parse_csv_file(make_upload(text).file, fields)
+        monkeypatch.setattr(settings, "arrow_csv", True)
+        actual = parse_csv_file(make_upload(text).file, fields)
+
+        def strip_ids(rows):
+            return [{k: v for k, v in r.items() if k != "id"} for r in rows]
+
+        assert strip_ids(actual.rows) == strip_ids(expected.rows)
+        assert actual.rows[0]["tags"] == ["a", "b"]
+        assert actual.errors == expected.errors
+        assert actual.total_rows == expected.total_rows == 3
+
+    async def test_arrow_vectorised_coercion_matches_stdlib(self, monkeypatch, make_upload):
+        """Column-wise casts agree with coerce_*; a bad cell falls back per row."""
+        pytest.importorskip("pyarrow")
+        from app.config import settings
+
+        fields = FIELDS + [
+            FieldDef(column="ha", db_field="ha", coerce=coerce_float),
+            FieldDef(column="ggap", db_field="ggap", coerce=coerce_bool),
+        ]
+        text = (
+            "name,qty,etd,ha,ggap\n"
+            "Farm A, 3 ,2026-04-15, 1e3 ,Yes\n"
+            "Farm B,,,,no\n"
+            "Farm C,4,2026-02-30,0.5,\n"
+        )
+
+        monkeypatch.setattr(settings, "arrow_csv", False)
+        expected = parse_csv_file(make_upload(text).file, fields)
+        monkeypatch.setattr(settings, "arrow_csv", True)
+        actual = parse_csv_file(make_upload(text).file, fields)
+
+        def strip_ids(rows):
+            return [{k: v for k, v in r.items() if k != "id"} for r in rows]
+
+        assert strip_ids(actual.rows) == strip_ids(expected.rows)
+        assert actual.rows[0] | {"id": None} == {
+            "id": None, "name": "Farm A", "qty": 3, "etd": date(2026, 4, 15),
+            "ha": 1000.0, "ggap": True,
+        }
+        assert actual.rows[1]["ggap"] is False
+        assert actual.errors == expected.errors
+        assert [e.row for e in actual.errors] == [4]
+
+    async def test_oversized_upload_rejected(self, monkeypatch, make_upload):
+        """Uploads over bulk_import_max_bytes fail with 413 before parsing."""
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "bulk_import_max_bytes", 16)
+        with pytest.raises(HTTPException) as exc_info:
+            parse_csv_file(make_upload("name,qty,etd\n" + "Farm A,1,\n" * 5).file, FIELDS)
+        assert exc_info.value.status_code == 413
+
+
+@pytest.mark.unit
+class TestTemplate:
+    """Test CSV template generation."""
+
+    def test_iter_template_csv_yields_one_line_per_row(self):
+        lines = list(iter_template_csv(FIELDS, [{"name": "Farm, Ltd", "qty": "2"}]))
+
+        assert lines == [b"name,qty,etd\r\n", b'"Farm, Ltd",2,\r\n']
@@ -10,3 +10,4 @@ async def test_health():
         resp = await client.get("/health")
     assert resp.status_code == 200
     assert resp.json()["status"] == "ok"
+    assert set(resp.json()) == {"status", "service", "timestamp", "environment"}
@@ -0,0 +1,32 @@
+"""Tests for time-ordered id generation (app.utils.ids)."""
+
+import time
+import uuid
+
+import pytest
+
+from app.utils.ids import uuid7
+
+
+@pytest.mark.unit
+class TestUuid7:
+    """uuid7 returns RFC 9562 version-7 UUID strings that sort by time."""
+
+    def test_format_version_and_variant(self):
+        value = uuid7()
+        parsed = uuid.UUID(value)
+        assert len(value) == 36 and str(parsed) == value
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_embeds_current_millisecond_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        ms = uuid.UUID(uuid7()).int >> 80
+        after = time.time_ns() // 1_000_000
+        assert before <= ms <= after
+
+    def test_later_ids_sort_after_earlier_ones(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
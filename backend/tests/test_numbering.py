@@ -10,7 +10,8 @@ from datetime import date
 
 import pytest
 
-from app.utils.numbering import generate_code, generate_codes
+from app.models.tenant.container import Container
+from app.utils.numbering import generate_code, generate_codes, resync_code_sequence
 
 
 @pytest.mark.unit
@@ -47,6 +48,18 @@ class TestNumbering:
         assert code.startswith("CONT-")
         assert re.match(r"^CONT-\d{8}-\d{3}$", code), f"Unexpected container code format: {code}"
 
+    async def test_container_sequence_continues_past_highest_number(self, tenant_db_session):
+        """A gap in container numbers must not make the counter reuse one."""
+        today_str = date.today().strftime("%Y%m%d")
+        tenant_db_session.add(
+            Container(container_number=f"CONT-{today_str}-007", container_type="reefer_40ft")
+        )
+        await tenant_db_session.flush()
+
+        await resync_code_sequence(tenant_db_session, "container")
+        code = await generate_code(tenant_db_session, "container")
+        assert code == f"CONT-{today_str}-008"
+
     async def test_generate_codes_batch(self, tenant_db_session):
         """generate_codes should return exactly N sequential codes."""
         codes = await generate_codes(tenant_db_session, "batch", 3)
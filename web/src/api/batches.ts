@@ -1,5 +1,5 @@
 import api from "./client";
-import { fetchAllPages } from "./fetchAll";
+import { fetchAllCursorPages, fetchAllPages } from "./fetchAll";
 
 interface PaginatedResponse<T> {
   items: T[];
@@ -277,8 +277,7 @@ export async function updateLot(
 export async function listLots(
   params?: Record<string, string>
 ): Promise<LotSummary[]> {
-  const { items } = await fetchAllPages<LotSummary>("/lots/", params);
-  return items;
+  return fetchAllCursorPages<LotSummary>("/lots/", params);
 }
 
 export async function closeProductionRun(batchId: string): Promise<BatchDetail> {
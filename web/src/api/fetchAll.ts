@@ -42,3 +42,36 @@ export async function fetchAllPages<T>(
 
   return { items: all, total };
 }
+
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
+  has_more: boolean;
+}
+
+/**
+ * Fetch all pages of a keyset-paginated endpoint by following next_cursor.
+ * Skips the server-side total count; each page is an index seek.
+ */
+export async function fetchAllCursorPages<T>(
+  url: string,
+  params?: Record<string, string>,
+  pageSize = 200
+): Promise<T[]> {
+  let all: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const { data }: { data: CursorPage<T> } = await api.get<CursorPage<T>>(url, {
+      params: {
+        ...params,
+        limit: String(pageSize),
+        include_total: "false",
+        ...(cursor ? { cursor } : {}),
+      },
+    });
+    all = all.concat(data.items);
+    cursor = data.has_more ? data.next_cursor : null;
+  } while (cursor);
+
+  return all;
+}
@@ -1,11 +1,5 @@
 import api from "./client";
-
-interface PaginatedResponse<T> {
-  items: T[];
-  total: number;
-  limit: number;
-  offset: number;
-}
+import type { CursorPage } from "./fetchAll";
 
 // ── Types ───────────────────────────────────────────────────
 
@@ -52,7 +46,7 @@ export interface MovementFilters {
   stock_id?: string;
   movement_type?: string;
   limit?: number;
-  offset?: number;
+  cursor?: string;
 }
 
 // ── API calls ───────────────────────────────────────────────
@@ -108,12 +102,13 @@ export async function writeOffStock(
   return data;
 }
 
+/** One page of movements, newest first. Skips the server-side total count. */
 export async function listMovements(
   params?: MovementFilters
 ): Promise<PackagingMovement[]> {
-  const { data } = await api.get<PaginatedResponse<PackagingMovement>>(
+  const { data } = await api.get<CursorPage<PackagingMovement>>(
     "/packaging/movements",
-    { params }
+    { params: { ...params, include_total: false } }
   );
   return data.items;
 }